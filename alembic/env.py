@@ -0,0 +1,60 @@
+"""
+Alembic 마이그레이션 환경
+DATABASE_URL(동기 드라이버)로 접속하고, 모델 메타데이터를 autogenerate 기준으로 사용
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import create_engine, pool
+from sqlalchemy.dialects.postgresql.base import ischema_names
+
+from app.core.config import settings
+from app.core.database import Base
+import app.models  # noqa: F401  (모든 모델을 메타데이터에 등록)
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+# autogenerate가 DB의 vector 컬럼 타입을 인식하도록 등록
+ischema_names["vector"] = Vector
+
+
+def run_migrations_offline() -> None:
+    """SQL 스크립트만 출력 (alembic upgrade head --sql)"""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """DB에 접속해 마이그레이션 실행"""
+    connectable = create_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite는 ALTER TABLE 지원이 제한적이므로 테이블 재생성 방식 사용
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,75 @@
+"""initial schema: users, books (init_db()/create_all baseline)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+이전 init_db()(Base.metadata.create_all)가 만들던 스키마와 정확히 같다.
+init_db()로 만든 기존 DB는 테이블을 다시 만들지 않도록 리비전만 기록한 뒤 올린다:
+    alembic stamp 0001
+    alembic upgrade head
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("is_verified", sa.Boolean(), nullable=True),
+        sa.Column("agree_terms", sa.Boolean(), nullable=False),
+        sa.Column("agree_privacy", sa.Boolean(), nullable=False),
+        sa.Column("agree_marketing", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("last_login_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "books",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("title", sa.String(length=500), nullable=False),
+        sa.Column("author", sa.String(length=200), nullable=False),
+        sa.Column("publisher", sa.String(length=200), nullable=True),
+        sa.Column("isbn", sa.String(length=20), nullable=True),
+        sa.Column("cover_image", sa.String(length=500), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("price", sa.Integer(), nullable=True),
+        sa.Column("rating", sa.Float(), nullable=True),
+        sa.Column("review_count", sa.Integer(), nullable=True),
+        sa.Column("theme", sa.String(length=50), nullable=True),
+        sa.Column("category", sa.String(length=100), nullable=True),
+        sa.Column("keywords", sa.Text(), nullable=True),
+        sa.Column("is_popular", sa.Boolean(), nullable=True),
+        sa.Column("is_curator_pick", sa.Boolean(), nullable=True),
+        sa.Column("published_date", sa.Date(), nullable=True),
+        sa.Column("page_count", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_books_title", "books", ["title"])
+    op.create_index("ix_books_author", "books", ["author"])
+    op.create_index("ix_books_isbn", "books", ["isbn"], unique=True)
+    op.create_index("ix_books_theme", "books", ["theme"])
+    op.create_index("ix_books_is_popular", "books", ["is_popular"])
+    op.create_index("ix_books_is_curator_pick", "books", ["is_curator_pick"])
+
+
+def downgrade() -> None:
+    op.drop_table("books")
+    op.drop_table("users")
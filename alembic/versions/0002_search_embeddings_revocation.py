@@ -0,0 +1,152 @@
+"""books pagination indexes, search_vector, embedding (HNSW), revoked_tokens
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+"""
+
+import re
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+THEMES = ("work", "healing", "growth")
+
+# 임베딩 차원 (이 리비전 시점의 EMBEDDING_DIM)
+# 설정값이 바뀌어도 이 리비전의 결과는 같아야 하므로 고정한다. 차원 변경은 새 마이그레이션 + 임베딩 재계산으로
+EMBEDDING_DIM = 256
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    if is_postgres:
+        op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    # 목록 keyset 페이지네이션용 (정렬 컬럼, id) 복합 인덱스
+    op.create_index("ix_books_created_at_id", "books", ["created_at", "id"])
+    op.create_index("ix_books_rating_id", "books", ["rating", "id"])
+    op.create_index("ix_books_theme_created_at_id", "books", ["theme", "created_at", "id"])
+    op.create_index("ix_books_theme_rating_id", "books", ["theme", "rating", "id"])
+
+    op.add_column("books", sa.Column("search_vector", TSVECTOR().with_variant(sa.Text(), "sqlite"), nullable=True))
+    op.add_column("books", sa.Column("embedding", Vector(EMBEDDING_DIM), nullable=True))
+    _backfill_search_vector(op.get_bind())
+
+    if is_postgres:
+        op.create_index("ix_books_search_vector", "books", ["search_vector"], postgresql_using="gin")
+        op.create_index(
+            "ix_books_embedding_hnsw",
+            "books",
+            ["embedding"],
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        )
+        for theme in THEMES:
+            op.create_index(
+                f"ix_books_embedding_hnsw_{theme}",
+                "books",
+                ["embedding"],
+                postgresql_using="hnsw",
+                postgresql_with={"m": 16, "ef_construction": 64},
+                postgresql_ops={"embedding": "vector_cosine_ops"},
+                postgresql_where=sa.text(f"theme = '{theme}'"),
+            )
+
+    op.create_table(
+        "revoked_tokens",
+        sa.Column("seq", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), autoincrement=True, nullable=False),
+        sa.Column("jti", sa.String(length=64), nullable=False),
+        sa.Column("kind", sa.String(length=10), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("seq"),
+    )
+    op.create_index("ix_revoked_tokens_jti", "revoked_tokens", ["jti"], unique=True)
+    op.create_index("ix_revoked_tokens_expires_at", "revoked_tokens", ["expires_at"])
+
+
+# ========== 기존 도서 search_vector 백필 ==========
+# 이 리비전 시점의 규칙을 고정한 사본 (app 코드가 바뀌어도 마이그레이션 결과는 같아야 함)
+# app.utils.text.to_search_document, app.models.book.build_search_vector와 같은 규칙
+
+_TOKEN_RUN = re.compile(r"[가-힣ㄱ-ㆎ一-鿿぀-ヿ]+|[0-9a-z]+")
+_CJK_RUN = re.compile(r"[가-힣ㄱ-ㆎ一-鿿぀-ヿ]+")
+_SEARCH_FIELDS = (("title", "A"), ("author", "B"), ("keywords", "C"), ("description", "D"))
+_BATCH_SIZE = 5000
+
+_books = sa.table(
+    "books",
+    sa.column("id", sa.String),
+    *(sa.column(field, sa.Text) for field, _ in _SEARCH_FIELDS),
+)
+
+
+def _search_document(text):
+    """한국어는 문자 bigram, 영문·숫자는 소문자 단어"""
+    if not text:
+        return ""
+    tokens = []
+    for run in _TOKEN_RUN.findall(text.lower()):
+        if _CJK_RUN.fullmatch(run) and len(run) > 2:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return " ".join(tokens)
+
+
+def _backfill_search_vector(conn) -> None:
+    is_postgres = conn.dialect.name == "postgresql"
+    if is_postgres:
+        vector = " || ".join(
+            f"setweight(to_tsvector('simple', :{field}), '{weight}')" for field, weight in _SEARCH_FIELDS
+        )
+        update = sa.text(f"UPDATE books SET search_vector = {vector} WHERE id = :id")
+    else:
+        update = sa.text("UPDATE books SET search_vector = :document WHERE id = :id")
+
+    last_id = None
+    while True:
+        stmt = sa.select(_books).order_by(_books.c.id).limit(_BATCH_SIZE)
+        if last_id is not None:
+            stmt = stmt.where(_books.c.id > last_id)
+        rows = conn.execute(stmt).all()
+        if not rows:
+            break
+
+        params = []
+        for row in rows:
+            documents = {field: _search_document(getattr(row, field)) for field, _ in _SEARCH_FIELDS}
+            if not is_postgres:
+                documents = {"document": " ".join(filter(None, documents.values()))}
+            params.append({"id": row.id, **documents})
+        conn.execute(update, params)
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_table("revoked_tokens")
+
+    if op.get_bind().dialect.name == "postgresql":
+        for theme in THEMES:
+            op.drop_index(f"ix_books_embedding_hnsw_{theme}", table_name="books")
+        op.drop_index("ix_books_embedding_hnsw", table_name="books")
+        op.drop_index("ix_books_search_vector", table_name="books")
+
+    with op.batch_alter_table("books") as batch_op:
+        batch_op.drop_column("embedding")
+        batch_op.drop_column("search_vector")
+
+    op.drop_index("ix_books_theme_rating_id", table_name="books")
+    op.drop_index("ix_books_theme_created_at_id", table_name="books")
+    op.drop_index("ix_books_rating_id", table_name="books")
+    op.drop_index("ix_books_created_at_id", table_name="books")
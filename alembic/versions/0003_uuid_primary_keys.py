@@ -0,0 +1,54 @@
+"""native UUID columns for users.id, books.id, revoked_tokens.user_id
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# (테이블, 컬럼, NULL 허용)
+UUID_COLUMNS = (
+    ("users", "id", False),
+    ("books", "id", False),
+    ("revoked_tokens", "user_id", True),
+)
+
+
+def upgrade() -> None:
+    # 기존 행의 ID(UUIDv4 문자열)는 값 그대로 변환한다.
+    # 발급된 토큰의 sub 등 외부에 노출된 ID가 유지되며, 새 행부터 UUIDv7이 부여된다.
+    if op.get_bind().dialect.name == "postgresql":
+        # 테이블을 다시 쓰면서 PK·(정렬 컬럼, id) 복합 인덱스도 함께 재생성된다
+        for table, column, _ in UUID_COLUMNS:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid USING {column}::uuid")
+        return
+
+    # 네이티브 UUID가 없는 DB(SQLite)는 CHAR(32) 16진수 문자열로 저장
+    for table, column, nullable in UUID_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = replace({column}, '-', '') WHERE {column} IS NOT NULL")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.String(), type_=sa.Uuid(), existing_nullable=nullable)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column, _ in UUID_COLUMNS:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar USING {column}::text")
+        return
+
+    for table, column, nullable in UUID_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.Uuid(), type_=sa.String(), existing_nullable=nullable)
+        op.execute(
+            f"UPDATE {table} SET {column} = lower(substr({column}, 1, 8) || '-' || substr({column}, 9, 4) || '-' || "
+            f"substr({column}, 13, 4) || '-' || substr({column}, 17, 4) || '-' || substr({column}, 21)) "
+            f"WHERE {column} IS NOT NULL"
+        )
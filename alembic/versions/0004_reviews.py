@@ -0,0 +1,53 @@
+"""reviews and book_rating_shards
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reviews",
+        sa.Column("id", sa.Uuid(as_uuid=False), nullable=False),
+        sa.Column("book_id", sa.Uuid(as_uuid=False), nullable=False),
+        sa.Column("user_id", sa.Uuid(as_uuid=False), nullable=False),
+        sa.Column("rating", sa.SmallInteger(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.CheckConstraint("rating BETWEEN 1 AND 5", name="ck_reviews_rating"),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("book_id", "user_id", name="uq_reviews_book_id_user_id"),
+    )
+    op.create_index("ix_reviews_user_id", "reviews", ["user_id"])
+    op.create_index("ix_reviews_book_id_created_at_id", "reviews", ["book_id", "created_at", "id"])
+
+    # 평점 증분이 분산되는 샤드 (도서당 최대 REVIEW_RATING_SHARDS행)
+    op.create_table(
+        "book_rating_shards",
+        sa.Column("book_id", sa.Uuid(as_uuid=False), nullable=False),
+        sa.Column("shard", sa.SmallInteger(), nullable=False),
+        sa.Column("rating_sum", sa.BigInteger(), nullable=False),
+        sa.Column("rating_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("book_id", "shard"),
+    )
+    op.create_index("ix_book_rating_shards_updated_at", "book_rating_shards", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("book_rating_shards")
+    op.drop_table("reviews")
@@ -0,0 +1,136 @@
+"""book_keywords tag table, book_facet_counts, books.category index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections import Counter
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "book_keywords",
+        sa.Column("keyword", sa.String(length=100), nullable=False),
+        sa.Column("book_id", sa.Uuid(as_uuid=False), nullable=False),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("keyword", "book_id"),
+    )
+    op.create_index("ix_book_keywords_book_id", "book_keywords", ["book_id"])
+
+    op.create_table(
+        "book_facet_counts",
+        sa.Column("scope", sa.String(length=50), nullable=False),
+        sa.Column("facet", sa.String(length=20), nullable=False),
+        sa.Column("value", sa.String(length=200), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "facet", "value"),
+    )
+    op.create_index(
+        "ix_book_facet_counts_scope_facet_count", "book_facet_counts", ["scope", "facet", "count"]
+    )
+
+    op.create_index("ix_books_category", "books", ["category"])
+
+    _backfill(op.get_bind())
+
+
+# ========== 기존 도서 백필 ==========
+# 이 리비전 시점의 규칙을 고정한 사본 (app 코드가 바뀌어도 마이그레이션 결과는 같아야 함)
+# app.utils.text.split_keywords, app.models.book_facet.price_bucket/book_facets와 같은 규칙
+
+_PRICE_BUCKET_BOUNDS = (0, 10000, 15000, 20000, 30000)
+_BATCH_SIZE = 5000
+
+_books = sa.table(
+    "books",
+    sa.column("id", sa.Uuid(as_uuid=False)),
+    sa.column("theme", sa.String),
+    sa.column("category", sa.String),
+    sa.column("keywords", sa.String),
+    sa.column("price", sa.Integer),
+)
+_book_keywords = sa.table(
+    "book_keywords",
+    sa.column("keyword", sa.String),
+    sa.column("book_id", sa.Uuid(as_uuid=False)),
+)
+_book_facet_counts = sa.table(
+    "book_facet_counts",
+    sa.column("scope", sa.String),
+    sa.column("facet", sa.String),
+    sa.column("value", sa.String),
+    sa.column("count", sa.Integer),
+)
+
+
+def _split_keywords(text):
+    keywords = []
+    for part in (text or "").split(","):
+        keyword = " ".join(part.split()).lower()[:100]
+        if keyword and keyword not in keywords:
+            keywords.append(keyword)
+    return keywords
+
+
+def _price_bucket(price):
+    if price is None:
+        return None
+    for lower, upper in zip(_PRICE_BUCKET_BOUNDS, _PRICE_BUCKET_BOUNDS[1:]):
+        if price < upper:
+            return f"{lower}-{upper}"
+    return f"{_PRICE_BUCKET_BOUNDS[-1]}+"
+
+
+def _backfill(conn) -> None:
+    """도서를 id 순 배치로 읽어 태그 행을 넣고 패싯 수를 한 번에 저장"""
+    counts = Counter()
+    last_id = None
+    while True:
+        stmt = sa.select(_books).order_by(_books.c.id).limit(_BATCH_SIZE)
+        if last_id is not None:
+            stmt = stmt.where(_books.c.id > last_id)
+        rows = conn.execute(stmt).all()
+        if not rows:
+            break
+
+        keyword_rows = []
+        for book in rows:
+            keywords = _split_keywords(book.keywords)
+            keyword_rows.extend({"keyword": keyword, "book_id": book.id} for keyword in keywords)
+
+            values = [("theme", book.theme), ("category", book.category), ("price", _price_bucket(book.price))]
+            values.extend(("keyword", keyword) for keyword in keywords)
+            scopes = ("", book.theme) if book.theme else ("",)
+            for scope in scopes:
+                for facet, value in values:
+                    if value:
+                        counts[(scope, facet, value)] += 1
+
+        if keyword_rows:
+            conn.execute(_book_keywords.insert(), keyword_rows)
+        last_id = rows[-1].id
+
+    if counts:
+        conn.execute(
+            _book_facet_counts.insert(),
+            [
+                {"scope": scope, "facet": facet, "value": value, "count": count}
+                for (scope, facet, value), count in counts.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_books_category", table_name="books")
+    op.drop_table("book_facet_counts")
+    op.drop_table("book_keywords")
@@ -0,0 +1,92 @@
+"""
+공통 API 의존성
+"""
+
+import math
+import secrets
+
+from fastapi import Depends, Header, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.rate_limit import login_throttle
+from app.models.user import User
+from app.schemas.auth import LoginRequest
+from app.services.auth_service import AuthService
+
+security = HTTPBearer()
+
+
+async def require_admin(x_admin_key: str = Header(None)) -> None:
+    """
+    관리자 API 키 검증
+
+    ADMIN_API_KEY가 설정되지 않았으면 관리자 API 전체를 막는다.
+
+    Raises:
+        HTTPException: 키가 없거나 일치하지 않을 때
+    """
+    if not settings.ADMIN_API_KEY or not x_admin_key or not secrets.compare_digest(
+        x_admin_key, settings.ADMIN_API_KEY
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다"
+        )
+
+
+async def require_metrics_access(
+    authorization: str = Header(None),
+    x_admin_key: str = Header(None),
+) -> None:
+    """
+    /metrics 접근 검증
+
+    라우트 경로, 커넥션 풀·캐시·LLM 내부 상태가 드러나므로 공개하지 않는다.
+    Prometheus는 bearer_token(METRICS_TOKEN)으로, 사람은 관리자 키로 조회한다.
+
+    Raises:
+        HTTPException: 토큰과 관리자 키가 모두 없거나 일치하지 않을 때
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if settings.METRICS_TOKEN and scheme.lower() == "bearer" and secrets.compare_digest(
+        token.strip(), settings.METRICS_TOKEN
+    ):
+        return
+    await require_admin(x_admin_key)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """
+    인증된 사용자 (쓰기 라우트용, 주 DB 세션으로 조회)
+
+    인증 헤더: Authorization: Bearer {access_token}
+
+    Raises:
+        HTTPException: 토큰 검증 실패 또는 사용자가 없을 때
+    """
+    return await AuthService.get_current_user(db, credentials.credentials)
+
+
+async def throttle_login(request: Request, login_data: LoginRequest) -> None:
+    """
+    로그인 시도 제한
+
+    DB 세션 사용이나 비밀번호 검증보다 먼저 실행되어야 하므로 라우트 의존성으로 둔다.
+
+    Raises:
+        HTTPException: IP 또는 이메일별 시도 한도를 넘었을 때 (429)
+    """
+    ip = request.client.host if request.client else None
+    retry_after = await login_throttle.check(ip, login_data.email)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
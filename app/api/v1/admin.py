@@ -0,0 +1,270 @@
+import io
+import uuid
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, File, Query, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import require_admin
+from app.core.config import settings
+from app.core.database import engine, get_async_db, pool_stats
+from app.core.hashing import password_hasher
+from app.core.query_log import query_stats
+from app.core.rate_limit import login_throttle
+from app.core.replicas import replica_router
+from app.core.response_cache import response_cache
+from app.core.serialization import json_response, orm_to_json
+from app.schemas.book import (
+    BookDetailResponse,
+    BookIngestReport,
+    BookUpdate,
+    CoverUploadResponse,
+    FacetRebuildReport,
+)
+from app.services.book_service import BOOKS_TAG, BookService
+from app.services.cover_service import CoverService
+from app.services.facet_service import rebuild_book_index
+from app.services.home_feed_service import HomeFeedService
+from app.services.ingest_service import BookIngestor, iter_records
+from app.services.llm import llm_pool
+from app.services.search_service import SearchService
+from app.services.semantic_cache import recommendation_cache
+from app.services.token_revocation import revocation_store
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.post("/books/ingest", response_model=BookIngestReport)
+async def ingest_books(
+    file: UploadFile = File(...),
+    input_format: Optional[Literal["csv", "jsonl"]] = Query(None, alias="format"),
+    batch_size: int = Query(settings.BOOK_INGEST_BATCH_SIZE, ge=100, le=50000),
+):
+    """
+    도서 대량 적재 (관리자)
+    
+    업로드 파일을 한 행씩 읽어 배치 단위로 검증·적재
+    
+    - **file**: CSV(헤더 포함) 또는 JSONL 파일, 컬럼은 BookCreate 필드
+    - **format**: 입력 형식 (생략 시 파일 확장자로 판단)
+    - **batch_size**: 배치 크기
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    fmt = input_format or ("csv" if (file.filename or "").lower().endswith(".csv") else "jsonl")
+    
+    def run() -> BookIngestReport:
+        # 업로드 파일은 디스크에 스풀링되어 있으므로 한 행씩 읽는다
+        stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        try:
+            ingestor = BookIngestor(engine, batch_size=batch_size)
+            return ingestor.run(iter_records(stream, fmt))
+        finally:
+            stream.detach()
+    
+    # COPY는 동기 드라이버(psycopg2)를 사용하므로 스레드 풀에서 실행
+    report = await run_in_threadpool(run)
+    
+    # ORM을 거치지 않은 변경이므로 검색 색인과 도서 응답 캐시를 직접 무효화
+    SearchService.mark_stale()
+    await response_cache.invalidate_tags([BOOKS_TAG])
+    return report
+
+
+@router.patch("/books/{book_id}", response_model=BookDetailResponse)
+async def update_book(
+    book_id: uuid.UUID,
+    book_data: BookUpdate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    도서 수정 (관리자)
+    
+    인기 도서·큐레이터 추천 표시나 테마를 바꾸면 해당 홈 피드 진열대가 커밋 직후 다시 만들어진다
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    book = await BookService.update_book(db, str(book_id), book_data)
+    return json_response(orm_to_json(BookDetailResponse, book))
+
+
+@router.put(
+    "/books/{book_id}/cover",
+    response_model=CoverUploadResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/octet-stream": {"schema": {"type": "string", "format": "binary"}}},
+        }
+    },
+)
+async def upload_book_cover(
+    book_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    도서 표지 업로드 (관리자)
+    
+    요청 본문에 이미지 파일(JPEG, PNG, WEBP)을 그대로 보낸다 (multipart 아님).
+    본문을 청크 단위로 디스크에 쓰며 MAX_FILE_SIZE를 넘으면 바로 413으로 중단하고,
+    내용 해시로 저장하므로 같은 이미지는 한 번만 저장된다.
+    썸네일은 COVER_THUMBNAIL_WIDTHS 너비별로 생성된다.
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    content_length = request.headers.get("content-length")
+    return await CoverService.upload_cover(
+        db,
+        str(book_id),
+        request.stream(),
+        int(content_length) if content_length and content_length.isdigit() else None,
+    )
+
+
+@router.post("/books/facets/rebuild", response_model=FacetRebuildReport)
+async def rebuild_book_facets(batch_size: int = Query(5000, ge=100, le=50000)):
+    """
+    키워드 태그·패싯 수 재계산 (관리자)
+    
+    books.keywords에서 태그 행을 다시 만들고 패싯별 도서 수를 새로 집계
+    (ORM 밖에서 도서를 수정한 뒤 또는 집계가 어긋났을 때 사용)
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    report = await run_in_threadpool(rebuild_book_index, engine, batch_size)
+    await response_cache.invalidate_tags([BOOKS_TAG])
+    return report
+
+
+@router.get("/home")
+async def get_home_feed_stats(db: AsyncSession = Depends(get_async_db)):
+    """
+    홈 피드 진열대 상태 (관리자)
+    
+    진열대별 도서 수, 만든 뒤 경과 시간, 반영되지 않은 변경의 대기 시간
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    return await HomeFeedService.stats(db)
+
+
+@router.post("/home/refresh")
+async def refresh_home_feed(db: AsyncSession = Depends(get_async_db)):
+    """
+    홈 피드 진열대 전체 다시 만들기 (관리자)
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    refreshed = await HomeFeedService.refresh(db)
+    return {"refreshed": refreshed}
+
+
+@router.get("/auth/throttle")
+async def get_login_throttle_stats():
+    """
+    로그인 시도 제한 지표 (관리자)
+    
+    허용/차단 수와, 차단으로 건너뛴 bcrypt 검증 횟수·추정 시간(평균 검증 시간 기준)
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    return {
+        "throttle": login_throttle.stats(password_hasher.stats()["avg_run_seconds"]),
+        "password_hasher": password_hasher.stats(),
+    }
+
+
+@router.get("/auth/revocation")
+async def get_revocation_stats():
+    """
+    Refresh Token 폐기 저장소 지표 (관리자)
+    
+    블룸 필터 조회/적중 수, 실제 폐기 확인 수, 오탐률, 필터 크기
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    return revocation_store.stats()
+
+
+@router.get("/llm")
+async def get_llm_stats():
+    """
+    LLM 제공자 풀 지표 (관리자)
+    
+    제공자별 동시 요청 수, 요청·실패 수, 평균 첫 토큰 시간, 장애 후 쿨다운 남은 시간
+    (워커 전체 첫 토큰 시간 분포는 /metrics의 llm_time_to_first_token_seconds 참고)
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    return llm_pool.stats()
+
+
+@router.get("/recommend/cache")
+async def get_recommend_cache_stats():
+    """
+    추천 시맨틱 캐시 지표 (관리자)
+    
+    요청을 처리한 워커의 항목 수, 적중률, 제거·만료 수
+    (워커 전체 적중률과 유사도 분포는 /metrics의 recommend_cache_* 지표 참고)
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    return recommendation_cache.stats()
+
+
+@router.delete("/recommend/cache")
+async def clear_recommend_cache():
+    """
+    추천 시맨틱 캐시 비우기 (관리자, 요청을 처리한 워커만)
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    cleared = len(recommendation_cache)
+    recommendation_cache.clear()
+    return {"cleared": cleared}
+
+
+@router.get("/queries")
+async def get_query_stats(
+    limit: int = Query(20, ge=1, le=200),
+    sort: Literal["total", "max", "count", "n_plus_one"] = "total",
+):
+    """
+    쿼리 지문별 집계 (관리자)
+    
+    - **limit**: 조회 개수
+    - **sort**: 정렬 (total: 누적 시간, max: 최대 시간, count: 실행 수, n_plus_one: N+1 의심 요청 수)
+    
+    SLOW_QUERY_EXPLAIN=true이면 느린 지문의 실행 계획(plan)도 포함
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    return query_stats.top(limit, sort)
+
+
+@router.get("/db/pool")
+async def get_pool_stats():
+    """
+    커넥션 풀 상태 (관리자)
+    
+    요청을 처리한 워커의 풀 크기·사용 중·오버플로 연결 수와 연결 획득 대기 시간
+    (워커 전체 합계는 /metrics의 db_pool_* 지표 참고)
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    return pool_stats()
+
+
+@router.get("/db/replicas")
+async def get_replica_stats():
+    """
+    읽기 복제본 상태 (관리자)
+    
+    복제본별 정상 여부, 복제 지연, 마지막 오류, 이 워커에서 연 읽기 세션 수
+    
+    인증 헤더: X-Admin-Key: {ADMIN_API_KEY}
+    """
+    await replica_router.check_health()
+    return replica_router.stats()
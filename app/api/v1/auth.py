@@ -1,8 +1,13 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.api.deps import security, throttle_login
+from app.core.database import get_async_db
+from app.core.rate_limit import login_throttle
+from app.core.serialization import json_response, orm_to_json, to_json
 from app.schemas.auth import (
     SignupRequest,
     SignupResponse,
@@ -14,13 +19,12 @@ from app.schemas.auth import (
 from app.services.auth_service import AuthService
 
 router = APIRouter()
-security = HTTPBearer()
 
 
 @router.post("/register", response_model=SignupResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     signup_data: SignupRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     회원가입
@@ -32,20 +36,15 @@ async def register(
     - **agree_privacy**: 개인정보 처리방침 동의 (필수)
     - **agree_marketing**: 마케팅 수신 동의 (선택)
     """
-    user = AuthService.create_user(db, signup_data)
+    user = await AuthService.create_user(db, signup_data)
     
-    return SignupResponse(
-        id=user.id,
-        email=user.email,
-        name=user.name,
-        created_at=user.created_at
-    )
+    return json_response(orm_to_json(SignupResponse, user), status_code=status.HTTP_201_CREATED)
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post("/login", response_model=TokenResponse, dependencies=[Depends(throttle_login)])
 async def login(
     login_data: LoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     로그인
@@ -53,76 +52,68 @@ async def login(
     - **email**: 이메일
     - **password**: 비밀번호
     - **remember**: 로그인 유지 (True: 7일, False: 30분)
+    
+    IP·이메일별 시도 한도를 넘으면 429 (Retry-After 헤더 포함)
     """
     # 사용자 인증
-    user = AuthService.authenticate_user(
+    user = await AuthService.authenticate_user(
         db,
         login_data.email,
         login_data.password
     )
+    await login_throttle.reset_email(login_data.email)
     
     # 토큰 생성
     tokens = AuthService.create_tokens(user, login_data.remember)
     
-    return TokenResponse(
-        access_token=tokens["access_token"],
-        refresh_token=tokens["refresh_token"],
-        token_type="Bearer",
-        expires_in=tokens["expires_in"],
-        user=UserResponse(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            is_active=user.is_active,
-            is_verified=user.is_verified,
-            created_at=user.created_at
-        )
-    )
+    return json_response(orm_to_json(TokenResponse, {
+        "access_token": tokens["access_token"],
+        "refresh_token": tokens["refresh_token"],
+        "token_type": "Bearer",
+        "expires_in": tokens["expires_in"],
+        "user": user,
+    }))
 
 
 @router.post("/refresh")
 async def refresh_token(
     refresh_data: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Access Token 갱신
     
     Refresh Token을 사용하여 새로운 Access Token 발급
+    사용한 Refresh Token은 폐기되고 새 Refresh Token이 함께 발급됨 (회전)
     """
-    new_token = AuthService.refresh_access_token(db, refresh_data.refresh_token)
+    new_token = await AuthService.refresh_access_token(db, refresh_data.refresh_token)
     return new_token
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     현재 사용자 정보 조회
     
     인증 헤더: Authorization: Bearer {access_token}
     """
+    # 캐시 실패 시 조회한 값을 사용자 캐시에 저장하므로 복제본이 아닌 주 DB에서 읽는다
     token = credentials.credentials
-    user = AuthService.get_current_user(db, token)
-    
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        name=user.name,
-        is_active=user.is_active,
-        is_verified=user.is_verified,
-        created_at=user.created_at
-    )
+    profile = await AuthService.get_current_user_profile(db, token)
+    return json_response(to_json(UserResponse, profile))
 
 
 @router.post("/logout")
-async def logout():
+async def logout(refresh_data: Optional[RefreshTokenRequest] = None):
     """
     로그아웃
     
-    클라이언트에서 토큰 삭제 필요
-    (서버에서는 Stateless이므로 별도 처리 없음)
+    Refresh Token을 보내면 해당 로그인(토큰 패밀리)의 Refresh Token을 모두 폐기
+    클라이언트에서 토큰 삭제 필요 (Access Token은 만료 시까지 유효)
     """
-    return {"message": "로그아웃되었습니다"}
\ No newline at end of file
+    if refresh_data is not None:
+        await AuthService.logout(refresh_data.refresh_token)
+    return {"message": "로그아웃되었습니다"}
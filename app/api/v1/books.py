@@ -0,0 +1,249 @@
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.replicas import get_read_db
+from app.core.response_cache import response_cache
+from app.core.serialization import json_response, orm_fields, orm_to_json, to_json
+from app.core.sse import sse_response
+from app.models.book_facet import price_bucket_range
+from app.schemas.book import (
+    BookBrowseResponse,
+    BookFilter,
+    BookListResponse,
+    BookResponse,
+    BookSearchResponse,
+    RecommendedBookList,
+)
+from app.services.book_service import BOOKS_SEARCH_TAG, BOOKS_TAG, BookService
+from app.services.facet_service import FacetService
+from app.services.recommendation_service import RecommendationService
+from app.services.search_service import SearchService
+from app.utils.text import split_keywords
+
+router = APIRouter()
+
+
+# 응답 캐시를 채우는 라우트(목록·탐색·검색)는 주 DB 세션(get_async_db)으로 조회한다.
+# 복제본에서 읽으면 무효화 직후 아직 반영되지 않은 값을 TTL 동안 다시 저장할 수 있기 때문.
+# 주 DB 세션은 첫 쿼리에서 연결하므로 캐시 적중 시에는 연결을 잡지 않는다.
+def cached_json(body: bytes, hit: bool) -> Response:
+    """캐시된 JSON 본문을 그대로 응답 (X-Cache: HIT/MISS)"""
+    return json_response(body, headers={"X-Cache": "HIT" if hit else "MISS"})
+
+
+@router.get("", response_model=BookListResponse)
+async def list_books(
+    theme: Optional[str] = Query(None, pattern="^(work|healing|growth)$"),
+    is_popular: Optional[bool] = None,
+    is_curator_pick: Optional[bool] = None,
+    min_price: Optional[int] = Query(None, ge=0),
+    max_price: Optional[int] = Query(None, ge=0),
+    min_rating: Optional[float] = Query(None, ge=0.0, le=5.0),
+    sort: Literal["latest", "rating"] = "latest",
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    count: Literal["estimate", "exact", "none"] = "estimate",
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    도서 목록 조회
+    
+    - **theme**: 테마 (work, healing, growth)
+    - **is_popular** / **is_curator_pick**: 인기 도서 / 큐레이터 추천
+    - **min_price** / **max_price**: 가격 범위 (원)
+    - **min_rating**: 최소 평점
+    - **sort**: 정렬 (latest: 최신순, rating: 평점순)
+    - **cursor**: 이전 응답의 next_cursor (다음 페이지)
+    - **count**: 전체 수 계산 방식 (estimate: 추정치, exact: 정확한 수, none: 생략)
+    """
+    filters = BookFilter(
+        theme=theme,
+        is_popular=is_popular,
+        is_curator_pick=is_curator_pick,
+        min_price=min_price,
+        max_price=max_price,
+        min_rating=min_rating,
+    )
+    
+    async def compute() -> bytes:
+        books, next_cursor = await BookService.list_books(db, filters, sort, limit, cursor)
+        total, total_is_estimate = await BookService.count_books(db, filters, count)
+        
+        return orm_to_json(BookListResponse, {
+            "books": books,
+            "total": total,
+            "total_is_estimate": total_is_estimate,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        })
+    
+    # 정확한 수를 명시적으로 요청한 경우에는 캐시를 거치지 않음
+    if count == "exact":
+        return cached_json(await compute(), hit=False)
+    
+    key = response_cache.build_key(
+        "books.list",
+        {**filters.model_dump(), "sort": sort, "limit": limit, "cursor": cursor, "count": count},
+    )
+    body, hit = await response_cache.get_or_compute(
+        key,
+        ttl=settings.RESPONSE_CACHE_BOOK_LIST_TTL,
+        tags=BookService.list_cache_tags(filters),
+        compute=compute,
+    )
+    return cached_json(body, hit)
+
+
+@router.get("/browse", response_model=BookBrowseResponse)
+async def browse_books(
+    theme: Optional[str] = Query(None, pattern="^(work|healing|growth)$"),
+    category: Optional[str] = Query(None, max_length=100),
+    keyword: List[str] = Query([], max_length=5),
+    price: Optional[str] = Query(None, max_length=20),
+    min_rating: Optional[float] = Query(None, ge=0.0, le=5.0),
+    sort: Literal["latest", "rating"] = "latest",
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    도서 탐색 (목록 + 패싯 수)
+    
+    - **theme** / **category**: 테마 / 카테고리
+    - **keyword**: 키워드 (여러 번 지정하면 모두 포함하는 도서)
+    - **price**: 가격대 (facets.price의 value, 예: 10000-15000, 30000+)
+    - **min_rating**: 최소 평점
+    - **sort**: 정렬 (latest: 최신순, rating: 평점순)
+    - **cursor**: 이전 응답의 next_cursor (다음 페이지)
+    
+    facets는 미리 집계된 테마·카테고리·키워드·가격대별 도서 수
+    (테마를 고르면 그 테마 안의 수, 다른 선택은 수에 반영되지 않음)
+    """
+    min_price = max_price = None
+    if price is not None:
+        try:
+            min_price, max_price = price_bucket_range(price)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="알 수 없는 가격대입니다"
+            )
+    
+    keywords = tuple(dict.fromkeys(k for value in keyword for k in split_keywords(value)))
+    filters = BookFilter(
+        theme=theme,
+        category=category,
+        keywords=keywords or None,
+        min_price=min_price,
+        max_price=max_price,
+        min_rating=min_rating,
+    )
+    
+    async def compute() -> bytes:
+        books, next_cursor = await BookService.list_books(db, filters, sort, limit, cursor)
+        facets = await FacetService.facet_counts(db, theme)
+        
+        return orm_to_json(BookBrowseResponse, {
+            "books": books,
+            "facets": facets,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        })
+    
+    key = response_cache.build_key(
+        "books.browse",
+        {**filters.model_dump(), "sort": sort, "limit": limit, "cursor": cursor},
+    )
+    body, hit = await response_cache.get_or_compute(
+        key,
+        ttl=settings.RESPONSE_CACHE_BOOK_LIST_TTL,
+        tags=BookService.list_cache_tags(filters),
+        compute=compute,
+    )
+    return cached_json(body, hit)
+
+
+@router.get("/search", response_model=BookSearchResponse)
+async def search_books(
+    q: str = Query(..., min_length=1, max_length=100),
+    theme: Optional[str] = Query(None, pattern="^(work|healing|growth)$"),
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    도서 검색
+    
+    제목·저자·키워드·설명을 한국어 n-gram 단위로 검색하고 관련도순으로 반환
+    
+    - **q**: 검색어
+    - **theme**: 테마 필터 (work, healing, growth)
+    - **limit**: 최대 결과 수
+    """
+    async def compute() -> bytes:
+        results = await SearchService.search(db, q, theme, limit)
+        
+        return orm_to_json(BookSearchResponse, {
+            "query": q,
+            "books": [
+                {**orm_fields(BookResponse, book), "score": score, "highlights": highlights}
+                for book, score, highlights in results
+            ],
+        })
+    
+    key = response_cache.build_key("books.search", {"q": q, "theme": theme, "limit": limit})
+    body, hit = await response_cache.get_or_compute(
+        key,
+        ttl=settings.RESPONSE_CACHE_BOOK_SEARCH_TTL,
+        tags=[BOOKS_TAG, BOOKS_SEARCH_TAG],
+        compute=compute,
+    )
+    return cached_json(body, hit)
+
+
+@router.get("/recommend", response_model=RecommendedBookList)
+async def recommend_books(
+    q: str = Query(..., min_length=1, max_length=200),
+    theme: Optional[str] = Query(None, pattern="^(work|healing|growth)$"),
+    k: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    임베딩 기반 도서 추천
+    
+    요청 문장과 의미가 가까운 도서를 pgvector HNSW 인덱스로 찾아 반환
+    
+    - **q**: 추천 요청 (예: 퇴근 후 힐링되는 소설)
+    - **theme**: 테마 필터 (work, healing, growth)
+    - **k**: 추천 수
+    """
+    result = await RecommendationService.recommend(db, q, theme, k)
+    return json_response(to_json(RecommendedBookList, result))
+
+
+@router.get("/recommend/stream")
+async def recommend_books_stream(
+    q: str = Query(..., min_length=1, max_length=200),
+    theme: Optional[str] = Query(None, pattern="^(work|healing|growth)$"),
+    k: int = Query(5, ge=1, le=20),
+):
+    """
+    AI 도서 추천 (Server-Sent Events)
+    
+    임베딩으로 찾은 추천 목록을 먼저 보내고, LLM이 생성하는 추천 설명을 토큰 단위로 스트리밍
+    
+    - **q**: 추천 요청 (예: 퇴근 후 힐링되는 소설)
+    - **theme**: 테마 필터 (work, healing, growth)
+    - **k**: 추천 수
+    
+    이벤트: books(RecommendedBookList) → token({"text"})... → done({"provider", "explanation", "cached"})
+    LLM 제공자를 모두 사용할 수 없으면 done 대신 error({"detail"})
+    
+    이전 요청과 의미가 충분히 가까우면 저장된 추천과 설명을 바로 응답 (X-Cache: HIT, token 이벤트 없음)
+    """
+    # 캐시 적중이면 DB 세션을 열지 않고, 실패면 DB 조회를 응답 시작 전에 끝낸다
+    events, hit = await RecommendationService.recommend_stream(q, theme, k)
+    return sse_response(events, headers={"X-Cache": "HIT" if hit else "MISS"})
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Request
+
+from app.core.config import settings
+from app.core.files import file_response
+from app.services.cover_service import resolve_cover
+
+router = APIRouter()
+
+
+@router.api_route("/{name}", methods=["GET", "HEAD"])
+async def get_cover(name: str, request: Request):
+    """
+    표지 이미지 (원본 또는 썸네일)
+
+    파일 이름이 내용 해시이므로 immutable로 오래 캐시된다.
+
+    - If-None-Match: ETag가 같으면 304
+    - Range: 단일 구간 요청이면 206 (If-Range 지원)
+    """
+    path, media_type, etag = resolve_cover(name)
+    return file_response(
+        request,
+        path,
+        media_type=media_type,
+        etag=etag,
+        cache_control=f"public, max-age={settings.COVER_CACHE_MAX_AGE}, immutable",
+    )
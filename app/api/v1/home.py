@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.replicas import get_read_db
+from app.core.serialization import json_response
+from app.schemas.book import HomeFeedResponse
+from app.services.home_feed_service import HomeFeedService
+
+router = APIRouter()
+
+
+@router.get("", response_model=HomeFeedResponse)
+async def get_home_feed(db: AsyncSession = Depends(get_read_db)):
+    """
+    홈 피드
+    
+    인기 도서, 큐레이터 추천, 테마별(work, healing, growth) 진열대를 한 번에 반환
+    
+    미리 만들어 둔 진열대를 그대로 응답하며, 도서 변경이 아직 반영되지 않았으면 stale=true
+    """
+    return json_response(await HomeFeedService.get_feed(db))
@@ -0,0 +1,89 @@
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user
+from app.core.database import get_async_db
+from app.core.replicas import get_read_db
+from app.core.serialization import json_response, orm_to_json
+from app.models.user import User
+from app.schemas.review import ReviewCreate, ReviewListResponse, ReviewResponse, ReviewUpdate
+from app.services.review_service import ReviewService
+
+router = APIRouter()
+
+
+@router.get("/books/{book_id}/reviews", response_model=ReviewListResponse)
+async def list_reviews(
+    book_id: uuid.UUID,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    도서 리뷰 목록 (최신순)
+
+    - **limit**: 페이지 크기
+    - **cursor**: 이전 응답의 next_cursor (다음 페이지)
+
+    summary는 평점 샤드를 합산한 최신 값 (도서 목록의 rating은 주기적으로 반영)
+    """
+    reviews, next_cursor = await ReviewService.list_reviews(db, str(book_id), limit, cursor)
+    summary = await ReviewService.rating_summary(db, str(book_id))
+    return json_response(orm_to_json(ReviewListResponse, {
+        "reviews": reviews,
+        "summary": summary,
+        "next_cursor": next_cursor,
+    }))
+
+
+@router.post("/books/{book_id}/reviews", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
+async def create_review(
+    book_id: uuid.UUID,
+    review_data: ReviewCreate,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    리뷰 작성 (도서당 1건)
+
+    - **rating**: 평점 (1~5)
+    - **content**: 내용 (선택, 2000자 이하)
+
+    인증 헤더: Authorization: Bearer {access_token}
+    """
+    review = await ReviewService.create_review(db, str(book_id), user, review_data)
+    return json_response(orm_to_json(ReviewResponse, review), status_code=status.HTTP_201_CREATED)
+
+
+@router.patch("/reviews/{review_id}", response_model=ReviewResponse)
+async def update_review(
+    review_id: uuid.UUID,
+    review_data: ReviewUpdate,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    리뷰 수정 (본인 리뷰만)
+
+    인증 헤더: Authorization: Bearer {access_token}
+    """
+    review = await ReviewService.update_review(db, str(review_id), user, review_data)
+    return json_response(orm_to_json(ReviewResponse, review))
+
+
+@router.delete("/reviews/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_review(
+    review_id: uuid.UUID,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    리뷰 삭제 (본인 리뷰만)
+
+    인증 헤더: Authorization: Bearer {access_token}
+    """
+    await ReviewService.delete_review(db, str(review_id), user)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
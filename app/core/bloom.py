@@ -0,0 +1,115 @@
+"""
+블룸 필터
+'확실히 없음'을 상수 시간에 판별하는 확률적 집합 (오탐 가능, 미탐 없음)
+"""
+
+import hashlib
+import math
+import time
+from typing import Dict, Optional
+
+
+class BloomFilter:
+    """
+    고정 크기 블룸 필터
+
+    예상 원소 수와 목표 오탐률로 비트 수(m)와 해시 함수 수(k)를 정하고,
+    해시 두 개를 조합(double hashing)해 k개의 비트 위치를 만든다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        """원소 추가"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class ExpiringBloomFilter:
+    """
+    만료 시각이 있는 원소용 블룸 필터
+
+    블룸 필터는 원소를 지울 수 없으므로, 만료 시각 구간(bucket)별로 필터를 따로 두고
+    구간이 지나면 필터를 통째로 버린다. 조회 비용은 살아 있는 구간 수 x k로 일정하다.
+    """
+
+    def __init__(self, bucket_seconds: int, capacity: int, error_rate: float = 0.001):
+        self.bucket_seconds = bucket_seconds
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        self._buckets: Dict[int, BloomFilter] = {}
+
+    def add(self, item: str, expires_at: float) -> None:
+        """
+        원소 추가
+
+        Args:
+            item: 원소
+            expires_at: 만료 시각 (epoch 초)
+        """
+        if expires_at <= time.time():
+            return
+
+        bucket = int(expires_at // self.bucket_seconds)
+        bloom = self._buckets.get(bucket)
+        if bloom is None:
+            bloom = self._buckets[bucket] = BloomFilter(self.capacity, self.error_rate)
+        bloom.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        self.purge()
+        return any(item in bloom for bloom in self._buckets.values())
+
+    def purge(self, now: Optional[float] = None) -> int:
+        """
+        만료된 구간의 필터 제거
+
+        Returns:
+            int: 제거된 원소 수
+        """
+        current = int((now or time.time()) // self.bucket_seconds)
+        expired = [bucket for bucket in self._buckets if bucket < current]
+
+        removed = 0
+        for bucket in expired:
+            removed += self._buckets.pop(bucket).count
+        return removed
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return sum(bloom.count for bloom in self._buckets.values())
+
+    def stats(self) -> dict:
+        """
+        필터 지표 조회
+
+        Returns:
+            dict: 구간 수, 원소 수, 메모리 사용량 (bytes)
+        """
+        return {
+            "buckets": len(self._buckets),
+            "items": len(self),
+            "bytes": sum(len(bloom._bits) for bloom in self._buckets.values()),
+        }
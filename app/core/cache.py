@@ -0,0 +1,113 @@
+"""
+인메모리 캐시
+크기 제한(LRU) + 만료 시간(TTL) 캐시
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    크기 제한 TTL 캐시
+
+    - 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    - 항목마다 만료 시각을 두고, 조회 시 만료된 항목은 제거
+    - 스레드 안전 (스레드 풀에서 호출되는 동기 코드에서도 사용)
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 지표
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 또는 None (없거나 만료된 경우)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl_seconds: 만료 시간 (기본값: 캐시 생성 시 지정한 TTL)
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """캐시 항목 삭제"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """만료되지 않은 항목 존재 여부 (적중률 지표에는 반영하지 않음)"""
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def stats(self) -> dict:
+        """
+        캐시 지표 조회
+
+        Returns:
+            dict: 크기, 적중/실패 횟수, 적중률, 제거 횟수
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
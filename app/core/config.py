@@ -16,17 +16,46 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str = "/api/v1"
     
     # 서버 설정
-    DEBUG: bool = True
+    DEBUG: bool = False
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     
+    # 모니터링 (/metrics, Prometheus)
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str = ""  # /metrics 수집용 토큰 (Authorization: Bearer), 비어 있으면 X-Admin-Key로만 접근
+    
+    # 쿼리 로그 (느린 쿼리 + 지문별 집계 + N+1 감지)
+    QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    SLOW_QUERY_LOG_SAMPLE_RATE: float = 1.0  # 느린 쿼리 중 로그로 남길 비율
+    SLOW_QUERY_EXPLAIN: bool = False  # 가장 느린 실행의 EXPLAIN 수집
+    SLOW_QUERY_EXPLAIN_INTERVAL: int = 600  # 같은 지문의 EXPLAIN 재수집 간격 (초)
+    N_PLUS_ONE_THRESHOLD: int = 10  # 한 요청에서 같은 지문이 이 횟수 이상이면 경고
+    QUERY_STATS_MAX_FINGERPRINTS: int = 1000
+    
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173,http://127.0.0.1:3000"
     
     # 데이터베이스
     DATABASE_URL: str
+    DB_ECHO: bool = False  # SQL 로그 출력 (개발용)
+    DB_SCHEMA_CHECK: str = "strict"  # 시작 시 마이그레이션 리비전 확인: 'strict', 'warn', 'off'
+    
+    # 커넥션 풀 (워커·엔진마다 따로 생성됨)
+    # 워커당 최대 연결 수 = (DB_POOL_SIZE + DB_MAX_OVERFLOW) × 사용하는 엔진 수(동기·비동기)
+    DB_POOL_MODE: str = "queue"  # 'queue': 앱 내 풀, 'pgbouncer': 트랜잭션 풀링용 (NullPool + prepared statement 미사용)
+    DB_POOL_SIZE: int = 5  # 유지하는 연결 수
+    DB_MAX_OVERFLOW: int = 10  # 순간 부하 시 추가로 여는 연결 수
+    DB_POOL_TIMEOUT: float = 30  # 연결을 얻기까지 최대 대기 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 이 시간(초)이 지난 연결은 다시 연결 (-1: 사용 안 함)
     
-    # Redis (향후 사용)
+    # 읽기 전용 복제본 (쉼표 구분 URL, 비어 있으면 모든 읽기를 주 DB에서 처리)
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_HEALTH_CHECK_SECONDS: float = 10  # 상태 확인 주기
+    DB_REPLICA_MAX_LAG_SECONDS: float = 30  # 복제 지연이 이보다 크면 제외 (PostgreSQL)
+    DB_READ_YOUR_WRITES_SECONDS: float = 5  # 쓰기 후 이 시간 동안 같은 클라이언트의 읽기는 주 DB로
+    
+    # Redis (캐시 공유용, 선택)
     REDIS_URL: str = "redis://localhost:6379/0"
     
     # JWT 인증
@@ -34,22 +63,116 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    TOKEN_CACHE_MAX_SIZE: int = 10000  # 검증 완료 토큰 캐시 크기
+    
+    # Refresh Token 폐기 (블룸 필터 + DB/Redis 확인)
+    TOKEN_REVOCATION_BACKEND: str = "database"  # 'database' 또는 'redis'
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = 100000  # 하루치 폐기 예상 건수
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 5  # 다른 워커의 폐기 내역 반영 주기
+    TOKEN_REVOCATION_PURGE_SECONDS: float = 3600  # 만료된 폐기 기록 정리 주기
+    
+    # 비밀번호 해싱 (bcrypt 전용 풀)
+    PASSWORD_HASH_EXECUTOR: str = "thread"  # 'thread' 또는 'process'
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 8
+    
+    # 로그인 시도 제한 (토큰 버킷: 용량 + 분당 충전량)
+    LOGIN_THROTTLE_BACKEND: str = "memory"  # 'memory' 또는 'redis'
+    LOGIN_THROTTLE_IP_CAPACITY: int = 20
+    LOGIN_THROTTLE_IP_PER_MINUTE: float = 10
+    LOGIN_THROTTLE_EMAIL_CAPACITY: int = 5
+    LOGIN_THROTTLE_EMAIL_PER_MINUTE: float = 2
+    LOGIN_THROTTLE_MAX_KEYS: int = 100000  # 인메모리 백엔드의 최대 버킷 수
+    
+    # 사용자 캐시 (/auth/me)
+    USER_CACHE_BACKEND: str = "memory"  # 'memory' 또는 'redis'
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+    
+    # 응답 캐시 (도서 조회 라우트)
+    RESPONSE_CACHE_BACKEND: str = "memory"  # 'memory' 또는 'redis'
+    RESPONSE_CACHE_MAX_SIZE: int = 5000
+    RESPONSE_CACHE_BOOK_LIST_TTL: int = 60
+    RESPONSE_CACHE_BOOK_SEARCH_TTL: int = 30
+    
+    # 관리자 API (X-Admin-Key 헤더, 비어 있으면 관리자 API 비활성화)
+    ADMIN_API_KEY: str = ""
+    
+    # 도서 목록
+    BOOK_COUNT_CACHE_TTL_SECONDS: int = 300  # 필터별 도서 수 캐시
+    BOOK_INGEST_BATCH_SIZE: int = 5000
+    BOOK_FACET_KEYWORD_LIMIT: int = 30  # 탐색 화면 키워드 패싯 최대 개수
+    
+    # 리뷰 평점 집계
+    REVIEW_RATING_SHARDS: int = 8  # 도서별 집계 샤드 수 (인기 도서의 동시 리뷰 분산)
+    REVIEW_ROLLUP_WINDOW_SECONDS: int = 300  # rollup 작업이 다시 보는 최근 변경 구간
     
-    # OpenAI API (향후 사용)
+    # 홈 피드
+    HOME_FEED_SHELF_SIZE: int = 12  # 진열대당 도서 수
+    
+    # OpenAI API
     OPENAI_API_KEY: str = ""
+    OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
+    OPENAI_CHAT_MODEL: str = "gpt-4o-mini"
+    
+    # 임베딩 (도서 추천)
+    EMBEDDING_PROVIDER: str = "local"  # 'local' 또는 'openai'
+    EMBEDDING_DIM: int = 256
+    EMBEDDING_HNSW_EF_SEARCH: int = 64
     
-    # Anthropic Claude API (향후 사용)
+    # Anthropic Claude API
     ANTHROPIC_API_KEY: str = ""
+    ANTHROPIC_MODEL: str = "claude-3-5-haiku-latest"
+    
+    # LLM 제공자 풀 (AI 추천 설명 스트리밍)
+    LLM_PROVIDERS: str = "anthropic,openai"  # 우선순위 순, API 키가 없는 제공자는 제외 ('stub': 지연 시뮬레이션용)
+    LLM_MAX_CONCURRENCY: int = 8  # 워커당 제공자별 동시 요청 수
+    LLM_QUEUE_TIMEOUT: float = 1  # 제공자 자리가 날 때까지 기다리는 시간 (초, 넘으면 다음 제공자로)
+    LLM_CONNECT_TIMEOUT: float = 5
+    LLM_READ_TIMEOUT: float = 20  # 스트림 청크 사이 최대 간격 (초)
+    LLM_FIRST_TOKEN_TIMEOUT: float = 10  # 첫 토큰까지 최대 대기 (초, 넘으면 다음 제공자로)
+    LLM_FAILOVER_COOLDOWN: float = 30  # 실패한 제공자를 후순위로 미루는 시간 (초)
+    LLM_MAX_TOKENS: int = 512
+    LLM_STUB_FIRST_TOKEN_MS: int = 300
+    LLM_STUB_TOKEN_MS: int = 20
+    
+    # 추천 시맨틱 캐시 (비슷한 요청의 LLM 추천 응답 재사용, 워커별 인메모리)
+    RECOMMEND_CACHE_ENABLED: bool = True
+    RECOMMEND_CACHE_SIMILARITY: float = 0.92  # 요청 임베딩의 코사인 유사도가 이 값 이상이면 재사용
+    RECOMMEND_CACHE_MAX_ENTRIES: int = 10000
+    RECOMMEND_CACHE_TTL: int = 3600  # 초 (도서 정보 변경은 만료 전까지 반영되지 않음)
     
     # 파일 업로드
     MAX_FILE_SIZE: int = 10485760
     UPLOAD_DIR: str = "uploads/"
     
+    # 표지 이미지 (내용 해시로 저장, 썸네일은 전용 프로세스 풀에서 생성)
+    COVER_THUMBNAIL_WIDTHS: str = "160,320,640"  # 쉼표 구분 썸네일 너비 (px)
+    COVER_THUMBNAIL_WORKERS: int = 2
+    COVER_THUMBNAIL_MAX_CONCURRENCY: int = 4
+    COVER_CACHE_MAX_AGE: int = 31536000  # 표지 응답 Cache-Control max-age (초, 내용이 바뀌면 URL도 바뀜)
+    
     @property
     def cors_origins_list(self) -> List[str]:
         """CORS origins를 리스트로 변환"""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
     
+    @property
+    def llm_providers_list(self) -> List[str]:
+        """LLM 제공자를 우선순위 순 리스트로 변환"""
+        return [name.strip() for name in self.LLM_PROVIDERS.split(",") if name.strip()]
+    
+    @property
+    def cover_thumbnail_widths_list(self) -> List[int]:
+        """썸네일 너비를 리스트로 변환"""
+        return sorted({int(width) for width in self.COVER_THUMBNAIL_WIDTHS.split(",") if width.strip()})
+    
+    @property
+    def replica_urls_list(self) -> List[str]:
+        """복제본 URL을 리스트로 변환"""
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,7 +1,8 @@
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
+from jose import jwt
 from passlib.context import CryptContext
+from app.core import security
 from app.core.config import settings
 
 # 비밀번호 해싱 컨텍스트
@@ -82,14 +83,12 @@ def decode_token(token: str) -> Optional[dict]:
     """
     JWT 토큰 디코딩
     
+    검증 토큰 캐시를 공유하도록 app.core.security 구현에 위임
+    
     Args:
         token: JWT 토큰
         
     Returns:
         dict: 디코딩된 페이로드 또는 None
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
-        return None
\ No newline at end of file
+    return security.decode_token(token)
@@ -3,16 +3,96 @@
 SQLAlchemy + PostgreSQL
 """
 
+import uuid
+from pathlib import Path
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
 from app.core.config import settings
+from app.core.metrics import instrument_engine, instrument_pool, pool_status, timed_pool_class
+from app.core.query_log import instrument_query_log
+
+
+# Alembic 설정 파일 (프로젝트 루트)
+ALEMBIC_INI = str(Path(__file__).resolve().parents[2] / "alembic.ini")
+
+# 동기 드라이버 URL → 비동기 드라이버 URL 매핑
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """
+    동기 DB URL을 비동기 드라이버 URL로 변환
+    
+    Args:
+        database_url: 예) postgresql://user@localhost:5432/chaekmate
+        
+    Returns:
+        str: 예) postgresql+asyncpg://user@localhost:5432/chaekmate
+    """
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def pool_options(database_url: str) -> dict:
+    """
+    엔진 커넥션 풀 설정
+    
+    - queue: 크기·오버플로·대기 시간·재연결 주기를 지정한 큐 풀
+      (SQLite 메모리 DB처럼 큐 풀을 쓰지 않는 DB는 기본 풀을 그대로 사용)
+    - pgbouncer: PgBouncer 트랜잭션 풀링 뒤에서 실행. 풀은 PgBouncer에 맡기고 앱은 NullPool을 쓴다.
+      트랜잭션마다 서버 연결이 바뀔 수 있으므로 서버 측 prepared statement를 재사용하지 않는다.
+    
+    지표 수집 시에는 연결 획득 대기 시간을 측정하는 풀 클래스를 사용한다.
+    
+    Args:
+        database_url: DB URL (드라이버 포함)
+        
+    Returns:
+        dict: create_engine / create_async_engine 인자
+    """
+    url = make_url(database_url)
+    
+    if settings.DB_POOL_MODE == "pgbouncer":
+        pool_class = NullPool
+        # 매번 새로 연결하므로 pre-ping은 왕복만 늘린다
+        options = {"pool_pre_ping": False}
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                # 이름 없는 문장은 다른 클라이언트와 섞일 수 있으므로 매번 고유한 이름 사용
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+    else:
+        pool_class = url.get_dialect().get_pool_class(url)
+        options = {"pool_pre_ping": True}
+        if issubclass(pool_class, QueuePool):
+            options.update(
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+            )
+    
+    options["poolclass"] = timed_pool_class(pool_class) if settings.METRICS_ENABLED else pool_class
+    return options
+
 
 # SQLAlchemy 엔진 생성
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=settings.DEBUG,
+    echo=settings.DB_ECHO,
+    **pool_options(settings.DATABASE_URL),
 )
 
 # 세션 로컬 생성
@@ -22,6 +102,52 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+
+def create_async_db_engine(database_url: str) -> AsyncEngine:
+    """
+    비동기 엔진 생성 (풀 설정 + 쿼리 지표·로그 등록)
+    
+    Args:
+        database_url: 동기 드라이버 DB URL (비동기 드라이버로 변환해서 사용)
+        
+    Returns:
+        AsyncEngine: 비동기 엔진
+    """
+    async_url = to_async_url(database_url)
+    new_engine = create_async_engine(async_url, echo=settings.DB_ECHO, **pool_options(async_url))
+    
+    # 쿼리 수·시간 지표 (비동기 엔진은 내부 동기 엔진에 등록)
+    if settings.METRICS_ENABLED:
+        instrument_engine(new_engine.sync_engine)
+        instrument_pool(new_engine.sync_engine)
+    
+    # 느린 쿼리 로그 + 지문별 집계 + N+1 감지
+    if settings.QUERY_LOG_ENABLED:
+        instrument_query_log(new_engine.sync_engine)
+    
+    return new_engine
+
+
+# 비동기 엔진 (asyncpg) - API 라우트용
+async_engine = create_async_db_engine(settings.DATABASE_URL)
+
+# 동기 엔진 지표·쿼리 로그
+if settings.METRICS_ENABLED:
+    instrument_engine(engine)
+    instrument_pool(engine)
+
+if settings.QUERY_LOG_ENABLED:
+    instrument_query_log(engine)
+
+# 비동기 세션 생성
+# commit 후 속성 접근 시 암묵적 I/O가 발생하지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base 클래스 (모든 모델의 부모)
 Base = declarative_base()
 
@@ -39,14 +165,64 @@ def get_db():
         db.close()
 
 
-# 데이터베이스 초기화 함수
-def init_db():
+# 의존성 주입용 비동기 DB 세션
+async def get_async_db():
     """
-    데이터베이스 테이블 생성
+    비동기 데이터베이스 세션 생성 및 종료
+    FastAPI Depends에서 사용
     """
-    # 모든 모델 import (테이블 생성을 위해)
-    from app.models.user import User
-    from app.models.book import Book
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# 커넥션 풀 상태
+def pool_stats() -> dict:
+    """
+    현재 워커의 커넥션 풀 상태
+    
+    Returns:
+        dict: 풀 모드와 동기·비동기 엔진별 풀 상태
+    """
+    return {
+        "mode": settings.DB_POOL_MODE,
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.sync_engine.pool),
+    }
+
+
+# 스키마 리비전 확인
+async def check_schema_revision() -> None:
+    """
+    DB 스키마 리비전 확인
+    
+    스키마는 Alembic 마이그레이션(alembic upgrade head)이 관리하므로
+    서버 시작 시에는 테이블을 만들지 않고 리비전이 head와 같은지만 확인한다.
+    
+    Raises:
+        RuntimeError: 리비전이 다를 때 (DB_SCHEMA_CHECK='strict')
+    """
+    if settings.DB_SCHEMA_CHECK == "off":
+        return
+    
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+    
+    script = ScriptDirectory.from_config(Config(ALEMBIC_INI))
+    expected = set(script.get_heads())
+    
+    async with async_engine.connect() as conn:
+        current = set(await conn.run_sync(
+            lambda sync_conn: MigrationContext.configure(sync_conn).get_current_heads()
+        ))
     
-    # 테이블 생성
-    Base.metadata.create_all(bind=engine)
+    if current != expected:
+        message = (
+            f"DB 스키마 리비전 불일치 (현재: {sorted(current) or '없음'}, 필요: {sorted(expected)}) "
+            "- 'alembic upgrade head'를 실행하세요"
+        )
+        if not current:
+            message += " (init_db()로 만든 기존 DB라면 먼저 'alembic stamp 0001')"
+        if settings.DB_SCHEMA_CHECK == "strict":
+            raise RuntimeError(message)
+        print(f"⚠️  {message}")
@@ -0,0 +1,136 @@
+"""
+정적 파일 응답
+ETag 조건부 요청(304)과 단일 구간 Range 요청(206)을 지원하며 파일을 청크 단위로 스트리밍
+
+starlette의 FileResponse는 Range 요청을 지원하지 않아(0.38) 직접 처리한다.
+여러 구간을 요청하면(multipart/byteranges) 전체 파일을 200으로 응답한다.
+"""
+
+import os
+from typing import AsyncIterator, Optional, Tuple
+
+import anyio
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+
+# 파일 읽기 청크 크기 (바이트)
+CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    """요청한 구간이 파일 범위를 벗어남"""
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Range 헤더 해석
+
+    Args:
+        header: Range 헤더 값 (예: 'bytes=0-1023', 'bytes=1024-', 'bytes=-500')
+        size: 파일 크기
+
+    Returns:
+        tuple: (시작, 끝) 바이트 위치 (둘 다 포함) 또는 None (해석할 수 없거나 여러 구간 → 전체 응답)
+
+    Raises:
+        RangeNotSatisfiable: 구간이 파일 범위를 벗어날 때
+    """
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    start_text, dash, end_text = ranges.strip().partition("-")
+    if not dash:
+        return None
+    try:
+        if not start_text:
+            # 끝에서부터 N바이트
+            suffix = int(end_text)
+            if suffix <= 0 or size == 0:
+                raise RangeNotSatisfiable()
+            return max(0, size - suffix), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiable()
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)"""
+    if header.strip() == "*":
+        return True
+    candidates = (value.strip() for value in header.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+async def iter_file(path: str, start: int, end: int, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """파일의 [start, end] 구간을 청크 단위로 읽기 (파일 I/O는 스레드에서)"""
+    remaining = end - start + 1
+    async with await anyio.open_file(path, "rb") as file:
+        await file.seek(start)
+        while remaining > 0:
+            chunk = await file.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_response(
+    request: Request,
+    path: str,
+    media_type: str,
+    etag: str,
+    cache_control: str,
+) -> Response:
+    """
+    파일 응답 (ETag·Range 지원)
+
+    Args:
+        request: 요청 (If-None-Match, Range, If-Range 헤더 확인)
+        path: 파일 경로
+        media_type: Content-Type
+        etag: 따옴표를 포함한 ETag (예: '"ab12..."')
+        cache_control: Cache-Control 헤더 값
+
+    Returns:
+        Response: 200 / 206 / 304 / 416 응답
+
+    Raises:
+        FileNotFoundError: 파일이 없을 때
+    """
+    size = os.stat(path).st_size
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Accept-Ranges": "bytes"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # If-Range가 현재 ETag와 다르면 구간 요청을 무시하고 전체를 보냄
+    if range_header and (if_range is None or if_range.strip() == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers)
+
+    status_code = status.HTTP_200_OK
+    start, end = 0, size - 1
+    if byte_range is not None:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    if request.method == "HEAD":
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+    return StreamingResponse(iter_file(path, start, end), status_code=status_code, headers=headers, media_type=media_type)
@@ -0,0 +1,149 @@
+"""
+비밀번호 해싱 실행기
+bcrypt 연산을 이벤트 루프 밖의 전용 풀에서 수행
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from app.core.config import settings
+from app.core.metrics import observe_password_hash
+from app.core.security import get_password_hash, verify_password
+
+
+class PasswordHasher:
+    """
+    비동기 비밀번호 해싱 서비스
+
+    bcrypt는 요청 하나당 수십~수백 ms의 CPU를 사용하므로
+    async 엔드포인트에서 직접 호출하면 이벤트 루프 전체가 멈춘다.
+    전용 스레드/프로세스 풀에서 실행하고, 동시 실행 수를 세마포어로 제한한다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_concurrency: int,
+        executor_type: str = "thread",
+        latency_window: int = 1024,
+    ):
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.executor_type = executor_type
+
+        self._executor: Optional[Executor] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # 지표
+        self.waiting = 0  # 세마포어 대기 중인 요청 수 (큐 깊이)
+        self.in_flight = 0  # 풀에서 실행 중인 요청 수
+        self.completed = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+        self._latencies: deque = deque(maxlen=latency_window)
+
+    def _get_executor(self) -> Executor:
+        """풀 지연 생성 (import 시점에 프로세스를 띄우지 않기 위함)"""
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return self._executor
+
+    async def _run(self, operation: str, func: Callable, *args):
+        """세마포어로 동시 실행 수를 제한하며 풀에서 함수 실행"""
+        enqueued_at = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        started_at = time.perf_counter()
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            finished_at = time.perf_counter()
+            self.in_flight -= 1
+            self._semaphore.release()
+
+            self.completed += 1
+            self.total_wait_seconds += started_at - enqueued_at
+            self.total_run_seconds += finished_at - started_at
+            self._latencies.append(finished_at - enqueued_at)
+            observe_password_hash(operation, started_at - enqueued_at, finished_at - started_at)
+
+    async def hash(self, password: str) -> str:
+        """
+        비밀번호 해싱
+
+        Args:
+            password: 평문 비밀번호
+
+        Returns:
+            str: 해시된 비밀번호
+        """
+        return await self._run("hash", get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        비밀번호 검증
+
+        Args:
+            plain_password: 평문 비밀번호
+            hashed_password: 해시된 비밀번호
+
+        Returns:
+            bool: 일치 여부
+        """
+        return await self._run("verify", verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        """
+        해싱 지표 조회
+
+        Returns:
+            dict: 큐 깊이, 실행 수, 지연 시간 백분위 (초)
+        """
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            index = min(len(latencies) - 1, int(len(latencies) * p))
+            return latencies[index]
+
+        return {
+            "max_workers": self.max_workers,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.waiting,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "avg_wait_seconds": self.total_wait_seconds / self.completed if self.completed else None,
+            "avg_run_seconds": self.total_run_seconds / self.completed if self.completed else None,
+            "p50_seconds": percentile(0.50),
+            "p99_seconds": percentile(0.99),
+        }
+
+    def shutdown(self) -> None:
+        """풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 전역 해싱 실행기
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+    executor_type=settings.PASSWORD_HASH_EXECUTOR,
+)
@@ -0,0 +1,390 @@
+"""
+Prometheus 지표
+라우트별 지연·상태 코드, 요청당 DB 쿼리 수·시간, 커넥션 풀 대기, bcrypt 해싱 시간, 홈 피드 갱신, LLM 응답, 추천 캐시, 응답 캐시 무효화 실패
+
+멀티 워커(gunicorn/uvicorn --workers)에서는 PROMETHEUS_MULTIPROC_DIR 환경변수를 지정하면
+워커별 값이 공유 디렉터리에 기록되고 /metrics에서 합산된다.
+"""
+
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+# 지연 구간 (초) - API 응답 기준
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 쿼리·풀 대기용 짧은 구간 (초)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# 라우트에 매칭되지 않은 요청은 경로별로 나누지 않음 (레이블 폭증 방지)
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP 요청 수",
+    ["method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "처리 중인 HTTP 요청 수",
+    multiprocess_mode="livesum",
+)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "요청당 실행한 쿼리 수",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "요청당 쿼리 실행 시간 합계",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "쿼리 1건 실행 시간",
+    buckets=DB_BUCKETS,
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "커넥션 풀에서 연결을 얻기까지 대기 시간",
+    ["pool"],
+    buckets=DB_BUCKETS,
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "DB_POOL_TIMEOUT 안에 연결을 얻지 못한 횟수",
+    ["pool"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "사용 중인 연결 수",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "풀 크기를 넘어 추가로 연 연결 수",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+PASSWORD_HASH_WAIT = Histogram(
+    "password_hash_wait_seconds",
+    "bcrypt 실행 전 대기 시간 (동시 실행 제한)",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt 해싱/검증 실행 시간",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+
+HOME_FEED_BUILD_SECONDS = Histogram(
+    "home_feed_build_seconds",
+    "홈 피드 진열대 하나를 다시 만드는 시간",
+    ["shelf"],
+    buckets=LATENCY_BUCKETS,
+)
+HOME_FEED_REFRESH_LAG = Histogram(
+    "home_feed_refresh_lag_seconds",
+    "도서 변경부터 진열대에 반영되기까지 걸린 시간",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+HOME_FEED_AGE = Gauge(
+    "home_feed_age_seconds",
+    "응답한 홈 피드에서 가장 오래된 진열대의 경과 시간",
+    multiprocess_mode="livemostrecent",
+)
+HOME_FEED_STALENESS = Gauge(
+    "home_feed_staleness_seconds",
+    "응답한 홈 피드에 반영되지 않은 가장 오래된 변경의 경과 시간 (0: 최신)",
+    multiprocess_mode="livemostrecent",
+)
+
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "llm_time_to_first_token_seconds",
+    "LLM 요청부터 첫 토큰까지 걸린 시간 (제공자 대기·장애 전환 포함)",
+    ["provider"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 20.0),
+)
+LLM_REQUESTS = Counter(
+    "llm_requests_total",
+    "제공자별 LLM 스트리밍 요청 수",
+    ["provider", "outcome"],  # outcome: success, error, timeout, saturated
+)
+LLM_IN_FLIGHT = Gauge(
+    "llm_requests_in_flight",
+    "제공자별 진행 중인 LLM 스트리밍 요청 수",
+    ["provider"],
+    multiprocess_mode="livesum",
+)
+
+RECOMMEND_CACHE_LOOKUPS = Counter(
+    "recommend_cache_lookups_total",
+    "추천 시맨틱 캐시 조회 수",
+    ["result"],  # hit, miss
+)
+RECOMMEND_CACHE_SIMILARITY = Histogram(
+    "recommend_cache_best_similarity",
+    "캐시 조회에서 가장 가까운 후보의 코사인 유사도 (임계값 조정용)",
+    buckets=(0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.92, 0.94, 0.96, 0.98, 1.0),
+)
+RECOMMEND_CACHE_ENTRIES = Gauge(
+    "recommend_cache_entries",
+    "추천 시맨틱 캐시 항목 수",
+    multiprocess_mode="livesum",
+)
+
+RESPONSE_CACHE_INVALIDATION_FAILURES = Counter(
+    "response_cache_invalidation_failures_total",
+    "커밋 후 응답 캐시 태그 무효화에 실패한 횟수 (해당 항목은 TTL까지 이전 값을 응답)",
+)
+
+
+class RequestDBStats:
+    """요청 하나에서 실행된 쿼리 수와 시간"""
+
+    __slots__ = ("scope", "queries", "seconds", "fingerprints")
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.queries = 0
+        self.seconds = 0.0
+        self.fingerprints = None  # 쿼리 지문별 실행 수 (쿼리 로그 사용 시)
+
+
+# 현재 요청의 DB 통계 (요청 밖에서 실행된 쿼리는 None)
+_request_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("request_db_stats", default=None)
+
+
+def current_db_stats() -> Optional[RequestDBStats]:
+    """현재 요청의 DB 통계"""
+    return _request_db_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    DB_QUERY_DURATION.observe(elapsed)
+
+    stats = _request_db_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += elapsed
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        conn.info["query_started_at"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    엔진 쿼리 지표 수집 등록
+
+    비동기 엔진은 async_engine.sync_engine을 넘긴다.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class TimedPoolMixin:
+    """
+    연결 획득 대기 시간 측정
+
+    SQLAlchemy 풀 이벤트에는 '획득 시작' 시점이 없으므로 풀 클래스의 _do_get을 감싼다.
+    engine.dispose()로 풀이 다시 만들어져도 같은 클래스가 사용된다.
+    NullPool은 매번 새로 연결하므로 대기 시간이 곧 연결 시간이다.
+    """
+
+    # 풀 인스턴스별 누적값 (pool_status에서 사용)
+    waits = 0
+    wait_seconds = 0.0
+    max_wait_seconds = 0.0
+    timeouts = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            DB_POOL_TIMEOUTS.labels(type(self).__name__).inc()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.waits += 1
+            self.wait_seconds += elapsed
+            self.max_wait_seconds = max(self.max_wait_seconds, elapsed)
+            DB_POOL_CHECKOUT_WAIT.labels(type(self).__name__).observe(elapsed)
+
+
+def timed_pool_class(pool_class: type) -> type:
+    """
+    풀 클래스에 대기 시간 측정을 붙인 클래스
+
+    Args:
+        pool_class: 풀 클래스 (예: AsyncAdaptedQueuePool, NullPool)
+
+    Returns:
+        type: 풀 클래스 (예: TimedAsyncAdaptedQueuePool)
+    """
+    return type(f"Timed{pool_class.__name__}", (TimedPoolMixin, pool_class), {})
+
+
+def _update_pool_gauges(pool: Pool, checked_out_delta: int) -> None:
+    name = type(pool).__name__
+    DB_POOL_CHECKED_OUT.labels(name).inc(checked_out_delta)
+    if isinstance(pool, QueuePool):
+        DB_POOL_OVERFLOW.labels(name).set(max(0, pool.overflow()))
+
+
+def instrument_pool(engine: Engine) -> None:
+    """
+    커넥션 풀 사용량 지표 등록 (사용 중 연결 수, 오버플로)
+
+    엔진에 등록한 풀 이벤트는 engine.dispose()로 다시 만든 풀에도 유지된다.
+    """
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        _update_pool_gauges(engine.pool, 1)
+
+    def on_checkin(dbapi_connection, connection_record):
+        _update_pool_gauges(engine.pool, -1)
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+
+
+def pool_status(pool: Pool) -> dict:
+    """
+    커넥션 풀 상태
+
+    Args:
+        pool: 엔진의 풀 (engine.pool)
+
+    Returns:
+        dict: 풀 클래스, 크기·사용 중·유휴·오버플로 연결 수, 획득 대기 시간 통계
+    """
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    if isinstance(pool, TimedPoolMixin):
+        status.update(
+            waits=pool.waits,
+            avg_wait_ms=pool.wait_seconds / pool.waits * 1000 if pool.waits else 0.0,
+            max_wait_ms=pool.max_wait_seconds * 1000,
+            timeouts=pool.timeouts,
+        )
+    return status
+
+
+class MetricsMiddleware:
+    """
+    요청 지표 수집 ASGI 미들웨어
+
+    BaseHTTPMiddleware를 거치지 않는 순수 ASGI 미들웨어라 요청당 추가 비용이 작다.
+    라우트 레이블은 실제 경로가 아닌 경로 템플릿(예: /api/v1/books/{book_id})을 사용한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestDBStats(scope)
+        token = _request_db_stats.set(stats)
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            _request_db_stats.reset(token)
+
+            route = scope.get("route")
+            route_path = getattr(route, "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+
+            HTTP_REQUESTS.labels(method, route_path, str(status_code)).inc()
+            HTTP_LATENCY.labels(method, route_path).observe(elapsed)
+            DB_QUERIES_PER_REQUEST.labels(route_path).observe(stats.queries)
+            DB_TIME_PER_REQUEST.labels(route_path).observe(stats.seconds)
+
+
+def observe_password_hash(operation: str, wait_seconds: float, run_seconds: float) -> None:
+    """bcrypt 대기·실행 시간 기록"""
+    PASSWORD_HASH_WAIT.labels(operation).observe(wait_seconds)
+    PASSWORD_HASH_DURATION.labels(operation).observe(run_seconds)
+
+
+def render_metrics() -> tuple:
+    """
+    /metrics 응답 본문 생성
+
+    Returns:
+        tuple: (본문, Content-Type)
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """워커 종료 시 멀티프로세스 live 게이지 정리"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,266 @@
+"""
+쿼리 로그
+느린 쿼리 로그(샘플링), 쿼리 지문(fingerprint)별 집계, N+1 패턴 감지, 선택적 EXPLAIN 수집
+
+SQLAlchemy 엔진의 before/after_cursor_execute 이벤트로 동작한다.
+요청 단위 N+1 감지는 MetricsMiddleware가 만든 요청별 DB 통계를 사용한다.
+"""
+
+import hashlib
+import logging
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+from prometheus_client import Counter
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.metrics import current_db_stats
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERIES = Counter("db_slow_queries_total", "임계값을 넘은 쿼리 수")
+N_PLUS_ONE = Counter("db_n_plus_one_total", "같은 쿼리를 반복 실행한 요청 수 (N+1 의심)", ["route"])
+
+# 지문 정규화 패턴
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_POSTCOMPILE = re.compile(r"\(?__\[POSTCOMPILE_\w+\]\)?")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*(?:\((?:[^()]*)\)\s*,?\s*)+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+# EXPLAIN 대상 (EXPLAIN은 ANALYZE 없이 실행하므로 문장을 실제로 수행하지 않음)
+_EXPLAINABLE = ("SELECT", "WITH")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> Tuple[str, str]:
+    """
+    쿼리 지문 계산
+
+    리터럴·바인드 파라미터·IN 목록 길이를 지워, 값만 다른 쿼리를 같은 지문으로 묶는다.
+    SQLAlchemy는 같은 문장 문자열을 재사용하므로 결과를 캐시한다.
+
+    Args:
+        statement: SQL 문장
+
+    Returns:
+        tuple: (지문 ID, 정규화된 문장)
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _POSTCOMPILE.sub("(?)", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (?)", normalized)
+    normalized = _VALUES_LIST.sub("VALUES (?) ", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12], normalized
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    """
+    바인드 파라미터의 형태 (값 대신 타입 이름)
+
+    로그에 개인정보·비밀번호 해시 같은 실제 값이 남지 않도록 한다.
+    """
+    if executemany:
+        rows = list(parameters or [])
+        return f"{len(rows)} rows of {parameter_shape(rows[0]) if rows else '-'}"
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+class QueryStats:
+    """
+    지문별 쿼리 집계 (최대 개수를 넘으면 가장 오래 안 쓰인 지문부터 제거)
+
+    각 지문에서 가장 느렸던 실행의 파라미터 형태와 (수집 시) 실행 계획을 함께 보관한다.
+    """
+
+    def __init__(self, max_fingerprints: int):
+        self.max_fingerprints = max_fingerprints
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, fp: str, normalized: str, elapsed: float, shape_source: Tuple[Any, bool]) -> dict:
+        """
+        실행 1건 기록
+
+        Args:
+            fp: 지문 ID
+            normalized: 정규화된 문장
+            elapsed: 실행 시간 (초)
+            shape_source: (파라미터, executemany 여부) - 최댓값 갱신 시에만 형태 계산
+
+        Returns:
+            dict: 지문 항목
+        """
+        with self._lock:
+            entry = self._entries.get(fp)
+            if entry is None:
+                entry = self._entries[fp] = {
+                    "fingerprint": fp,
+                    "statement": normalized,
+                    "count": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "slow_count": 0,
+                    "n_plus_one_requests": 0,
+                    "parameter_shape": None,
+                    "plan": None,
+                    "plan_captured_at": None,
+                }
+            self._entries.move_to_end(fp)
+            while len(self._entries) > self.max_fingerprints:
+                self._entries.popitem(last=False)
+
+            entry["count"] += 1
+            entry["total_seconds"] += elapsed
+            if elapsed > entry["max_seconds"]:
+                entry["max_seconds"] = elapsed
+                entry["parameter_shape"] = parameter_shape(*shape_source)
+            return entry
+
+    def top(self, limit: int = 20, sort: str = "total") -> List[dict]:
+        """
+        상위 지문 조회
+
+        Args:
+            limit: 개수
+            sort: 'total'(누적 시간), 'max'(최대 시간), 'count'(실행 수), 'n_plus_one'
+
+        Returns:
+            list: 지문 항목 (평균 시간 포함)
+        """
+        key = {
+            "total": "total_seconds",
+            "max": "max_seconds",
+            "count": "count",
+            "n_plus_one": "n_plus_one_requests",
+        }[sort]
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda e: e[key], reverse=True)[:limit]
+            return [
+                {**entry, "avg_seconds": entry["total_seconds"] / entry["count"]}
+                for entry in entries
+            ]
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+
+# 전역 쿼리 집계
+query_stats = QueryStats(max_fingerprints=settings.QUERY_STATS_MAX_FINGERPRINTS)
+
+
+def _capture_plan(conn, statement: str, parameters: Any) -> Optional[str]:
+    """
+    같은 연결에서 EXPLAIN 실행 (별도 DBAPI 커서 사용, 엔진 이벤트는 발생하지 않음)
+
+    PostgreSQL은 EXPLAIN 실패가 진행 중인 트랜잭션을 깨뜨리지 않도록 SAVEPOINT 안에서 실행한다.
+    """
+    is_postgres = conn.dialect.name == "postgresql"
+    prefix = "EXPLAIN " if is_postgres else "EXPLAIN QUERY PLAN "
+
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        if is_postgres:
+            cursor.execute("SAVEPOINT query_log_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        except Exception:
+            if is_postgres:
+                cursor.execute("ROLLBACK TO SAVEPOINT query_log_explain")
+            return None
+        if is_postgres:
+            cursor.execute("RELEASE SAVEPOINT query_log_explain")
+        return "\n".join(" | ".join(str(value) for value in row) for row in rows)
+    except Exception:
+        return None
+    finally:
+        cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_log_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_log_started_at"].pop()
+    fp, normalized = fingerprint(statement)
+    entry = query_stats.record(fp, normalized, elapsed, (parameters, executemany))
+
+    # 요청 안에서 같은 지문이 N번째 실행되는 순간 한 번만 경고
+    request_stats = current_db_stats()
+    if request_stats is not None:
+        if request_stats.fingerprints is None:
+            request_stats.fingerprints = {}
+        repeats = request_stats.fingerprints.get(fp, 0) + 1
+        request_stats.fingerprints[fp] = repeats
+
+        if repeats == settings.N_PLUS_ONE_THRESHOLD:
+            route = getattr(request_stats.scope.get("route"), "path", request_stats.scope.get("path"))
+            entry["n_plus_one_requests"] += 1
+            N_PLUS_ONE.labels(route).inc()
+            logger.warning(
+                "N+1 의심: %s %s 요청에서 같은 쿼리를 %d회 이상 실행 [fp=%s] %s",
+                request_stats.scope.get("method"), route, repeats, fp, normalized,
+            )
+
+    if elapsed * 1000 < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    entry["slow_count"] += 1
+    SLOW_QUERIES.inc()
+    if random.random() < settings.SLOW_QUERY_LOG_SAMPLE_RATE:
+        logger.warning(
+            "느린 쿼리 %.1fms [fp=%s] params=%s %s",
+            elapsed * 1000, fp, parameter_shape(parameters, executemany), normalized,
+        )
+
+    # 가장 느린 지문의 실행 계획 수집 (지문당 SLOW_QUERY_EXPLAIN_INTERVAL 간격)
+    if (
+        settings.SLOW_QUERY_EXPLAIN
+        and not executemany
+        and elapsed >= entry["max_seconds"]
+        and statement.lstrip().upper().startswith(_EXPLAINABLE)
+        and (
+            entry["plan_captured_at"] is None
+            or time.time() - entry["plan_captured_at"] >= settings.SLOW_QUERY_EXPLAIN_INTERVAL
+        )
+    ):
+        entry["plan_captured_at"] = time.time()
+        entry["plan"] = _capture_plan(conn, statement, parameters)
+        if entry["plan"]:
+            logger.warning("실행 계획 [fp=%s]\n%s", fp, entry["plan"])
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_log_started_at"):
+        conn.info["query_log_started_at"].pop()
+
+
+def instrument_query_log(engine: Engine) -> None:
+    """
+    엔진 쿼리 로그 등록
+
+    비동기 엔진은 async_engine.sync_engine을 넘긴다.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
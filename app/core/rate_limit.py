@@ -0,0 +1,193 @@
+"""
+요청 제한 (토큰 버킷)
+로그인 시도 폭주(크리덴셜 스터핑)를 DB 조회·bcrypt 검증 전에 차단
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+
+class MemoryTokenBucket:
+    """
+    인메모리 토큰 버킷 (워커별)
+
+    키마다 (남은 토큰, 마지막 갱신 시각)만 저장하고,
+    키 수가 최대치를 넘으면 가장 오래 쓰이지 않은 키부터 제거한다.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, max_keys: int):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.max_keys = max_keys
+
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def consume(self, key: str) -> float:
+        """
+        토큰 1개 사용
+
+        Args:
+            key: 버킷 키
+
+        Returns:
+            float: 0이면 허용, 양수면 다음 토큰까지 남은 시간 (초)
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_per_second)
+
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0.0
+            else:
+                retry_after = (1 - tokens) / self.refill_per_second
+
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        return retry_after
+
+    async def reset(self, key: str) -> None:
+        """버킷 초기화"""
+        with self._lock:
+            self._buckets.pop(key, None)
+
+
+class RedisTokenBucket:
+    """Redis 토큰 버킷 (모든 워커가 공유, Lua 스크립트로 원자적 처리)"""
+
+    PREFIX = "ratelimit:"
+
+    # KEYS[1]: 버킷 키 / ARGV: 용량, 초당 충전량, 현재 시각(ms)
+    SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + (now - ts) / 1000 * rate)
+    local retry_ms = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+    else
+        retry_ms = math.ceil((1 - tokens) / rate * 1000)
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+    return retry_ms
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._script = None
+
+    async def consume(self, key: str) -> float:
+        if self._script is None:
+            self._script = get_redis().register_script(self.SCRIPT)
+        retry_ms = await self._script(
+            keys=[self.PREFIX + key],
+            args=[self.capacity, self.refill_per_second, int(time.time() * 1000)],
+        )
+        return int(retry_ms) / 1000
+
+    async def reset(self, key: str) -> None:
+        await get_redis().delete(self.PREFIX + key)
+
+
+class LoginThrottle:
+    """
+    로그인 시도 제한
+
+    IP별·이메일별 버킷에서 시도마다 토큰을 하나씩 사용한다.
+    - IP 버킷: 한 곳에서 여러 계정을 대입하는 공격 차단
+    - 이메일 버킷: 여러 곳에서 한 계정을 대입하는 공격 차단
+    차단된 시도는 DB 조회와 bcrypt 검증을 하지 않으므로, 차단 수 x 평균 검증 시간만큼 CPU를 아낀다.
+    """
+
+    def __init__(self, ip_bucket, email_bucket):
+        self.ip_bucket = ip_bucket
+        self.email_bucket = email_bucket
+
+        # 지표
+        self.allowed = 0
+        self.blocked_ip = 0
+        self.blocked_email = 0
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        # 원문 이메일을 키로 남기지 않음
+        digest = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return f"login:email:{digest}"
+
+    async def check(self, ip: Optional[str], email: str) -> float:
+        """
+        로그인 시도 허용 여부 확인
+
+        Args:
+            ip: 클라이언트 IP
+            email: 로그인 이메일
+
+        Returns:
+            float: 0이면 허용, 양수면 재시도까지 남은 시간 (초)
+        """
+        retry_after = await self.ip_bucket.consume(f"login:ip:{ip or 'unknown'}")
+        if retry_after > 0:
+            self.blocked_ip += 1
+            return retry_after
+
+        retry_after = await self.email_bucket.consume(self._email_key(email))
+        if retry_after > 0:
+            self.blocked_email += 1
+            return retry_after
+
+        self.allowed += 1
+        return 0.0
+
+    async def reset_email(self, email: str) -> None:
+        """로그인 성공 시 이메일 버킷 초기화 (정상 사용자가 연달아 막히지 않도록)"""
+        await self.email_bucket.reset(self._email_key(email))
+
+    def stats(self, avg_verify_seconds: Optional[float] = None) -> dict:
+        """
+        제한 지표 조회
+
+        Args:
+            avg_verify_seconds: 비밀번호 검증 1회 평균 시간 (절약한 CPU 시간 추정용)
+
+        Returns:
+            dict: 허용/차단 수, 절약한 해싱 횟수와 추정 시간
+        """
+        blocked = self.blocked_ip + self.blocked_email
+        return {
+            "allowed": self.allowed,
+            "blocked_ip": self.blocked_ip,
+            "blocked_email": self.blocked_email,
+            "hashes_saved": blocked,
+            "hash_seconds_saved": blocked * avg_verify_seconds if avg_verify_seconds else None,
+        }
+
+
+def _create_bucket(capacity: int, per_minute: float):
+    refill_per_second = per_minute / 60
+    if settings.LOGIN_THROTTLE_BACKEND == "redis":
+        return RedisTokenBucket(capacity, refill_per_second)
+    return MemoryTokenBucket(capacity, refill_per_second, settings.LOGIN_THROTTLE_MAX_KEYS)
+
+
+# 전역 로그인 제한기
+login_throttle = LoginThrottle(
+    ip_bucket=_create_bucket(settings.LOGIN_THROTTLE_IP_CAPACITY, settings.LOGIN_THROTTLE_IP_PER_MINUTE),
+    email_bucket=_create_bucket(settings.LOGIN_THROTTLE_EMAIL_CAPACITY, settings.LOGIN_THROTTLE_EMAIL_PER_MINUTE),
+)
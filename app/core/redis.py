@@ -0,0 +1,62 @@
+"""
+Redis 클라이언트
+REDIS_URL 기반 비동기 클라이언트와 동기 클라이언트 (필요할 때만 생성)
+"""
+
+from app.core.config import settings
+
+# 동기 클라이언트 연결·응답 제한 시간 (초) - 이벤트 루프를 막는 시간의 상한
+SYNC_TIMEOUT_SECONDS = 0.5
+
+_client = None
+_sync_client = None
+
+
+def get_redis():
+    """
+    공유 Redis 클라이언트 반환
+
+    redis 패키지는 Redis 백엔드를 사용하는 경우에만 import한다.
+
+    Returns:
+        redis.asyncio.Redis: 비동기 Redis 클라이언트
+    """
+    global _client
+    if _client is None:
+        import redis.asyncio as aioredis
+
+        _client = aioredis.from_url(settings.REDIS_URL)
+    return _client
+
+
+def get_sync_redis():
+    """
+    공유 동기 Redis 클라이언트 반환
+
+    세션 이벤트(after_commit)처럼 await할 수 없는 곳에서 바로 실행해야 하는 짧은 명령용.
+    이벤트 루프 안에서 호출하면 왕복 시간만큼 루프를 막으므로 SYNC_TIMEOUT_SECONDS로 제한한다.
+
+    Returns:
+        redis.Redis: 동기 Redis 클라이언트
+    """
+    global _sync_client
+    if _sync_client is None:
+        import redis
+
+        _sync_client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=SYNC_TIMEOUT_SECONDS,
+            socket_connect_timeout=SYNC_TIMEOUT_SECONDS,
+        )
+    return _sync_client
+
+
+async def close_redis() -> None:
+    """Redis 연결 종료"""
+    global _client, _sync_client
+    if _client is not None:
+        await _client.close()
+        _client = None
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
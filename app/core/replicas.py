@@ -0,0 +1,313 @@
+"""
+읽기 전용 복제본 라우팅
+get_read_db 의존성이 정상 상태인 복제본을 라운드 로빈으로 골라 세션을 열고,
+사용할 수 있는 복제본이 없으면 주 DB 세션을 연다.
+
+- 상태 확인: DB_REPLICA_HEALTH_CHECK_SECONDS 간격으로 확인 (PostgreSQL은 복제 지연도 확인)
+- 연결 실패: 해당 복제본을 바로 제외하고 같은 요청은 다음 복제본 또는 주 DB로 처리
+- 쓰기 후 읽기 일관성: 커밋한 요청의 응답에 쿠키를 붙여 DB_READ_YOUR_WRITES_SECONDS 동안
+  같은 클라이언트의 읽기를 주 DB로 보낸다 (워커 간 공유 저장소 없이 동작)
+
+복제본 목록이 비어 있으면 get_read_db는 get_async_db와 같다.
+조회 결과를 캐시에 저장하는 라우트(응답 캐시·사용자 캐시)는 복제 지연된 값을 TTL 동안
+다시 저장하지 않도록 get_read_db 대신 주 DB(get_async_db)를 사용한다.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from typing import List, Optional
+
+from prometheus_client import Counter
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, create_async_db_engine
+
+logger = logging.getLogger(__name__)
+
+READ_SESSIONS = Counter(
+    "db_read_sessions_total",
+    "get_read_db 세션 수 (replica: 복제본, primary: 복제본 미사용·쓰기 직후, fallback: 복제본 장애로 주 DB)",
+    ["target"],
+)
+
+# 쓰기 후 읽기 일관성 쿠키 (값: 주 DB를 써야 하는 만료 시각, epoch 초)
+READ_YOUR_WRITES_COOKIE = "chaekmate_rw"
+
+# 상태 확인 쿼리 제한 시간 (초)
+HEALTH_CHECK_TIMEOUT = 2.0
+
+# PostgreSQL 복제 지연 (받은 WAL을 모두 재생했으면 0, 주 DB에서 실행하면 0)
+REPLICATION_LAG_SQL = text("""
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+""")
+
+_WROTE_KEY = "read_your_writes_wrote"
+
+
+class ReadConsistency:
+    """요청 하나의 읽기 일관성 상태"""
+
+    __slots__ = ("prefer_primary", "wrote")
+
+    def __init__(self, prefer_primary: bool):
+        self.prefer_primary = prefer_primary  # 최근에 쓴 클라이언트 → 읽기도 주 DB
+        self.wrote = False  # 이 요청에서 커밋한 쓰기가 있음
+
+
+_read_consistency: ContextVar[Optional[ReadConsistency]] = ContextVar("read_consistency", default=None)
+
+
+class Replica:
+    """복제본 하나 (엔진 + 상태)"""
+
+    def __init__(self, url: str):
+        self.name = make_url(url).render_as_string(hide_password=True)
+        self.engine = create_async_db_engine(url)
+        self.sessionmaker = async_sessionmaker(
+            bind=self.engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        self.healthy = True
+        self.lag_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.checked_at: Optional[float] = None
+        self.sessions = 0
+
+    def mark_down(self, error: str) -> None:
+        if self.healthy:
+            logger.warning("DB 복제본 제외: %s (%s)", self.name, error)
+        self.healthy = False
+        self.last_error = error
+
+    def mark_up(self, lag_seconds: float) -> None:
+        if not self.healthy:
+            logger.warning("DB 복제본 복구: %s", self.name)
+        self.healthy = True
+        self.lag_seconds = lag_seconds
+        self.last_error = None
+
+
+class ReplicaRouter:
+    """
+    읽기 세션 라우터
+
+    상태 확인은 세션을 열 때 주기가 지났으면 시작한다.
+    최초 확인만 기다리고, 이후에는 백그라운드에서 실행해 요청을 지연시키지 않는다.
+    """
+
+    def __init__(self, urls: List[str], health_check_seconds: float, max_lag_seconds: float):
+        self.replicas = [Replica(url) for url in urls]
+        self.health_check_seconds = health_check_seconds
+        self.max_lag_seconds = max_lag_seconds
+
+        self._next = 0
+        self._checked_at: Optional[float] = None
+        self._check_task: Optional[asyncio.Task] = None
+
+    async def _check(self, replica: Replica) -> None:
+        """복제본 하나 상태 확인"""
+        try:
+            async with replica.engine.connect() as conn:
+                if conn.dialect.name == "postgresql":
+                    lag = float(await asyncio.wait_for(conn.scalar(REPLICATION_LAG_SQL), HEALTH_CHECK_TIMEOUT))
+                else:
+                    await asyncio.wait_for(conn.execute(text("SELECT 1")), HEALTH_CHECK_TIMEOUT)
+                    lag = 0.0
+        except (DBAPIError, OSError, asyncio.TimeoutError) as exc:
+            replica.mark_down(f"{type(exc).__name__}: {exc}".splitlines()[0])
+        else:
+            if lag > self.max_lag_seconds:
+                replica.lag_seconds = lag
+                replica.mark_down(f"복제 지연 {lag:.1f}s")
+            else:
+                replica.mark_up(lag)
+        replica.checked_at = time.time()
+
+    async def check_health(self) -> None:
+        """모든 복제본 상태 확인"""
+        self._checked_at = time.monotonic()
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    async def _maybe_check_health(self) -> None:
+        if self._checked_at is None:
+            await self.check_health()
+            return
+
+        due = time.monotonic() - self._checked_at >= self.health_check_seconds
+        if due and (self._check_task is None or self._check_task.done()):
+            self._checked_at = time.monotonic()
+            self._check_task = asyncio.create_task(self.check_health())
+
+    def _pick(self) -> Optional[Replica]:
+        """정상 복제본 라운드 로빈"""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if replica.healthy:
+                return replica
+        return None
+
+    async def open_session(self) -> AsyncSession:
+        """
+        읽기 세션 열기
+
+        복제본 세션은 연결까지 확인한 뒤 돌려주므로, 연결 실패는 라우트가 아닌 여기서 처리된다.
+
+        Returns:
+            AsyncSession: 복제본 또는 주 DB 세션
+        """
+        consistency = _read_consistency.get()
+        if not self.replicas or (consistency is not None and consistency.prefer_primary):
+            READ_SESSIONS.labels("primary").inc()
+            return AsyncSessionLocal()
+
+        await self._maybe_check_health()
+
+        while (replica := self._pick()) is not None:
+            session = replica.sessionmaker()
+            try:
+                await session.connection()
+            except (DBAPIError, OSError) as exc:
+                await session.close()
+                replica.mark_down(f"{type(exc).__name__}: {exc}".splitlines()[0])
+                continue
+            replica.sessions += 1
+            READ_SESSIONS.labels("replica").inc()
+            return session
+
+        READ_SESSIONS.labels("fallback").inc()
+        return AsyncSessionLocal()
+
+    async def dispose(self) -> None:
+        """복제본 엔진 종료"""
+        if self._check_task is not None:
+            self._check_task.cancel()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> list:
+        """
+        복제본 상태 조회
+
+        Returns:
+            list: 복제본별 URL(비밀번호 제외), 정상 여부, 복제 지연, 마지막 오류, 세션 수
+        """
+        return [
+            {
+                "url": replica.name,
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag_seconds,
+                "last_error": replica.last_error,
+                "checked_at": replica.checked_at,
+                "sessions": replica.sessions,
+            }
+            for replica in self.replicas
+        ]
+
+
+# 전역 복제본 라우터
+replica_router = ReplicaRouter(
+    settings.replica_urls_list,
+    health_check_seconds=settings.DB_REPLICA_HEALTH_CHECK_SECONDS,
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+)
+
+
+# 의존성 주입용 읽기 전용 비동기 DB 세션
+async def get_read_db():
+    """
+    읽기 전용 비동기 DB 세션 (복제본 우선)
+    FastAPI Depends에서 사용 - 쓰기에는 get_async_db를 사용
+    """
+    async with await replica_router.open_session() as db:
+        yield db
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 후 읽기 일관성 ASGI 미들웨어
+
+    요청 쿠키로 주 DB 읽기 여부를 정하고, 요청에서 커밋이 있었으면 응답에 쿠키를 붙인다.
+    """
+
+    def __init__(self, app, window_seconds: float):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    @staticmethod
+    def _recently_wrote(scope) -> bool:
+        for name, value in scope["headers"]:
+            if name != b"cookie":
+                continue
+            morsel = SimpleCookie(value.decode("latin-1")).get(READ_YOUR_WRITES_COOKIE)
+            if morsel is None:
+                continue
+            # Max-Age를 무시하는 클라이언트를 위해 값의 만료 시각도 확인
+            try:
+                return float(morsel.value) > time.time()
+            except ValueError:
+                return False
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        consistency = ReadConsistency(prefer_primary=self._recently_wrote(scope))
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and consistency.wrote:
+                until = time.time() + self.window_seconds
+                cookie = (
+                    f"{READ_YOUR_WRITES_COOKIE}={until:.3f}; Max-Age={math.ceil(self.window_seconds)}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        token = _read_consistency.set(consistency)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _read_consistency.reset(token)
+
+
+# ========== 쓰기 감지 (세션 이벤트) ==========
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_write(session: Session, flush_context) -> None:
+    session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_write(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _record_committed_write(session: Session) -> None:
+    if session.info.pop(_WROTE_KEY, False):
+        consistency = _read_consistency.get()
+        if consistency is not None:
+            consistency.wrote = True
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_write(session: Session) -> None:
+    session.info.pop(_WROTE_KEY, None)
@@ -0,0 +1,364 @@
+"""
+응답 캐시
+읽기 전용 라우트의 직렬화된 응답을 공유 캐시(Redis 또는 인메모리)에 저장
+
+- 키: 라우트 + 정렬된 쿼리 파라미터
+- 라우트별 TTL, 태그 기반 무효화 (ORM 커밋 시에는 응답 전에 동기로 처리)
+- 태그별 세대 번호: 계산 중에 무효화된 태그가 있으면 계산 결과를 저장하지 않음 (이전 값 재저장 방지)
+- 만료 시 single-flight(프로세스 내) + 분산 락(워커 간)으로 한 요청만 재계산
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+from urllib.parse import urlencode
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import RESPONSE_CACHE_INVALIDATION_FAILURES
+from app.core.redis import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryCacheBackend:
+    """인메모리 캐시 백엔드 (단일 워커·테스트용)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._values = TTLCache(max_size=max_size, ttl_seconds=0)
+        self._tags: Dict[str, Set[str]] = defaultdict(set)
+        self._generations: Dict[str, int] = defaultdict(int)
+        self._locks: Dict[str, float] = {}
+        # 동기 세션(스레드 풀)의 커밋 이벤트에서도 무효화하므로 세대 확인·저장과 무효화를 직렬화
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._values.get(key)
+
+    async def generations(self, tags: Iterable[str]) -> List[str]:
+        return [str(self._generations[tag]) for tag in tags]
+
+    async def set(self, key: str, value: bytes, ttl: int, tags: Iterable[str], generations: List[str]) -> bool:
+        tags = list(tags)
+        with self._lock:
+            if [str(self._generations[tag]) for tag in tags] != generations:
+                return False
+            self._values.set(key, value, ttl_seconds=ttl)
+            for tag in tags:
+                keys = self._tags[tag]
+                keys.add(key)
+                # 만료·제거된 키가 태그 집합에 쌓이지 않도록 정리
+                if len(keys) > self.max_size:
+                    keys.intersection_update(k for k in list(keys) if k in self._values)
+        return True
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        return self.invalidate_tags_sync(tags)
+
+    def invalidate_tags_sync(self, tags: Iterable[str]) -> int:
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] += 1
+                for key in self._tags.pop(tag, set()):
+                    self._values.delete(key)
+                    removed += 1
+        return removed
+
+    async def acquire_lock(self, key: str, ttl: float) -> bool:
+        now = time.monotonic()
+        expires_at = self._locks.get(key)
+        if expires_at is not None and expires_at > now:
+            return False
+        self._locks[key] = now + ttl
+        return True
+
+    async def release_lock(self, key: str) -> None:
+        self._locks.pop(key, None)
+
+
+class RedisCacheBackend:
+    """Redis 캐시 백엔드 (모든 워커가 공유)"""
+
+    PREFIX = "resp:"
+
+    # KEYS: 태그 집합 키 n개 + 세대 키 n개 / ARGV[1]: 항목 키 접두사
+    # 태그별 세대 증가·SMEMBERS·DEL을 한 번의 왕복으로 처리 (동기 클라이언트가 이벤트 루프를 막는 시간 최소화)
+    INVALIDATE_SCRIPT = """
+    local n = #KEYS / 2
+    local removed = 0
+    for i = 1, n do
+        redis.call('INCR', KEYS[n + i])
+        for _, key in ipairs(redis.call('SMEMBERS', KEYS[i])) do
+            removed = removed + redis.call('DEL', ARGV[1] .. key)
+        end
+        redis.call('DEL', KEYS[i])
+    end
+    return removed
+    """
+
+    # KEYS: 항목 키 + 태그 집합 키 n개 + 세대 키 n개
+    # ARGV: 값, TTL, 항목 키(접두사 제외), 계산 전 세대 n개
+    # 세대 확인과 저장이 원자적이므로 확인 직후의 무효화도 놓치지 않음
+    SET_SCRIPT = """
+    local n = (#KEYS - 1) / 2
+    for i = 1, n do
+        if (redis.call('GET', KEYS[1 + n + i]) or '0') ~= ARGV[3 + i] then
+            return 0
+        end
+    end
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+    for i = 1, n do
+        redis.call('SADD', KEYS[1 + i], ARGV[3])
+        -- 태그 집합은 가장 긴 항목 TTL보다 조금 더 유지
+        redis.call('EXPIRE', KEYS[1 + i], ARGV[2] * 2)
+    end
+    return 1
+    """
+
+    def __init__(self):
+        self._invalidate_script = None
+        self._invalidate_script_sync = None
+        self._set_script = None
+
+    def _tag_keys(self, tags: Iterable[str]) -> List[str]:
+        return [f"{self.PREFIX}tag:{tag}" for tag in tags]
+
+    def _generation_keys(self, tags: Iterable[str]) -> List[str]:
+        return [f"{self.PREFIX}gen:{tag}" for tag in tags]
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await get_redis().get(self.PREFIX + key)
+
+    async def generations(self, tags: Iterable[str]) -> List[str]:
+        tags = list(tags)
+        if not tags:
+            return []
+        values = await get_redis().mget(self._generation_keys(tags))
+        return [(value or b"0").decode() for value in values]
+
+    async def set(self, key: str, value: bytes, ttl: int, tags: Iterable[str], generations: List[str]) -> bool:
+        tags = list(tags)
+        if self._set_script is None:
+            self._set_script = get_redis().register_script(self.SET_SCRIPT)
+        stored = await self._set_script(
+            keys=[self.PREFIX + key, *self._tag_keys(tags), *self._generation_keys(tags)],
+            args=[value, ttl, key, *generations],
+        )
+        return bool(stored)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tags = list(tags)
+        if self._invalidate_script is None:
+            self._invalidate_script = get_redis().register_script(self.INVALIDATE_SCRIPT)
+        return int(await self._invalidate_script(
+            keys=[*self._tag_keys(tags), *self._generation_keys(tags)], args=[self.PREFIX]
+        ))
+
+    def invalidate_tags_sync(self, tags: Iterable[str]) -> int:
+        tags = list(tags)
+        if self._invalidate_script_sync is None:
+            self._invalidate_script_sync = get_sync_redis().register_script(self.INVALIDATE_SCRIPT)
+        return int(self._invalidate_script_sync(
+            keys=[*self._tag_keys(tags), *self._generation_keys(tags)], args=[self.PREFIX]
+        ))
+
+    async def acquire_lock(self, key: str, ttl: float) -> bool:
+        return bool(await get_redis().set(f"{self.PREFIX}lock:{key}", b"1", nx=True, px=int(ttl * 1000)))
+
+    async def release_lock(self, key: str) -> None:
+        await get_redis().delete(f"{self.PREFIX}lock:{key}")
+
+
+class ResponseCache:
+    """
+    응답 캐시
+
+    캐시 미스가 동시에 여러 번 나도 DB 재계산은 한 번만 일어난다.
+    - 같은 워커: 진행 중인 계산(Future)을 함께 기다림
+    - 다른 워커: 분산 락을 잡은 워커만 계산하고, 나머지는 결과가 채워지기를 짧게 기다림
+
+    계산 전에 태그 세대를 읽어 두고, 계산 중에 커밋이 태그를 무효화했으면 결과를 응답으로만 쓰고
+    저장하지 않는다. 커밋 전 스냅샷을 읽은 결과가 TTL 동안 남는 것을 막는다.
+    """
+
+    def __init__(self, backend, lock_timeout: float = 5.0, poll_interval: float = 0.05):
+        self.backend = backend
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # 지표
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # 다른 요청의 계산 결과를 함께 사용한 횟수
+        self.invalidations = 0
+        self.invalidation_failures = 0
+        self.stale_fills = 0  # 계산 중 무효화되어 저장하지 않은 횟수
+
+    @staticmethod
+    def build_key(route: str, params: Dict[str, object]) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            route: 라우트 이름 (예: 'books.list')
+            params: 쿼리 파라미터 (None 값은 제외)
+
+        Returns:
+            str: '라우트:파라미터 해시'
+        """
+        query = urlencode(sorted((k, str(v)) for k, v in params.items() if v is not None))
+        digest = hashlib.sha1(query.encode()).hexdigest()
+        return f"{route}:{digest}"
+
+    async def get_or_compute(
+        self,
+        key: str,
+        ttl: int,
+        tags: List[str],
+        compute: Callable[[], Awaitable[bytes]],
+    ) -> tuple:
+        """
+        캐시 조회, 없으면 계산 후 저장
+
+        Args:
+            key: 캐시 키
+            ttl: 만료 시간 (초)
+            tags: 무효화 태그
+            compute: 응답 본문(bytes)을 만드는 코루틴 함수
+
+        Returns:
+            tuple: (응답 본문, 캐시 적중 여부)
+        """
+        value = await self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value, True
+
+        # 계산하던 요청이 취소되면(클라이언트 연결 종료 등) 기다리던 요청 중 하나가 이어서 계산
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                value = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # 이 요청 자체가 취소됨
+                continue
+            self.coalesced += 1
+            return value, True
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        # 기다리는 요청이 없을 때 예외 미회수 경고가 나지 않도록 처리
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+
+        try:
+            value = await self._compute_once(key, ttl, tags, compute)
+            future.set_result(value)
+            return value, False
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        except BaseException:
+            # 취소는 이 요청에만 해당하므로 기다리던 요청에 전달하지 않음
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _compute_once(
+        self,
+        key: str,
+        ttl: int,
+        tags: List[str],
+        compute: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        """분산 락을 잡고 계산, 락을 못 잡으면 다른 워커의 결과를 기다림"""
+        deadline = time.monotonic() + self.lock_timeout
+
+        while True:
+            if await self.backend.acquire_lock(key, self.lock_timeout):
+                try:
+                    generations = await self.backend.generations(tags)
+                    value = await compute()
+                    if not await self.backend.set(key, value, ttl, tags, generations):
+                        self.stale_fills += 1
+                    return value
+                finally:
+                    await self.backend.release_lock(key)
+
+            await asyncio.sleep(self.poll_interval)
+            value = await self.backend.get(key)
+            if value is not None:
+                return value
+
+            # 락을 잡은 워커가 응답하지 않으면 직접 계산 (캐시 저장은 생략)
+            if time.monotonic() >= deadline:
+                return await compute()
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """
+        태그 무효화
+
+        Args:
+            tags: 무효화할 태그 목록
+        """
+        self.invalidations += await self.backend.invalidate_tags(list(tags))
+
+    def invalidate_tags_sync(self, tags: Iterable[str]) -> None:
+        """
+        동기 컨텍스트(세션 이벤트)에서 태그 즉시 무효화
+
+        커밋 직후 응답을 보내기 전에 지우므로, 쓰기 응답을 받은 뒤의 조회는 이전 값을 받지 않는다.
+        이벤트 루프 안팎(스크립트·작업) 모두에서 동작하며, Redis 백엔드는 동기 클라이언트로 한 번 왕복한다.
+        실패해도 커밋은 이미 끝났으므로 예외를 올리지 않고 기록만 남긴다 (항목은 TTL이 지나면 사라짐).
+
+        Args:
+            tags: 무효화할 태그 목록
+        """
+        tags = list(tags)
+        if not tags:
+            return
+
+        try:
+            self.invalidations += self.backend.invalidate_tags_sync(tags)
+        except Exception:
+            self.invalidation_failures += 1
+            RESPONSE_CACHE_INVALIDATION_FAILURES.inc()
+            logger.exception("응답 캐시 무효화 실패 (태그: %s)", ", ".join(sorted(tags)))
+
+    def stats(self) -> dict:
+        """
+        캐시 지표 조회
+
+        Returns:
+            dict: 적중/미스/병합 횟수, 적중률, 무효화된 항목 수, 무효화 실패 횟수, 저장하지 않은 계산 수
+        """
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "invalidation_failures": self.invalidation_failures,
+            "stale_fills": self.stale_fills,
+        }
+
+
+def _create_backend():
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        return RedisCacheBackend()
+    return MemoryCacheBackend(max_size=settings.RESPONSE_CACHE_MAX_SIZE)
+
+
+# 전역 응답 캐시
+response_cache = ResponseCache(_create_backend())
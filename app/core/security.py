@@ -1,12 +1,19 @@
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 # 비밀번호 해싱 컨텍스트
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# 검증 완료된 토큰 캐시 (토큰 digest → payload, 토큰 만료 시 제거)
+token_cache = TTLCache(max_size=settings.TOKEN_CACHE_MAX_SIZE, ttl_seconds=0)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -59,12 +66,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def create_refresh_token(data: dict) -> str:
+def create_refresh_token(data: dict, family_id: Optional[str] = None) -> str:
     """
     Refresh Token 생성
     
+    토큰마다 고유 ID(jti)를 붙이고, 같은 로그인에서 갱신으로 이어진 토큰은
+    같은 패밀리 ID(fid)를 공유한다.
+    
     Args:
         data: 토큰에 포함할 데이터
+        family_id: 토큰 패밀리 ID (기본값: 새 패밀리)
         
     Returns:
         str: JWT Refresh 토큰
@@ -72,7 +83,12 @@ def create_refresh_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({
+        "exp": expire,
+        "type": "refresh",
+        "jti": uuid.uuid4().hex,
+        "fid": family_id or uuid.uuid4().hex,
+    })
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     
     return encoded_jwt
@@ -82,14 +98,29 @@ def decode_token(token: str) -> Optional[dict]:
     """
     JWT 토큰 디코딩
     
+    서명·클레임 검증을 통과한 토큰은 exp까지 캐시하여
+    같은 토큰이 다시 오면 검증을 생략한다.
+    
     Args:
         token: JWT 토큰
         
     Returns:
         dict: 디코딩된 페이로드 또는 None
     """
+    key = hashlib.sha256(token.encode()).digest()
+    
+    cached = token_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+    
+    # exp가 있는 토큰만 남은 유효 시간 동안 캐시
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(key, dict(payload), ttl_seconds=exp - time.time())
+    
+    return payload
@@ -0,0 +1,71 @@
+"""
+응답 직렬화
+스키마별 TypeAdapter를 캐시해 ORM 객체 → 스키마 변환(검증 1회)과 JSON 직렬화를 한 번에 처리
+
+라우트가 Pydantic 모델을 반환하면 FastAPI가 response_model로 다시 검증한 뒤 직렬화한다.
+이미 스키마로 만든 값은 json_response()로 바로 내보내 두 번째 검증을 건너뛴다.
+response_model은 OpenAPI 문서용으로 그대로 둔다.
+"""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def type_adapter(schema: Any) -> TypeAdapter:
+    """
+    스키마의 TypeAdapter (스키마당 한 번만 생성)
+
+    Args:
+        schema: Pydantic 모델 또는 타입 (예: List[BookResponse])
+
+    Returns:
+        TypeAdapter: 캐시된 어댑터
+    """
+    return TypeAdapter(schema)
+
+
+def to_json(schema: Any, value: Any) -> bytes:
+    """
+    이미 검증된 값을 JSON으로 직렬화 (검증 없음)
+
+    Args:
+        schema: 값의 스키마
+        value: 스키마 인스턴스
+
+    Returns:
+        bytes: JSON 본문
+    """
+    return type_adapter(schema).dump_json(value)
+
+
+def orm_to_json(schema: Any, data: Any) -> bytes:
+    """
+    ORM 객체(또는 ORM 객체를 담은 dict)를 스키마로 한 번 검증한 뒤 JSON으로 직렬화
+
+    Args:
+        schema: 응답 스키마
+        data: ORM 객체, 또는 {"books": [Book, ...], "total": ...} 같은 dict
+
+    Returns:
+        bytes: JSON 본문
+    """
+    adapter = type_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def orm_fields(schema: Any, obj: Any) -> dict:
+    """
+    ORM 객체에서 스키마 필드만 꺼낸 dict (검증 없음)
+
+    ORM 값에 추가 필드(점수 등)를 붙여 한 번에 검증할 때 사용
+    """
+    return {name: getattr(obj, name) for name in schema.model_fields}
+
+
+def json_response(body: bytes, status_code: int = 200, headers: Optional[dict] = None) -> Response:
+    """직렬화된 JSON 본문 응답"""
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
@@ -0,0 +1,39 @@
+"""
+Server-Sent Events 응답
+이벤트 스트림(text/event-stream) 직렬화와 프록시 버퍼링을 끈 스트리밍 응답
+"""
+
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from fastapi.responses import StreamingResponse
+
+
+def sse_event(event: str, data: bytes) -> bytes:
+    """
+    SSE 이벤트 하나 직렬화
+
+    Args:
+        event: 이벤트 이름
+        data: 한 줄짜리 본문 (orjson 등으로 직렬화한 JSON)
+    """
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+def sse_response(
+    events: AsyncIterator[Tuple[str, bytes]],
+    headers: Optional[Dict[str, str]] = None,
+) -> StreamingResponse:
+    """
+    (이벤트 이름, 본문) 스트림을 SSE로 응답
+
+    클라이언트가 연결을 끊으면 스트림이 취소되어 진행 중인 업스트림 요청도 정리된다.
+    """
+    async def body():
+        async for event, data in events:
+            yield sse_event(event, data)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", **(headers or {})},
+    )
@@ -0,0 +1,109 @@
+"""
+도서 임베딩 백필 작업
+embedding이 비어 있는 도서를 배치 단위로 임베딩하여 저장
+
+실행:
+    python -m app.jobs.backfill_embeddings --batch-size 256
+    python -m app.jobs.backfill_embeddings --all   # 전체 재계산
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.models.book import Book
+from app.services.embedding import Embedder, book_embedding_text, get_embedder
+
+
+async def backfill_embeddings(
+    db: AsyncSession,
+    embedder: Embedder,
+    batch_size: int = 256,
+    recompute: bool = False,
+    limit: Optional[int] = None,
+) -> int:
+    """
+    도서 임베딩 백필
+
+    id 기준 키셋으로 배치를 읽고, 배치마다 한 번의 임베딩 호출과
+    한 번의 executemany UPDATE 후 커밋한다. 중간에 실패해도 이미 커밋된 배치는 유지된다.
+
+    Args:
+        db: 데이터베이스 세션
+        embedder: 임베딩 생성기
+        batch_size: 배치 크기
+        recompute: True면 이미 임베딩이 있는 도서도 다시 계산
+        limit: 최대 처리 도서 수
+
+    Returns:
+        int: 처리한 도서 수
+    """
+    processed = 0
+    last_id: Optional[str] = None
+
+    # ORM 일괄 처리 대신 Core executemany로 실행되도록 테이블 기준 UPDATE 사용
+    books = Book.__table__
+    update_stmt = (
+        update(books)
+        .where(books.c.id == bindparam("book_id"))
+        .values(embedding=bindparam("vector"))
+    )
+
+    while limit is None or processed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - processed)
+        stmt = select(
+            Book.id, Book.title, Book.author, Book.category, Book.keywords, Book.description
+        )
+        if last_id is not None:
+            stmt = stmt.where(Book.id > last_id)
+        if not recompute:
+            stmt = stmt.where(Book.embedding.is_(None))
+        rows = (await db.execute(stmt.order_by(Book.id).limit(size))).all()
+        if not rows:
+            break
+
+        texts = [
+            book_embedding_text(row.title, row.author, row.category, row.keywords, row.description)
+            for row in rows
+        ]
+        vectors = await embedder.embed(texts)
+
+        await db.execute(
+            update_stmt,
+            [{"book_id": row.id, "vector": vector} for row, vector in zip(rows, vectors)],
+        )
+        await db.commit()
+
+        processed += len(rows)
+        last_id = rows[-1].id
+
+    return processed
+
+
+async def main_async(batch_size: int, recompute: bool, limit: Optional[int]) -> None:
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        processed = await backfill_embeddings(db, get_embedder(), batch_size, recompute, limit)
+    await async_engine.dispose()
+
+    elapsed = time.perf_counter() - started
+    rate = processed / elapsed if elapsed else 0.0
+    print(f"✅ 임베딩 백필 완료: {processed:,}권 ({elapsed:.1f}s, {rate:,.0f}권/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="도서 임베딩 백필")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--all", action="store_true", help="기존 임베딩도 다시 계산")
+    parser.add_argument("--limit", type=int, default=None, help="최대 처리 도서 수")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.batch_size, args.all, args.limit))
+
+
+if __name__ == "__main__":
+    main()
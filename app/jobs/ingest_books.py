@@ -0,0 +1,56 @@
+"""
+도서 대량 적재 CLI
+CSV/JSONL 파일(또는 표준 입력)을 스트리밍으로 적재
+
+실행:
+    python -m app.jobs.ingest_books feed.csv
+    python -m app.jobs.ingest_books feed.jsonl --batch-size 10000
+    cat feed.jsonl | python -m app.jobs.ingest_books - --format jsonl
+"""
+
+import argparse
+import sys
+
+from app.core.config import settings
+from app.core.database import engine
+from app.schemas.book import BookIngestReport
+from app.services.ingest_service import BookIngestor, iter_records
+
+
+def detect_format(path: str) -> str:
+    """확장자로 입력 형식 판단"""
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def print_progress(report: BookIngestReport) -> None:
+    print(
+        f"  배치 {report.batches}: 읽음 {report.rows_read:,} / "
+        f"삽입 {report.rows_inserted:,} / 갱신 {report.rows_updated:,} / "
+        f"거부 {report.rows_rejected:,} ({report.rows_per_second:,.0f}행/s)",
+        file=sys.stderr,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="도서 대량 적재")
+    parser.add_argument("path", help="입력 파일 경로 ('-'이면 표준 입력)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None)
+    parser.add_argument("--batch-size", type=int, default=settings.BOOK_INGEST_BATCH_SIZE)
+    args = parser.parse_args()
+
+    fmt = args.format or ("jsonl" if args.path == "-" else detect_format(args.path))
+    ingestor = BookIngestor(engine, batch_size=args.batch_size, on_progress=print_progress)
+
+    if args.path == "-":
+        report = ingestor.run(iter_records(sys.stdin, fmt))
+    else:
+        with open(args.path, encoding="utf-8-sig", newline="") as stream:
+            report = ingestor.run(iter_records(stream, fmt))
+
+    for reject in report.rejects:
+        print(f"  거부 {reject.line}행: {reject.error}", file=sys.stderr)
+    print(report.model_dump_json(exclude={"rejects"}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
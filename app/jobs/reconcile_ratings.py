@@ -0,0 +1,55 @@
+"""
+도서 평점 집계 작업
+리뷰 증분은 book_rating_shards에 쌓이므로 books.rating / review_count(목록 정렬·필터용)에 주기적으로 반영하고,
+전체 점검 모드에서는 reviews 기준으로 샤드 합계의 어긋남을 찾아 복구
+
+실행:
+    python -m app.jobs.reconcile_ratings              # 최근 변경분 반영 (1분 주기 등)
+    python -m app.jobs.reconcile_ratings --full       # 전체 점검·복구 (야간)
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, async_engine
+from app.services.review_service import ReviewService
+
+
+async def main_async(full: bool, batch_size: int, since_seconds: Optional[int]) -> None:
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        if full:
+            report = await ReviewService.reconcile_ratings(db, batch_size)
+        else:
+            window = since_seconds if since_seconds is not None else settings.REVIEW_ROLLUP_WINDOW_SECONDS
+            updated = await ReviewService.rollup_ratings(db, datetime.utcnow() - timedelta(seconds=window))
+    await async_engine.dispose()
+
+    elapsed = time.perf_counter() - started
+    if full:
+        print(
+            f"✅ 평점 전체 점검 완료: {report.books_checked:,}권 확인, "
+            f"샤드 복구 {report.books_repaired:,}권, 도서 평점 동기화 {report.books_synced:,}권 ({elapsed:.1f}s)"
+        )
+    else:
+        print(f"✅ 평점 반영 완료: {updated:,}권 ({elapsed:.1f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="도서 평점 집계")
+    parser.add_argument("--full", action="store_true", help="reviews 기준 전체 점검·복구")
+    parser.add_argument("--batch-size", type=int, default=1000, help="전체 점검 배치당 도서 수")
+    parser.add_argument(
+        "--since-seconds", type=int, default=None,
+        help="최근 N초 안에 바뀐 샤드만 반영 (기본 REVIEW_ROLLUP_WINDOW_SECONDS)",
+    )
+    args = parser.parse_args()
+    asyncio.run(main_async(args.full, args.batch_size, args.since_seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+홈 피드 갱신 작업
+stale로 표시된 진열대(또는 전체)를 다시 만듦
+
+API 워커는 도서 변경 커밋 직후 해당 진열대를 다시 만들고, 응답 시에도 stale 진열대를 갱신한다.
+이 작업은 트래픽이 없을 때나 ORM 밖 변경(대량 적재, SQL 직접 수정) 뒤를 위한 보조 수단이다.
+
+실행:
+    python -m app.jobs.refresh_home_feed          # stale 진열대만
+    python -m app.jobs.refresh_home_feed --all    # 전체
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.services.home_feed_service import HomeFeedService
+
+
+async def main_async(refresh_all: bool) -> None:
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        refreshed = await HomeFeedService.refresh(db, stale_only=not refresh_all)
+    await async_engine.dispose()
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ 홈 피드 갱신 완료: {', '.join(refreshed) or '변경 없음'} ({elapsed:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="홈 피드 갱신")
+    parser.add_argument("--all", action="store_true", help="stale 여부와 관계없이 전체 갱신")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.all))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,8 @@
 from app.models.user import User
 from app.models.book import Book
+from app.models.token import RevokedToken
+from app.models.review import Review, BookRatingShard
+from app.models.book_facet import BookKeyword, BookFacetCount
+from app.models.home_feed import HomeShelf
 
-__all__ = ["User", "Book"]
+__all__ = ["User", "Book", "RevokedToken", "Review", "BookRatingShard", "BookKeyword", "BookFacetCount", "HomeShelf"]
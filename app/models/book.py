@@ -3,19 +3,54 @@ Book 모델
 도서 정보 저장
 """
 
-from sqlalchemy import Column, String, Integer, Float, Boolean, Date, DateTime, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, Float, Boolean, Date, DateTime, Text, Index, Uuid, event, func, inspect, literal_column, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
+from pgvector.sqlalchemy import Vector
+from app.core.config import settings
 from app.core.database import Base
+from app.utils.ids import new_id
+from app.utils.text import to_search_document
 from datetime import datetime
-import uuid
+
+# 도서 테마
+THEMES = ("work", "healing", "growth")
 
 
 class Book(Base):
     """도서 모델"""
     __tablename__ = "books"
+    __table_args__ = (
+        # 키셋 페이지네이션용 복합 인덱스 (정렬 컬럼 + id)
+        Index("ix_books_created_at_id", "created_at", "id"),
+        Index("ix_books_rating_id", "rating", "id"),
+        Index("ix_books_theme_created_at_id", "theme", "created_at", "id"),
+        Index("ix_books_theme_rating_id", "theme", "rating", "id"),
+        # 전문 검색용 GIN 인덱스
+        Index("ix_books_search_vector", "search_vector", postgresql_using="gin"),
+        # 임베딩 ANN 인덱스 (전체 + 테마별 부분 인덱스)
+        Index(
+            "ix_books_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+        *(
+            Index(
+                f"ix_books_embedding_hnsw_{theme}",
+                "embedding",
+                postgresql_using="hnsw",
+                postgresql_with={"m": 16, "ef_construction": 64},
+                postgresql_ops={"embedding": "vector_cosine_ops"},
+                postgresql_where=text(f"theme = '{theme}'"),
+            )
+            for theme in THEMES
+        ),
+    )
     
     # 기본 정보
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)  # UUIDv7 (시간 순)
     title = Column(String(500), nullable=False, index=True)
     author = Column(String(200), nullable=False, index=True)
     publisher = Column(String(200), nullable=True)
@@ -32,8 +67,14 @@ class Book(Base):
     
     # 카테고리 및 태그
     theme = Column(String(50), nullable=True, index=True)
-    category = Column(String(100), nullable=True)
-    keywords = Column(Text, nullable=True)
+    category = Column(String(100), nullable=True, index=True)
+    keywords = Column(Text, nullable=True)  # 검색용 키워드 (쉼표 구분, 태그 행은 book_keywords)
+    
+    # 검색 (제목/저자/키워드/설명의 n-gram tsvector, 자동 갱신)
+    search_vector = deferred(Column(TSVECTOR().with_variant(Text(), "sqlite"), nullable=True))
+    
+    # 추천용 임베딩 (app.jobs.backfill_embeddings로 채움)
+    embedding = deferred(Column(Vector(settings.EMBEDDING_DIM), nullable=True))
     
     # 특별 표시
     is_popular = Column(Boolean, default=False, index=True)
@@ -49,3 +90,45 @@ class Book(Base):
     
     def __repr__(self):
         return f"<Book(id={self.id}, title={self.title}, author={self.author})>"
+
+
+# 검색 벡터에 포함되는 필드와 가중치 (ts_rank 가중치 A > B > C > D)
+SEARCH_FIELDS = (
+    ("title", "A"),
+    ("author", "B"),
+    ("keywords", "C"),
+    ("description", "D"),
+)
+
+
+def build_search_vector(book: "Book", dialect_name: str):
+    """
+    검색 벡터 생성
+
+    PostgreSQL에서는 필드별 가중치를 준 tsvector SQL 표현식을,
+    그 외 DB에서는 토큰 문자열을 반환한다.
+    """
+    if dialect_name != "postgresql":
+        return to_search_document(getattr(book, field) for field, _ in SEARCH_FIELDS)
+
+    vector = None
+    for field, weight in SEARCH_FIELDS:
+        # 가중치는 "char" 인자이므로 타입 없는 리터럴로 넣는다 (asyncpg가 VARCHAR로 바인딩하면 함수를 찾지 못함)
+        part = func.setweight(
+            func.to_tsvector("simple", to_search_document([getattr(book, field)])),
+            literal_column(f"'{weight}'"),
+        )
+        vector = part if vector is None else vector.op("||")(part)
+    return vector
+
+
+@event.listens_for(Book, "before_insert")
+def _set_search_vector_on_insert(mapper, connection, target: Book) -> None:
+    target.search_vector = build_search_vector(target, connection.dialect.name)
+
+
+@event.listens_for(Book, "before_update")
+def _set_search_vector_on_update(mapper, connection, target: Book) -> None:
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field, _ in SEARCH_FIELDS):
+        target.search_vector = build_search_vector(target, connection.dialect.name)
@@ -0,0 +1,189 @@
+"""
+도서 키워드 태그 / 패싯 집계 모델
+Book.keywords(쉼표 구분)를 태그 행으로 풀어 두고, 패싯별 도서 수를 증분으로 유지
+
+ORM으로 도서를 추가·수정·삭제하면 같은 트랜잭션에서 태그 행과 패싯 수가 함께 갱신된다.
+대량 적재 등 ORM 밖 변경은 app.services.facet_service의 재계산 함수를 사용한다.
+"""
+
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Uuid, delete, event, inspect, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from app.core.database import Base
+from app.models.book import Book
+from app.utils.text import split_keywords
+
+# 가격대 경계 (원) - 구간은 [하한, 다음 경계)
+PRICE_BUCKET_BOUNDS = (0, 10000, 15000, 20000, 30000)
+
+# 패싯 종류
+FACETS = ("theme", "category", "keyword", "price")
+
+# 패싯 값을 결정하는 도서 컬럼
+FACET_FIELDS = ("theme", "category", "keywords", "price")
+
+# 테마 필터가 없는 집계의 scope 값
+ALL_SCOPE = ""
+
+
+class BookKeyword(Base):
+    """도서 키워드 태그 (키워드 → 도서 조회는 PK 인덱스 범위 스캔)"""
+    __tablename__ = "book_keywords"
+    
+    keyword = Column(String(100), primary_key=True)
+    book_id = Column(Uuid(as_uuid=False), ForeignKey("books.id", ondelete="CASCADE"), primary_key=True, index=True)
+    
+    def __repr__(self):
+        return f"<BookKeyword(keyword={self.keyword}, book_id={self.book_id})>"
+
+
+class BookFacetCount(Base):
+    """
+    패싯 값별 도서 수
+    
+    scope는 '' (전체) 또는 테마 값이며, 테마를 고른 화면의 패싯 수도 바로 읽을 수 있다.
+    """
+    __tablename__ = "book_facet_counts"
+    __table_args__ = (
+        # 패싯별 상위 값 조회
+        Index("ix_book_facet_counts_scope_facet_count", "scope", "facet", "count"),
+    )
+    
+    scope = Column(String(50), primary_key=True)
+    facet = Column(String(20), primary_key=True)
+    value = Column(String(200), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<BookFacetCount(scope={self.scope}, facet={self.facet}, value={self.value}, count={self.count})>"
+
+
+def price_bucket(price: Optional[int]) -> Optional[str]:
+    """
+    가격대 패싯 값
+
+    Returns:
+        str: '0-10000', '10000-15000', ..., '30000+' 또는 None (가격 없음)
+    """
+    if price is None:
+        return None
+    for lower, upper in zip(PRICE_BUCKET_BOUNDS, PRICE_BUCKET_BOUNDS[1:]):
+        if price < upper:
+            return f"{lower}-{upper}"
+    return f"{PRICE_BUCKET_BOUNDS[-1]}+"
+
+
+def price_bucket_range(bucket: str) -> Tuple[int, Optional[int]]:
+    """
+    가격대 패싯 값 → (최소 가격, 최대 가격) (둘 다 포함, 상한 없으면 None)
+
+    Raises:
+        ValueError: 정의되지 않은 가격대일 때
+    """
+    if bucket == f"{PRICE_BUCKET_BOUNDS[-1]}+":
+        return PRICE_BUCKET_BOUNDS[-1], None
+    for lower, upper in zip(PRICE_BUCKET_BOUNDS, PRICE_BUCKET_BOUNDS[1:]):
+        if bucket == f"{lower}-{upper}":
+            return lower, upper - 1
+    raise ValueError(f"unknown price bucket: {bucket}")
+
+
+def book_facets(
+    theme: Optional[str],
+    category: Optional[str],
+    keywords: Iterable[str],
+    bucket: Optional[str],
+) -> List[Tuple[str, str, str]]:
+    """
+    도서 한 권이 더해지는 패싯 (scope, facet, value) 목록
+
+    Args:
+        theme: 테마
+        category: 카테고리
+        keywords: split_keywords()로 나눈 키워드
+        bucket: price_bucket()으로 구한 가격대
+    """
+    values = [("theme", theme), ("category", category), ("price", bucket)]
+    values.extend(("keyword", keyword) for keyword in keywords)
+
+    scopes = (ALL_SCOPE, theme) if theme else (ALL_SCOPE,)
+    return [(scope, facet, value) for scope in scopes for facet, value in values if value]
+
+
+def apply_facet_deltas(connection, deltas: Counter) -> None:
+    """패싯 수 증분 반영 (scope, facet, value) → 증감"""
+    rows = [
+        {"scope": scope, "facet": facet, "value": value, "count": delta}
+        for (scope, facet, value), delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return
+
+    dialect_insert = sqlite.insert if connection.dialect.name == "sqlite" else postgresql.insert
+    table = BookFacetCount.__table__
+    stmt = dialect_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.scope, table.c.facet, table.c.value],
+        set_={"count": table.c.count + stmt.excluded["count"]},
+    )
+    connection.execute(stmt, rows)
+
+
+def replace_book_keywords(connection, books: List[Tuple[str, List[str]]]) -> None:
+    """도서별 키워드 태그 행 교체 [(book_id, 키워드 목록)]"""
+    if not books:
+        return
+
+    table = BookKeyword.__table__
+    connection.execute(delete(table).where(table.c.book_id.in_([book_id for book_id, _ in books])))
+    rows = [{"book_id": book_id, "keyword": keyword} for book_id, keywords in books for keyword in keywords]
+    if rows:
+        connection.execute(insert(table), rows)
+
+
+def _previous(state, field: str):
+    """flush 직전 값 (바뀌지 않았으면 현재 값)"""
+    history = state.attrs[field].history
+    if history.deleted:
+        return history.deleted[0]
+    return state.attrs[field].value
+
+
+def _facets_of(values: dict) -> Counter:
+    return Counter(book_facets(
+        values["theme"], values["category"], split_keywords(values["keywords"]), price_bucket(values["price"])
+    ))
+
+
+# ========== 태그·패싯 증분 갱신 (매퍼 이벤트, 도서 쓰기와 같은 트랜잭션) ==========
+
+@event.listens_for(Book, "after_insert")
+def _index_inserted_book(mapper, connection, target: Book) -> None:
+    replace_book_keywords(connection, [(target.id, split_keywords(target.keywords))])
+    apply_facet_deltas(connection, _facets_of({field: getattr(target, field) for field in FACET_FIELDS}))
+
+
+@event.listens_for(Book, "after_update")
+def _index_updated_book(mapper, connection, target: Book) -> None:
+    state = inspect(target)
+    if not any(state.attrs[field].history.has_changes() for field in FACET_FIELDS):
+        return
+
+    before = _facets_of({field: _previous(state, field) for field in FACET_FIELDS})
+    after = _facets_of({field: getattr(target, field) for field in FACET_FIELDS})
+    after.subtract(before)
+    apply_facet_deltas(connection, after)
+
+    if state.attrs.keywords.history.has_changes():
+        replace_book_keywords(connection, [(target.id, split_keywords(target.keywords))])
+
+
+@event.listens_for(Book, "after_delete")
+def _unindex_deleted_book(mapper, connection, target: Book) -> None:
+    # FK를 강제하지 않는 DB(SQLite)를 위해 태그 행도 직접 삭제
+    replace_book_keywords(connection, [(target.id, [])])
+    removed = _facets_of({field: getattr(target, field) for field in FACET_FIELDS})
+    apply_facet_deltas(connection, Counter({key: -count for key, count in removed.items()}))
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, DateTime, Integer, String, Text
+from app.core.database import Base
+from datetime import datetime
+
+
+class HomeShelf(Base):
+    """
+    홈 화면 진열대 (미리 직렬화한 도서 목록)
+    
+    도서가 바뀌면 같은 트랜잭션에서 version을 올리고 stale_since를 기록하며,
+    다시 만든 뒤 version이 그대로면 stale_since를 지운다.
+    """
+    __tablename__ = "home_shelves"
+    
+    key = Column(String(50), primary_key=True)  # 'popular', 'curator_picks', 'theme:work' 등
+    body = Column(Text, nullable=False)  # List[BookResponse] JSON
+    book_count = Column(Integer, nullable=False, default=0)
+    
+    # 갱신 상태
+    version = Column(Integer, nullable=False, default=0)
+    built_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    stale_since = Column(DateTime, nullable=True)  # 반영되지 않은 변경 중 가장 오래된 시각
+    
+    def __repr__(self):
+        return f"<HomeShelf(key={self.key}, book_count={self.book_count})>"
@@ -0,0 +1,63 @@
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    Text,
+    UniqueConstraint,
+    Uuid,
+)
+from app.core.database import Base
+from app.utils.ids import new_id
+from datetime import datetime
+
+
+class Review(Base):
+    """도서 리뷰 모델 (사용자당 도서 1건)"""
+    __tablename__ = "reviews"
+    __table_args__ = (
+        UniqueConstraint("book_id", "user_id", name="uq_reviews_book_id_user_id"),
+        CheckConstraint("rating BETWEEN 1 AND 5", name="ck_reviews_rating"),
+        # 도서별 최신순 키셋 페이지네이션
+        Index("ix_reviews_book_id_created_at_id", "book_id", "created_at", "id"),
+    )
+    
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)  # UUIDv7 (시간 순)
+    book_id = Column(Uuid(as_uuid=False), ForeignKey("books.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Uuid(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    rating = Column(SmallInteger, nullable=False)  # 1~5
+    content = Column(Text, nullable=True)
+    
+    # 타임스탬프
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<Review(id={self.id}, book_id={self.book_id}, rating={self.rating})>"
+
+
+class BookRatingShard(Base):
+    """
+    도서 평점 집계 샤드
+    
+    리뷰 작성·수정·삭제 시 (합계, 개수) 증분을 임의의 샤드 한 행에 더한다.
+    인기 도서에 리뷰가 몰려도 한 행의 잠금을 기다리며 줄 서지 않는다.
+    도서 평점 = 샤드 합계의 합 / 샤드 개수의 합
+    """
+    __tablename__ = "book_rating_shards"
+    
+    book_id = Column(Uuid(as_uuid=False), ForeignKey("books.id", ondelete="CASCADE"), primary_key=True)
+    shard = Column(SmallInteger, primary_key=True)
+    rating_sum = Column(BigInteger, nullable=False, default=0)
+    rating_count = Column(Integer, nullable=False, default=0)
+    
+    # books.rating / review_count 반영(rollup) 대상 선정용
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<BookRatingShard(book_id={self.book_id}, shard={self.shard})>"
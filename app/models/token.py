@@ -0,0 +1,24 @@
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, Uuid
+from app.core.database import Base
+from datetime import datetime
+
+
+class RevokedToken(Base):
+    """폐기된 Refresh Token / 토큰 패밀리 모델"""
+    __tablename__ = "revoked_tokens"
+    
+    # 삽입 순서대로 증가하는 번호 (워커 간 블룸 필터 변경분 동기화 커서, 앱 서버 시계와 무관)
+    # SQLite는 INTEGER PRIMARY KEY(rowid)여야 자동 증가하므로 Integer로 대체
+    seq = Column(BigInteger().with_variant(Integer(), "sqlite"), primary_key=True, autoincrement=True)
+    
+    # jti(토큰) 또는 fid(패밀리)
+    jti = Column(String(64), unique=True, index=True, nullable=False)
+    kind = Column(String(10), nullable=False, default="token")  # 'token' 또는 'family'
+    user_id = Column(Uuid(as_uuid=False), nullable=True)
+    
+    # 만료 후에는 검사할 필요가 없으므로 정리 대상
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<RevokedToken(jti={self.jti}, kind={self.kind})>"
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, Uuid
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.utils.ids import new_id
 from datetime import datetime
-import uuid
 
 
 class User(Base):
@@ -10,7 +10,7 @@ class User(Base):
     __tablename__ = "users"
     
     # 기본 정보
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)  # UUIDv7 (시간 순)
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     name = Column(String, nullable=True)
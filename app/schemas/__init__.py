@@ -11,10 +11,28 @@ from app.schemas.book import (
     BookResponse,
     BookDetailResponse,
     BookListResponse,
+    BookFilter,
+    FacetValue,
+    BookFacets,
+    BookBrowseResponse,
+    FacetRebuildReport,
+    HomeFeedResponse,
+    BookSearchResult,
+    BookSearchResponse,
     RecommendedBook,
     RecommendedBookList,
     BookCreate,
     BookUpdate,
+    BookIngestReject,
+    BookIngestReport,
+)
+from app.schemas.review import (
+    ReviewCreate,
+    ReviewUpdate,
+    ReviewResponse,
+    RatingSummary,
+    ReviewListResponse,
+    RatingReconcileReport,
 )
 
 __all__ = [
@@ -28,8 +46,24 @@ __all__ = [
     "BookResponse",
     "BookDetailResponse",
     "BookListResponse",
+    "BookFilter",
+    "FacetValue",
+    "BookFacets",
+    "BookBrowseResponse",
+    "FacetRebuildReport",
+    "HomeFeedResponse",
+    "BookSearchResult",
+    "BookSearchResponse",
     "RecommendedBook",
     "RecommendedBookList",
     "BookCreate",
     "BookUpdate",
+    "BookIngestReject",
+    "BookIngestReport",
+    "ReviewCreate",
+    "ReviewUpdate",
+    "ReviewResponse",
+    "RatingSummary",
+    "ReviewListResponse",
+    "RatingReconcileReport",
 ]
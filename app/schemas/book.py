@@ -4,7 +4,7 @@
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from datetime import date, datetime
 
 
@@ -52,8 +52,82 @@ class BookListResponse(BaseModel):
     """도서 목록 응답"""
     books: List[BookResponse]
     total: Optional[int] = None
+    total_is_estimate: bool = False
     limit: Optional[int] = None
     offset: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class BookFilter(BaseModel):
+    """도서 목록 필터"""
+    theme: Optional[str] = Field(None, pattern="^(work|healing|growth)$")
+    is_popular: Optional[bool] = None
+    is_curator_pick: Optional[bool] = None
+    min_price: Optional[int] = Field(None, ge=0)
+    max_price: Optional[int] = Field(None, ge=0)
+    min_rating: Optional[float] = Field(None, ge=0.0, le=5.0)
+    category: Optional[str] = Field(None, max_length=100)
+    keywords: Optional[Tuple[str, ...]] = None  # 모두 포함 (split_keywords로 정규화된 값)
+
+
+class FacetValue(BaseModel):
+    """패싯 값과 도서 수"""
+    value: str
+    count: int
+
+
+class BookFacets(BaseModel):
+    """도서 패싯 집계"""
+    theme: List[FacetValue] = []
+    category: List[FacetValue] = []
+    keyword: List[FacetValue] = []
+    price: List[FacetValue] = []
+
+
+class BookBrowseResponse(BaseModel):
+    """도서 탐색 응답 (목록 + 패싯 수)"""
+    books: List[BookResponse]
+    facets: BookFacets
+    limit: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class FacetRebuildReport(BaseModel):
+    """키워드 태그·패싯 재계산 결과"""
+    books_indexed: int = 0
+    keyword_rows: int = 0
+    facet_rows: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class HomeFeedResponse(BaseModel):
+    """홈 피드 응답"""
+    shelves: Dict[str, List[BookResponse]]  # 'popular', 'curator_picks', 'theme:{테마}'
+    built_at: datetime  # 가장 오래된 진열대를 만든 시각 (UTC)
+    stale: bool = False  # 반영 대기 중인 변경이 있음
+
+
+class CoverUploadResponse(BaseModel):
+    """표지 업로드 결과"""
+    book_id: str
+    cover_image: str  # 원본 URL (내용 해시 기반, 오래 캐시 가능)
+    thumbnails: Dict[int, str]  # 너비(px) → 썸네일 URL
+    sha256: str
+    size: int
+    content_type: str
+    deduplicated: bool = False  # 같은 내용의 파일이 이미 있었음
+
+
+class BookSearchResult(BookResponse):
+    """도서 검색 결과"""
+    score: float
+    highlights: Dict[str, str] = {}
+
+
+class BookSearchResponse(BaseModel):
+    """도서 검색 응답"""
+    query: str
+    books: List[BookSearchResult]
 
 
 class RecommendedBook(BookBase):
@@ -79,6 +153,7 @@ class BookCreate(BaseModel):
     price: Optional[int] = Field(None, ge=0)
     theme: Optional[str] = Field(None, pattern="^(work|healing|growth)$")
     category: Optional[str] = None
+    keywords: Optional[str] = None
     published_date: Optional[date] = None
     page_count: Optional[int] = Field(None, ge=1)
 
@@ -93,3 +168,21 @@ class BookUpdate(BaseModel):
     theme: Optional[str] = Field(None, pattern="^(work|healing|growth)$")
     is_popular: Optional[bool] = None
     is_curator_pick: Optional[bool] = None
+
+
+class BookIngestReject(BaseModel):
+    """적재 거부 행"""
+    line: int
+    error: str
+
+
+class BookIngestReport(BaseModel):
+    """도서 대량 적재 결과"""
+    rows_read: int = 0
+    rows_inserted: int = 0
+    rows_updated: int = 0
+    rows_rejected: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
+    rejects: List[BookIngestReject] = []
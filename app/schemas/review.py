@@ -0,0 +1,55 @@
+"""
+리뷰 관련 Pydantic 스키마
+요청/응답 데이터 검증
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+
+
+class ReviewCreate(BaseModel):
+    """리뷰 작성"""
+    rating: int = Field(..., ge=1, le=5)
+    content: Optional[str] = Field(None, max_length=2000)
+
+
+class ReviewUpdate(BaseModel):
+    """리뷰 수정"""
+    rating: Optional[int] = Field(None, ge=1, le=5)
+    content: Optional[str] = Field(None, max_length=2000)
+
+
+class ReviewResponse(BaseModel):
+    """리뷰 응답"""
+    id: str
+    book_id: str
+    user_id: str
+    rating: int
+    content: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class RatingSummary(BaseModel):
+    """도서 평점 집계"""
+    rating: float = 0.0
+    review_count: int = 0
+
+
+class ReviewListResponse(BaseModel):
+    """리뷰 목록 응답"""
+    reviews: List[ReviewResponse]
+    summary: RatingSummary
+    next_cursor: Optional[str] = None
+
+
+class RatingReconcileReport(BaseModel):
+    """평점 집계 정합성 점검 결과"""
+    books_checked: int = 0
+    books_repaired: int = 0
+    books_synced: int = 0
+    elapsed_seconds: float = 0.0
@@ -1,24 +1,28 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
+from typing import Optional
+import time
 
 from app.models.user import User
-from app.schemas.auth import SignupRequest, LoginRequest
+from app.schemas.auth import SignupRequest, LoginRequest, UserResponse
+from app.core.hashing import password_hasher
 from app.core.security import (
-    get_password_hash,
-    verify_password,
     create_access_token,
     create_refresh_token,
     decode_token
 )
 from app.core.config import settings
+from app.services.token_revocation import revocation_store
+from app.services.user_cache import user_cache
 
 
 class AuthService:
     """인증 서비스 클래스"""
     
     @staticmethod
-    def create_user(db: Session, signup_data: SignupRequest) -> User:
+    async def create_user(db: AsyncSession, signup_data: SignupRequest) -> User:
         """
         회원가입
         
@@ -33,15 +37,16 @@ class AuthService:
             HTTPException: 이메일 중복 시
         """
         # 이메일 중복 체크
-        existing_user = db.query(User).filter(User.email == signup_data.email).first()
+        result = await db.execute(select(User).where(User.email == signup_data.email))
+        existing_user = result.scalar_one_or_none()
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="이미 사용 중인 이메일입니다"
             )
         
-        # 비밀번호 해싱
-        hashed_password = get_password_hash(signup_data.password)
+        # 비밀번호 해싱 (이벤트 루프 밖에서 실행)
+        hashed_password = await password_hasher.hash(signup_data.password)
         
         # 사용자 생성
         new_user = User(
@@ -54,13 +59,13 @@ class AuthService:
         )
         
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
         
         return new_user
     
     @staticmethod
-    def authenticate_user(db: Session, email: str, password: str) -> User:
+    async def authenticate_user(db: AsyncSession, email: str, password: str) -> User:
         """
         사용자 인증
         
@@ -75,7 +80,8 @@ class AuthService:
         Raises:
             HTTPException: 인증 실패 시
         """
-        user = db.query(User).filter(User.email == email).first()
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalar_one_or_none()
         
         if not user:
             raise HTTPException(
@@ -83,7 +89,7 @@ class AuthService:
                 detail="이메일 또는 비밀번호가 올바르지 않습니다"
             )
         
-        if not verify_password(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="이메일 또는 비밀번호가 올바르지 않습니다"
@@ -97,7 +103,7 @@ class AuthService:
         
         # 마지막 로그인 시간 업데이트
         user.last_login_at = datetime.utcnow()
-        db.commit()
+        await db.commit()
         
         return user
     
@@ -135,16 +141,15 @@ class AuthService:
         }
     
     @staticmethod
-    def get_current_user(db: Session, token: str) -> User:
+    def get_user_id_from_token(token: str) -> str:
         """
-        토큰으로 현재 사용자 조회
+        Access Token에서 사용자 ID 추출
         
         Args:
-            db: 데이터베이스 세션
             token: JWT 토큰
             
         Returns:
-            User: 현재 사용자
+            str: 사용자 ID
             
         Raises:
             HTTPException: 토큰 검증 실패 시
@@ -165,7 +170,26 @@ class AuthService:
                 detail="유효하지 않은 토큰입니다"
             )
         
-        user = db.query(User).filter(User.id == user_id).first()
+        return user_id
+    
+    @staticmethod
+    async def get_current_user(db: AsyncSession, token: str) -> User:
+        """
+        토큰으로 현재 사용자 조회
+        
+        Args:
+            db: 데이터베이스 세션
+            token: JWT 토큰
+            
+        Returns:
+            User: 현재 사용자
+            
+        Raises:
+            HTTPException: 토큰 검증 실패 시
+        """
+        user_id = AuthService.get_user_id_from_token(token)
+        
+        user = await db.get(User, user_id)
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -175,27 +199,83 @@ class AuthService:
         return user
     
     @staticmethod
-    def refresh_access_token(db: Session, refresh_token: str) -> dict:
+    async def get_current_user_profile(db: AsyncSession, token: str) -> UserResponse:
+        """
+        토큰으로 현재 사용자 정보 조회 (캐시 우선)
+        
+        Args:
+            db: 데이터베이스 세션
+            token: JWT 토큰
+            
+        Returns:
+            UserResponse: 현재 사용자 정보
+            
+        Raises:
+            HTTPException: 토큰 검증 실패 시
+        """
+        user_id = AuthService.get_user_id_from_token(token)
+        
+        cached = await user_cache.get(user_id)
+        if cached is not None:
+            return cached
+        
+        user = await db.get(User, user_id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사용자를 찾을 수 없습니다"
+            )
+        
+        return await user_cache.set(user)
+    
+    @staticmethod
+    async def refresh_access_token(db: AsyncSession, refresh_token: str) -> dict:
         """
-        Access Token 갱신
+        Access Token 갱신 (Refresh Token 회전)
+        
+        사용한 Refresh Token은 즉시 폐기하고 같은 패밀리의 새 Refresh Token을 발급한다.
+        이미 폐기된 토큰이 다시 쓰이면 탈취로 보고 패밀리 전체를 폐기한다.
         
         Args:
             db: 데이터베이스 세션
             refresh_token: Refresh Token
             
         Returns:
-            dict: 새로운 access_token
+            dict: 새로운 access_token, refresh_token
+            
+        Raises:
+            HTTPException: 토큰이 유효하지 않거나 폐기된 경우
         """
         payload = decode_token(refresh_token)
         
-        if payload is None or payload.get("type") != "refresh":
+        if payload is None or payload.get("type") != "refresh" or not payload.get("jti"):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="유효하지 않은 Refresh Token입니다"
             )
         
-        user_id = payload.get("sub")
-        user = db.query(User).filter(User.id == user_id).first()
+        jti, family_id, user_id = payload["jti"], payload.get("fid"), payload.get("sub")
+        
+        # 로그아웃·재사용 감지는 다른 워커에서 일어날 수 있으므로 패밀리는 매번 저장소에서 확인
+        # (갱신은 드문 요청이라 인덱스 조회 한 번이면 충분)
+        if family_id and await revocation_store.is_revoked(family_id, confirm=True):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="폐기된 Refresh Token입니다"
+            )
+        
+        # 폐기 기록 추가가 곧 사용 처리이므로, 동시에 같은 토큰으로 갱신해도 한 요청만 성공
+        if await revocation_store.is_revoked(jti) or not await revocation_store.revoke(
+            jti, payload["exp"], user_id=user_id
+        ):
+            if family_id:
+                await AuthService.revoke_token_family(family_id, user_id)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="이미 사용된 Refresh Token입니다. 다시 로그인해주세요"
+            )
+        
+        user = await db.get(User, user_id)
         
         if user is None:
             raise HTTPException(
@@ -203,12 +283,45 @@ class AuthService:
                 detail="사용자를 찾을 수 없습니다"
             )
         
-        # 새 Access Token 생성
+        # 새 Access Token + 같은 패밀리의 새 Refresh Token
         token_data = {"sub": user.id, "email": user.email}
         new_access_token = create_access_token(token_data)
+        new_refresh_token = create_refresh_token(token_data, family_id=family_id)
         
         return {
             "access_token": new_access_token,
+            "refresh_token": new_refresh_token,
             "token_type": "Bearer",
             "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    async def revoke_token_family(family_id: str, user_id: Optional[str] = None) -> None:
+        """
+        토큰 패밀리 폐기
+        
+        패밀리의 어떤 토큰도 지금부터 REFRESH_TOKEN_EXPIRE_DAYS 안에 만료되므로
+        그때까지만 폐기 기록을 유지한다.
+        
+        Args:
+            family_id: 토큰 패밀리 ID
+            user_id: 사용자 ID
+        """
+        expires_at = time.time() + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+        await revocation_store.revoke(family_id, expires_at, kind="family", user_id=user_id)
+    
+    @staticmethod
+    async def logout(refresh_token: str) -> None:
+        """
+        로그아웃 (Refresh Token 패밀리 폐기)
+        
+        이미 발급된 Access Token은 만료 시까지 유효하다.
+        
+        Args:
+            refresh_token: Refresh Token
+        """
+        payload = decode_token(refresh_token)
+        if payload is None or payload.get("type") != "refresh" or not payload.get("fid"):
+            return
+        
+        await AuthService.revoke_token_family(payload["fid"], payload.get("sub"))
@@ -0,0 +1,311 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, event, func, inspect, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.response_cache import response_cache
+from app.models.book import Book
+from app.models.book_facet import BookKeyword
+from app.schemas.book import BookFilter, BookUpdate
+
+# 정렬 기준별 키셋 컬럼 (정렬 컬럼, id) - 모두 내림차순
+SORT_COLUMNS = {
+    "latest": Book.created_at,
+    "rating": Book.rating,
+}
+
+# 필터 조합별 도서 수 캐시
+count_cache = TTLCache(max_size=1024, ttl_seconds=settings.BOOK_COUNT_CACHE_TTL_SECONDS)
+
+# 응답 캐시 태그
+BOOKS_TAG = "books"  # 도서 관련 응답 전체 (대량 적재 등 ORM 밖 변경 시 사용)
+BOOKS_ALL_TAG = "books:all"  # 테마 필터 없는 목록
+BOOKS_SEARCH_TAG = "books:search"
+
+# 세션별 무효화 대기 태그 키
+_PENDING_TAGS_KEY = "book_cache_tags"
+
+
+def theme_tag(theme: str) -> str:
+    """테마 필터 목록의 응답 캐시 태그"""
+    return f"books:theme:{theme}"
+
+
+class BookService:
+    """도서 서비스 클래스"""
+
+    @staticmethod
+    def list_cache_tags(filters: BookFilter) -> List[str]:
+        """
+        목록 응답의 캐시 태그
+
+        Args:
+            filters: 도서 목록 필터
+
+        Returns:
+            list: 해당 목록을 무효화해야 하는 태그
+        """
+        scope = theme_tag(filters.theme) if filters.theme else BOOKS_ALL_TAG
+        return [BOOKS_TAG, scope]
+
+    @staticmethod
+    def apply_filters(stmt: Select, filters: BookFilter) -> Select:
+        """
+        목록 필터 적용
+
+        Args:
+            stmt: SELECT 문
+            filters: 도서 목록 필터
+
+        Returns:
+            Select: 필터가 적용된 SELECT 문
+        """
+        if filters.theme is not None:
+            stmt = stmt.where(Book.theme == filters.theme)
+        if filters.is_popular is not None:
+            stmt = stmt.where(Book.is_popular == filters.is_popular)
+        if filters.is_curator_pick is not None:
+            stmt = stmt.where(Book.is_curator_pick == filters.is_curator_pick)
+        if filters.min_price is not None:
+            stmt = stmt.where(Book.price >= filters.min_price)
+        if filters.max_price is not None:
+            stmt = stmt.where(Book.price <= filters.max_price)
+        if filters.min_rating is not None:
+            stmt = stmt.where(Book.rating >= filters.min_rating)
+        if filters.category is not None:
+            stmt = stmt.where(Book.category == filters.category)
+        # 키워드마다 태그 PK (keyword, book_id) 범위 스캔
+        for keyword in filters.keywords or ():
+            stmt = stmt.where(Book.id.in_(select(BookKeyword.book_id).where(BookKeyword.keyword == keyword)))
+        return stmt
+
+    @staticmethod
+    def encode_cursor(sort: str, book: Book) -> str:
+        """
+        다음 페이지 커서 생성
+
+        Args:
+            sort: 정렬 기준
+            book: 현재 페이지의 마지막 도서
+
+        Returns:
+            str: URL-safe base64 커서
+        """
+        value = getattr(book, SORT_COLUMNS[sort].key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        raw = json.dumps([sort, value, str(book.id)], ensure_ascii=False)
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(sort: str, cursor: str) -> Tuple:
+        """
+        커서 해석
+
+        Args:
+            sort: 정렬 기준
+            cursor: encode_cursor로 생성한 커서
+
+        Returns:
+            tuple: (정렬 컬럼 값, id)
+
+        Raises:
+            HTTPException: 커서가 잘못되었거나 정렬 기준이 다를 때
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            cursor_sort, value, book_id = json.loads(base64.urlsafe_b64decode(padded))
+            if cursor_sort != sort:
+                raise ValueError("sort mismatch")
+            if sort == "latest":
+                value = datetime.fromisoformat(value)
+            else:
+                value = float(value)
+            book_id = str(uuid.UUID(book_id))
+        except (ValueError, TypeError, AttributeError, json.JSONDecodeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="유효하지 않은 커서입니다"
+            )
+        return value, book_id
+
+    @staticmethod
+    async def list_books(
+        db: AsyncSession,
+        filters: BookFilter,
+        sort: str = "latest",
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Book], Optional[str]]:
+        """
+        도서 목록 조회 (키셋 페이지네이션)
+
+        OFFSET 대신 (정렬 컬럼, id) 기준으로 다음 페이지를 찾으므로
+        페이지가 깊어져도 인덱스 범위 스캔 한 번으로 끝난다.
+
+        Args:
+            db: 데이터베이스 세션
+            filters: 도서 목록 필터
+            sort: 정렬 기준 ('latest' 또는 'rating')
+            limit: 페이지 크기
+            cursor: 이전 응답의 next_cursor
+
+        Returns:
+            tuple: (도서 목록, 다음 페이지 커서 또는 None)
+        """
+        sort_column = SORT_COLUMNS[sort]
+
+        stmt = BookService.apply_filters(select(Book), filters)
+        if sort == "rating":
+            stmt = stmt.where(Book.rating.isnot(None))
+
+        if cursor:
+            value, book_id = BookService.decode_cursor(sort, cursor)
+            stmt = stmt.where(
+                tuple_(sort_column, Book.id) < tuple_(value, book_id, types=[sort_column.type, Book.id.type])
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        stmt = stmt.order_by(sort_column.desc(), Book.id.desc()).limit(limit + 1)
+        result = await db.execute(stmt)
+        books = list(result.scalars().all())
+
+        next_cursor = None
+        if len(books) > limit:
+            books = books[:limit]
+            next_cursor = BookService.encode_cursor(sort, books[-1])
+
+        return books, next_cursor
+
+    @staticmethod
+    async def count_books(
+        db: AsyncSession,
+        filters: BookFilter,
+        mode: str = "estimate",
+    ) -> Tuple[Optional[int], bool]:
+        """
+        도서 수 조회
+
+        - exact: COUNT(*) 실행 (결과는 캐시에 저장)
+        - estimate: 캐시된 값 → PostgreSQL 통계/실행 계획 추정치 순으로 사용
+        - none: 조회하지 않음
+
+        Args:
+            db: 데이터베이스 세션
+            filters: 도서 목록 필터
+            mode: 'exact', 'estimate', 'none'
+
+        Returns:
+            tuple: (도서 수, 추정치 여부)
+        """
+        if mode == "none":
+            return None, False
+
+        cache_key = tuple(sorted(filters.model_dump(exclude_none=True).items()))
+
+        if mode == "estimate":
+            cached = count_cache.get(cache_key)
+            if cached is not None:
+                return cached, True
+
+            if db.bind.dialect.name == "postgresql":
+                estimate = await BookService._estimate_count(db, filters)
+                if estimate is not None:
+                    return estimate, True
+
+        stmt = BookService.apply_filters(select(func.count()).select_from(Book), filters)
+        total = (await db.execute(stmt)).scalar_one()
+        count_cache.set(cache_key, total)
+        return total, False
+
+    @staticmethod
+    async def _estimate_count(db: AsyncSession, filters: BookFilter) -> Optional[int]:
+        """
+        PostgreSQL 통계 기반 도서 수 추정
+
+        필터가 없으면 pg_class.reltuples, 있으면 실행 계획의 예상 행 수를 사용한다.
+        아직 ANALYZE되지 않은 테이블이면 None을 반환한다.
+        """
+        if not filters.model_dump(exclude_none=True):
+            result = await db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'books'::regclass")
+            )
+            reltuples = int(result.scalar_one())
+            return reltuples if reltuples >= 0 else None
+
+        stmt = BookService.apply_filters(select(Book.id), filters)
+        compiled = stmt.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+        result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @staticmethod
+    async def update_book(db: AsyncSession, book_id: str, data: BookUpdate) -> Book:
+        """
+        도서 수정
+
+        응답 캐시 무효화, 태그·패싯 수, 홈 피드 진열대 갱신은 세션 이벤트로 처리된다.
+
+        Args:
+            db: 데이터베이스 세션
+            book_id: 도서 ID
+            data: 수정할 필드
+
+        Returns:
+            Book: 수정된 도서
+
+        Raises:
+            HTTPException: 도서가 없을 때
+        """
+        book = await db.get(Book, book_id)
+        if book is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="도서를 찾을 수 없습니다"
+            )
+
+        for field, value in data.model_dump(exclude_unset=True, exclude_none=True).items():
+            setattr(book, field, value)
+        await db.commit()
+        return book
+
+
+# ========== 응답 캐시 무효화 (세션 이벤트) ==========
+
+@event.listens_for(Session, "after_flush")
+def _collect_book_cache_tags(session: Session, flush_context) -> None:
+    """변경된 도서가 속한(또는 속했던) 테마 목록과 전체 목록을 무효화 대상으로 기록"""
+    tags = None
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, Book):
+            continue
+        if tags is None:
+            tags = session.info.setdefault(_PENDING_TAGS_KEY, set())
+        tags.update((BOOKS_ALL_TAG, BOOKS_SEARCH_TAG))
+
+        history = inspect(obj).attrs.theme.history
+        for theme in (obj.theme, *history.deleted):
+            if theme:
+                tags.add(theme_tag(theme))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_book_cache_tags(session: Session) -> None:
+    tags = session.info.pop(_PENDING_TAGS_KEY, None)
+    if tags:
+        response_cache.invalidate_tags_sync(tags)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_book_cache_tags(session: Session) -> None:
+    session.info.pop(_PENDING_TAGS_KEY, None)
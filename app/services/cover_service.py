@@ -0,0 +1,270 @@
+"""
+도서 표지 이미지 서비스
+업로드 본문을 청크 단위로 디스크에 쓰면서 크기 제한·해시를 처리하고, 내용 해시(SHA-256)를 파일 이름으로 저장
+
+- 같은 이미지를 여러 번 올려도 파일은 하나만 남는다 (URL도 같음)
+- 내용이 바뀌면 URL이 바뀌므로 표지 응답은 immutable로 오래 캐시해도 된다
+- 썸네일(JPEG, 너비별)은 전용 프로세스 풀에서 만들어 이벤트 루프를 막지 않는다
+- 저장 위치: {UPLOAD_DIR}/covers/{해시 앞 2자}/{해시}.{확장자}, 썸네일은 {해시}_w{너비}.jpg
+"""
+
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import re
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import anyio
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.book import Book
+from app.schemas.book import CoverUploadResponse
+from app.utils.images import IMAGE_TYPES, SNIFF_BYTES, make_thumbnails, sniff_image_type
+
+# 표지 파일 이름: {해시}.{확장자} 또는 {해시}_w{너비}.jpg
+COVER_NAME_PATTERN = re.compile(r"^(?P<digest>[0-9a-f]{64})(?:_w(?P<width>\d+))?\.(?P<ext>jpg|png|webp)$")
+
+
+def cover_dir() -> str:
+    return os.path.join(settings.UPLOAD_DIR, "covers")
+
+
+def cover_path(name: str) -> str:
+    """표지 파일 이름 → 디스크 경로 (해시 앞 2자로 디렉터리 분산)"""
+    return os.path.join(cover_dir(), name[:2], name)
+
+
+def cover_url(name: str) -> str:
+    return f"{settings.API_V1_PREFIX}/covers/{name}"
+
+
+def resolve_cover(name: str) -> Tuple[str, str, str]:
+    """
+    표지 파일 이름 확인
+
+    Returns:
+        tuple: (디스크 경로, Content-Type, ETag)
+
+    Raises:
+        HTTPException: 형식이 맞지 않는 이름이거나 파일이 없을 때
+    """
+    match = COVER_NAME_PATTERN.match(name)
+    path = cover_path(name) if match else None
+    if path is None or not os.path.isfile(path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="표지 이미지를 찾을 수 없습니다"
+        )
+    # 이름이 곧 내용 해시이므로 ETag로 그대로 사용
+    return path, IMAGE_TYPES[match.group("ext")], f'"{name.rsplit(".", 1)[0]}"'
+
+
+class ThumbnailPool:
+    """
+    썸네일 생성 프로세스 풀
+
+    이미지 디코딩·리사이즈는 수십~수백 ms의 CPU를 사용하므로 별도 프로세스에서 실행하고,
+    동시 실행 수를 세마포어로 제한한다. 부모의 DB 연결·스레드 상태를 복제하지 않도록 워커는 spawn으로 띄운다.
+    """
+
+    def __init__(self, max_workers: int, max_concurrency: int):
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """풀 지연 생성 (import 시점에 프로세스를 띄우지 않기 위함)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def make_thumbnails(self, source: str, widths: List[int], target_pattern: str) -> Dict[int, str]:
+        """
+        원본 검증 후 너비별 썸네일 생성 (app.utils.images.make_thumbnails 참고)
+
+        Raises:
+            ValueError: 이미지로 읽을 수 없을 때
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), make_thumbnails, source, widths, target_pattern)
+
+    def shutdown(self) -> None:
+        """풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 전역 썸네일 풀
+thumbnail_pool = ThumbnailPool(
+    max_workers=settings.COVER_THUMBNAIL_WORKERS,
+    max_concurrency=settings.COVER_THUMBNAIL_MAX_CONCURRENCY,
+)
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"파일 크기는 {settings.MAX_FILE_SIZE} 바이트 이하여야 합니다"
+    )
+
+
+def _unsupported_type() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail="JPEG, PNG, WEBP 이미지만 업로드할 수 있습니다"
+    )
+
+
+async def store_stream(chunks: AsyncIterator[bytes], max_size: int) -> Tuple[str, str, int, bool]:
+    """
+    업로드 본문을 임시 파일에 쓰면서 크기 제한·형식 확인·해시 계산 후 내용 주소로 이동
+
+    본문 전체를 메모리에 올리지 않으며, 제한을 넘는 순간 읽기를 멈춘다.
+
+    Args:
+        chunks: 요청 본문 청크
+        max_size: 최대 바이트 수
+
+    Returns:
+        tuple: (SHA-256 hex, 확장자, 바이트 수, 새로 저장했는지 여부)
+
+    Raises:
+        HTTPException: 크기 초과(413), 지원하지 않는 형식(415), 빈 본문(400)
+    """
+    tmp_dir = os.path.join(cover_dir(), "tmp")
+    os.makedirs(tmp_dir, exist_ok=True)
+    tmp_path = os.path.join(tmp_dir, f"{uuid.uuid4().hex}.part")
+
+    digest = hashlib.sha256()
+    size = 0
+    head = b""
+    ext: Optional[str] = None
+    try:
+        async with await anyio.open_file(tmp_path, "wb") as file:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if size > max_size:
+                    raise _too_large()
+                if ext is None:
+                    head += chunk[:SNIFF_BYTES]
+                    if len(head) >= SNIFF_BYTES:
+                        ext = sniff_image_type(head)
+                        if ext is None:
+                            raise _unsupported_type()
+                digest.update(chunk)
+                await file.write(chunk)
+
+        if size == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미지 본문이 비어 있습니다"
+            )
+        if ext is None:
+            ext = sniff_image_type(head)
+            if ext is None:
+                raise _unsupported_type()
+
+        name = f"{digest.hexdigest()}.{ext}"
+        path = cover_path(name)
+        if os.path.exists(path):
+            return digest.hexdigest(), ext, size, False
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 같은 파일 시스템 안의 이름 변경이므로 원자적 (동시에 같은 내용을 올려도 안전)
+        os.replace(tmp_path, path)
+        return digest.hexdigest(), ext, size, True
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class CoverService:
+    """도서 표지 서비스"""
+
+    @staticmethod
+    async def upload_cover(
+        db: AsyncSession,
+        book_id: str,
+        chunks: AsyncIterator[bytes],
+        content_length: Optional[int] = None,
+    ) -> CoverUploadResponse:
+        """
+        표지 업로드 후 도서의 cover_image를 새 URL로 변경
+
+        도서 존재만 확인한 뒤 DB 연결을 반납하고 본문을 받는다 (느린 업로드가 커넥션 풀을 잡지 않음).
+        도서는 썸네일까지 만든 뒤 다시 읽어 변경한다.
+        응답 캐시 무효화와 홈 피드 진열대 갱신은 세션 이벤트로 처리된다.
+        이전 표지 파일은 다른 도서가 같은 이미지를 쓸 수 있으므로 지우지 않는다.
+
+        Args:
+            db: 데이터베이스 세션
+            book_id: 도서 ID
+            chunks: 요청 본문 청크
+            content_length: Content-Length 헤더 값 (있으면 읽기 전에 크기 확인)
+
+        Returns:
+            CoverUploadResponse: 표지·썸네일 URL, 해시, 중복 여부
+
+        Raises:
+            HTTPException: 도서가 없을 때(404), 크기 초과(413), 지원하지 않는 형식(415), 손상된 이미지(422)
+        """
+        if await db.scalar(select(Book.id).where(Book.id == book_id)) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="도서를 찾을 수 없습니다"
+            )
+        # 업로드 수신·썸네일 생성 동안 DB 연결을 잡고 있지 않도록 반납
+        await db.commit()
+        if content_length is not None and content_length > settings.MAX_FILE_SIZE:
+            raise _too_large()
+
+        digest, ext, size, created = await store_stream(chunks, settings.MAX_FILE_SIZE)
+        name = f"{digest}.{ext}"
+        try:
+            thumbnails = await thumbnail_pool.make_thumbnails(
+                cover_path(name),
+                settings.cover_thumbnail_widths_list,
+                cover_path(f"{digest}_w{{width}}.jpg"),
+            )
+        except ValueError:
+            if created:
+                os.remove(cover_path(name))
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="이미지를 읽을 수 없습니다"
+            )
+
+        book = await db.get(Book, book_id)
+        if book is None:
+            # 업로드 중에 삭제된 도서 (저장한 파일은 내용 주소라 다른 도서가 쓸 수 있으므로 남김)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="도서를 찾을 수 없습니다"
+            )
+        book.cover_image = cover_url(name)
+        await db.commit()
+
+        return CoverUploadResponse(
+            book_id=book_id,
+            cover_image=book.cover_image,
+            thumbnails={width: cover_url(os.path.basename(path)) for width, path in thumbnails.items()},
+            sha256=digest,
+            size=size,
+            content_type=IMAGE_TYPES[ext],
+            deduplicated=not created,
+        )
@@ -0,0 +1,119 @@
+"""
+텍스트 임베딩
+도서 추천용 임베딩 생성기 (교체 가능)
+"""
+
+import hashlib
+import math
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import List, Optional
+
+from app.core.config import settings
+from app.utils.text import tokenize
+
+
+class Embedder(ABC):
+    """임베딩 생성기 기본 클래스"""
+
+    dim: int
+
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        텍스트 임베딩
+
+        Args:
+            texts: 텍스트 목록
+
+        Returns:
+            list: 텍스트별 dim 차원 벡터 (L2 정규화)
+        """
+
+
+class LocalHashEmbedder(Embedder):
+    """
+    결정적 로컬 임베딩
+
+    n-gram 토큰을 부호 있는 해싱(feature hashing)으로 고정 차원에 투영한다.
+    외부 API 없이 같은 입력에 항상 같은 벡터를 내므로 테스트·개발용으로 사용한다.
+    """
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    def embed_one(self, text: str) -> List[float]:
+        vector = [0.0] * self.dim
+        for token in tokenize(text):
+            digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dim
+            sign = 1.0 if digest[4] & 1 else -1.0
+            vector[bucket] += sign
+
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm == 0:
+            return vector
+        return [v / norm for v in vector]
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_one(text) for text in texts]
+
+
+class OpenAIEmbedder(Embedder):
+    """OpenAI 임베딩 API"""
+
+    def __init__(self, api_key: str, model: str, dim: int):
+        self.api_key = api_key
+        self.model = model
+        self.dim = dim
+        self._client = None
+
+    def _get_client(self):
+        # openai SDK는 실제로 사용할 때만 import
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(api_key=self.api_key)
+        return self._client
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        response = await self._get_client().embeddings.create(model=self.model, input=texts)
+        vectors = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        for vector in vectors:
+            if len(vector) != self.dim:
+                raise ValueError(f"임베딩 차원 불일치: {len(vector)} != EMBEDDING_DIM({self.dim})")
+        return vectors
+
+
+@lru_cache
+def get_embedder() -> Embedder:
+    """
+    설정에 따른 임베딩 생성기 반환
+
+    Returns:
+        Embedder: EMBEDDING_PROVIDER가 'openai'면 OpenAIEmbedder, 그 외에는 LocalHashEmbedder
+    """
+    if settings.EMBEDDING_PROVIDER == "openai":
+        return OpenAIEmbedder(
+            api_key=settings.OPENAI_API_KEY,
+            model=settings.OPENAI_EMBEDDING_MODEL,
+            dim=settings.EMBEDDING_DIM,
+        )
+    return LocalHashEmbedder(dim=settings.EMBEDDING_DIM)
+
+
+def book_embedding_text(
+    title: str,
+    author: Optional[str],
+    category: Optional[str],
+    keywords: Optional[str],
+    description: Optional[str],
+) -> str:
+    """
+    도서 임베딩 입력 텍스트 구성
+
+    Returns:
+        str: 제목·저자·분류·키워드·설명을 이어 붙인 텍스트
+    """
+    parts = [title, author, category, keywords, description]
+    return "\n".join(part for part in parts if part)
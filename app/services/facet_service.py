@@ -0,0 +1,190 @@
+"""
+도서 패싯 서비스
+탐색 화면의 패싯 수 조회와, ORM 밖 변경(대량 적재·마이그레이션) 후 태그·패싯 재계산
+"""
+
+import time
+from collections import Counter
+from typing import Optional, Tuple
+
+from sqlalchemy import Connection, Engine, case, delete, func, insert, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.book import Book
+from app.models.book_facet import (
+    ALL_SCOPE,
+    PRICE_BUCKET_BOUNDS,
+    BookFacetCount,
+    BookKeyword,
+    book_facets,
+    replace_book_keywords,
+)
+from app.schemas.book import BookFacets, FacetRebuildReport
+from app.utils.text import split_keywords
+
+
+def price_bucket_expr():
+    """price_bucket()과 같은 가격대를 계산하는 SQL 식"""
+    whens = [(Book.price.is_(None), None)]
+    whens.extend(
+        (Book.price < upper, literal(f"{lower}-{upper}"))
+        for lower, upper in zip(PRICE_BUCKET_BOUNDS, PRICE_BUCKET_BOUNDS[1:])
+    )
+    return case(*whens, else_=literal(f"{PRICE_BUCKET_BOUNDS[-1]}+"))
+
+
+class FacetService:
+    """도서 패싯 서비스"""
+
+    @staticmethod
+    async def facet_counts(
+        db: AsyncSession,
+        theme: Optional[str] = None,
+        keyword_limit: int = settings.BOOK_FACET_KEYWORD_LIMIT,
+    ) -> BookFacets:
+        """
+        패싯 값별 도서 수 (미리 집계된 book_facet_counts에서 한 번의 쿼리로 조회)
+
+        테마를 고르면 해당 테마 안의 수를, 아니면 전체 수를 돌려준다.
+        카테고리·키워드·가격대 선택은 수에 반영되지 않는다.
+
+        Args:
+            db: 데이터베이스 세션
+            theme: 테마 (없으면 전체)
+            keyword_limit: 키워드 패싯 최대 개수 (도서 수 많은 순)
+
+        Returns:
+            BookFacets: 패싯별 (값, 도서 수) 목록
+        """
+        facets = BookFacetCount.__table__
+        columns = (facets.c.facet, facets.c.value, facets.c.count)
+        in_scope = (facets.c.scope == (theme or ALL_SCOPE), facets.c.count > 0)
+
+        top_keywords = (
+            select(*columns)
+            .where(*in_scope, facets.c.facet == "keyword")
+            .order_by(facets.c.count.desc(), facets.c.value)
+            .limit(keyword_limit)
+            .subquery()
+        )
+        stmt = union_all(
+            select(*columns).where(*in_scope, facets.c.facet != "keyword"),
+            select(top_keywords),
+        )
+
+        grouped = {"theme": [], "category": [], "keyword": [], "price": []}
+        for facet, value, count in (await db.execute(stmt)).all():
+            grouped[facet].append({"value": value, "count": count})
+
+        # 가격대는 구간 순서, 나머지는 도서 수 많은 순
+        bucket_order = [f"{lower}-{upper}" for lower, upper in zip(PRICE_BUCKET_BOUNDS, PRICE_BUCKET_BOUNDS[1:])]
+        bucket_order.append(f"{PRICE_BUCKET_BOUNDS[-1]}+")
+        grouped["price"].sort(key=lambda item: bucket_order.index(item["value"]))
+        for facet in ("theme", "category", "keyword"):
+            grouped[facet].sort(key=lambda item: (-item["count"], item["value"]))
+
+        return BookFacets.model_validate(grouped)
+
+
+# ========== 재계산 (동기 연결, 관리자·적재·마이그레이션용) ==========
+
+def rebuild_book_keywords(
+    connection: Connection,
+    batch_size: int = 5000,
+    after_id: Optional[str] = None,
+) -> Tuple[int, int, Optional[str]]:
+    """
+    books.keywords에서 키워드 태그 행을 다시 생성 (id 키셋 배치 하나)
+
+    Args:
+        connection: 동기 DB 연결 (호출한 쪽의 트랜잭션에서 실행)
+        batch_size: 배치당 도서 수
+        after_id: 이전 배치의 마지막 도서 id
+
+    Returns:
+        tuple: (처리한 도서 수, 생성한 태그 행 수, 마지막 도서 id 또는 None)
+    """
+    stmt = select(Book.id, Book.keywords).order_by(Book.id).limit(batch_size)
+    if after_id is not None:
+        stmt = stmt.where(Book.id > after_id)
+    rows = connection.execute(stmt).all()
+    if not rows:
+        return 0, 0, None
+
+    books = [(book_id, split_keywords(keywords)) for book_id, keywords in rows]
+    replace_book_keywords(connection, books)
+    return len(books), sum(len(keywords) for _, keywords in books), rows[-1].id
+
+
+def rebuild_facet_counts(connection: Connection) -> int:
+    """
+    book_facet_counts 전체 재계산
+
+    도서·태그 테이블을 한 번씩 집계해 교체한다. 같은 트랜잭션 안에서 교체하므로
+    PostgreSQL 읽기는 커밋 전까지 이전 값을 본다.
+
+    Returns:
+        int: 생성한 패싯 행 수
+    """
+    counts: Counter = Counter()
+
+    books_by_bucket = select(Book.theme, Book.category, price_bucket_expr().label("bucket")).subquery()
+    grouped = connection.execute(
+        select(books_by_bucket, func.count())
+        .group_by(books_by_bucket.c.theme, books_by_bucket.c.category, books_by_bucket.c.bucket)
+    )
+    for theme, category, price, books in grouped:
+        for key in book_facets(theme, category, [], price):
+            counts[key] += books
+
+    keywords = connection.execute(
+        select(Book.theme, BookKeyword.keyword, func.count())
+        .join(Book, Book.id == BookKeyword.book_id)
+        .group_by(Book.theme, BookKeyword.keyword)
+    )
+    for theme, keyword, books in keywords:
+        for key in book_facets(theme, None, [keyword], None):
+            # 테마 패싯은 위에서 도서 단위로 셌으므로 키워드만 더함
+            if key[1] == "keyword":
+                counts[key] += books
+
+    table = BookFacetCount.__table__
+    connection.execute(delete(table))
+    rows = [
+        {"scope": scope, "facet": facet, "value": value, "count": count}
+        for (scope, facet, value), count in counts.items()
+    ]
+    if rows:
+        connection.execute(insert(table), rows)
+    return len(rows)
+
+
+def rebuild_book_index(engine: Engine, batch_size: int = 5000) -> FacetRebuildReport:
+    """
+    키워드 태그와 패싯 수 전체 재계산 (태그는 배치마다 커밋)
+
+    Args:
+        engine: 동기 엔진
+        batch_size: 태그 재생성 배치당 도서 수
+
+    Returns:
+        FacetRebuildReport: 처리한 도서 수, 태그·패싯 행 수
+    """
+    started = time.perf_counter()
+    report = FacetRebuildReport()
+
+    last_id: Optional[str] = None
+    while True:
+        with engine.begin() as conn:
+            books, keyword_rows, last_id = rebuild_book_keywords(conn, batch_size, last_id)
+        report.books_indexed += books
+        report.keyword_rows += keyword_rows
+        if last_id is None:
+            break
+
+    with engine.begin() as conn:
+        report.facet_rows = rebuild_facet_counts(conn)
+
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,284 @@
+"""
+홈 피드
+인기 도서·큐레이터 추천·테마별 진열대를 미리 직렬화해 home_shelves에 저장하고 한 번의 조회로 응답
+
+- ORM으로 도서가 바뀌면 같은 트랜잭션에서 영향받는 진열대를 stale로 표시하고,
+  커밋 후 그 진열대만 백그라운드에서 다시 만든다
+- 대량 적재·평점 반영 등 ORM 밖 변경은 mark_stale_stmt()로 전체를 stale로 표시
+- 응답할 때 stale 진열대가 있으면 현재 값을 그대로 응답하고 갱신을 예약한다
+  (이벤트 루프 밖 스크립트에서 바뀐 경우 등)
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
+
+import orjson
+from sqlalchemy import case, event, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import HOME_FEED_AGE, HOME_FEED_BUILD_SECONDS, HOME_FEED_REFRESH_LAG, HOME_FEED_STALENESS
+from app.core.serialization import orm_to_json
+from app.models.book import THEMES, Book
+from app.models.home_feed import HomeShelf
+from app.schemas.book import BookResponse
+
+logger = logging.getLogger(__name__)
+
+# 진열대 → (조건, 정렬)
+SHELVES = {
+    "popular": (Book.is_popular.is_(True), (Book.rating.desc().nulls_last(), Book.id.desc())),
+    "curator_picks": (Book.is_curator_pick.is_(True), (Book.created_at.desc(), Book.id.desc())),
+    **{
+        f"theme:{theme}": (Book.theme == theme, (Book.rating.desc().nulls_last(), Book.id.desc()))
+        for theme in THEMES
+    },
+}
+
+# 세션별 갱신 대기 진열대 키
+_PENDING_SHELVES_KEY = "home_feed_shelves"
+
+
+def book_shelves(is_popular: Optional[bool], is_curator_pick: Optional[bool], theme: Optional[str]) -> Set[str]:
+    """도서가 들어갈 수 있는 진열대"""
+    shelves = set()
+    if is_popular:
+        shelves.add("popular")
+    if is_curator_pick:
+        shelves.add("curator_picks")
+    if theme in THEMES:
+        shelves.add(f"theme:{theme}")
+    return shelves
+
+
+def mark_stale_stmt(keys: Optional[Iterable[str]] = None):
+    """
+    진열대를 stale로 표시하는 UPDATE 문 (keys가 없으면 전체)
+
+    version을 올리므로 이미 진행 중인 재생성이 끝나도 stale 표시가 남는다.
+    """
+    table = HomeShelf.__table__
+    stmt = update(table).values(
+        version=table.c.version + 1,
+        stale_since=case((table.c.stale_since.is_(None), datetime.utcnow()), else_=table.c.stale_since),
+    )
+    if keys is not None:
+        stmt = stmt.where(table.c.key.in_(sorted(keys)))
+    return stmt
+
+
+class HomeFeedService:
+    """홈 피드 서비스"""
+
+    @staticmethod
+    async def build_shelf(db: AsyncSession, key: str) -> Tuple[bytes, int]:
+        """
+        진열대 하나 직렬화
+
+        Returns:
+            tuple: (List[BookResponse] JSON, 도서 수)
+        """
+        condition, order_by = SHELVES[key]
+        result = await db.execute(
+            select(Book).where(condition).order_by(*order_by).limit(settings.HOME_FEED_SHELF_SIZE)
+        )
+        books = result.scalars().all()
+        return orm_to_json(List[BookResponse], books), len(books)
+
+    @staticmethod
+    async def refresh(db: AsyncSession, keys: Optional[Iterable[str]] = None, stale_only: bool = False) -> List[str]:
+        """
+        진열대 다시 만들기
+
+        만들기 시작할 때 읽은 version이 저장 시점에도 같을 때만 stale 표시를 지운다.
+        그 사이에 들어온 변경은 다음 갱신에서 반영된다.
+
+        Args:
+            db: 데이터베이스 세션 (주 DB)
+            keys: 진열대 키 (없으면 전체)
+            stale_only: True면 stale이거나 아직 없는 진열대만
+
+        Returns:
+            list: 다시 만든 진열대 키
+        """
+        keys = [key for key in (keys or SHELVES) if key in SHELVES]
+        table = HomeShelf.__table__
+        current = {
+            row.key: row
+            for row in await db.execute(
+                select(table.c.key, table.c.version, table.c.stale_since).where(table.c.key.in_(keys))
+            )
+        }
+        if stale_only:
+            keys = [key for key in keys if key not in current or current[key].stale_since is not None]
+
+        dialect_insert = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+        for key in keys:
+            started = time.perf_counter()
+            body, book_count = await HomeFeedService.build_shelf(db, key)
+            built_at = datetime.utcnow()
+            values = {"body": body.decode(), "book_count": book_count, "built_at": built_at}
+
+            row = current.get(key)
+            if row is None:
+                stmt = dialect_insert(table).values(key=key, version=0, stale_since=None, **values)
+                # 다른 워커가 먼저 만들었으면 내용만 덮어씀 (stale 표시는 유지)
+                await db.execute(stmt.on_conflict_do_update(index_elements=[table.c.key], set_=values))
+            else:
+                await db.execute(
+                    update(table)
+                    .where(table.c.key == key)
+                    .values(
+                        **values,
+                        stale_since=case((table.c.version == row.version, None), else_=table.c.stale_since),
+                    )
+                )
+                if row.stale_since is not None:
+                    HOME_FEED_REFRESH_LAG.observe((built_at - row.stale_since).total_seconds())
+            HOME_FEED_BUILD_SECONDS.labels(key).observe(time.perf_counter() - started)
+
+        await db.commit()
+        return keys
+
+    @staticmethod
+    async def get_feed(db: AsyncSession) -> bytes:
+        """
+        홈 피드 응답 본문 (home_shelves 한 번 조회, 진열대 JSON은 다시 직렬화하지 않음)
+
+        진열대가 아직 없으면(최초 배포 직후) 주 DB에서 만든 뒤 응답한다.
+
+        Args:
+            db: 데이터베이스 세션 (읽기 복제본 가능)
+
+        Returns:
+            bytes: HomeFeedResponse JSON
+        """
+        table = HomeShelf.__table__
+        stmt = select(table.c.key, table.c.body, table.c.built_at, table.c.stale_since)
+        rows = {row.key: row for row in await db.execute(stmt)}
+
+        if any(key not in rows for key in SHELVES):
+            async with AsyncSessionLocal() as primary:
+                await HomeFeedService.refresh(primary, [key for key in SHELVES if key not in rows])
+                rows = {row.key: row for row in await primary.execute(stmt)}
+
+        stale = [key for key in SHELVES if rows[key].stale_since is not None]
+        if stale:
+            refresh_nowait(stale)
+
+        now = datetime.utcnow()
+        built_at = min(rows[key].built_at for key in SHELVES)
+        HOME_FEED_AGE.set((now - built_at).total_seconds())
+        HOME_FEED_STALENESS.set(
+            max((now - rows[key].stale_since).total_seconds() for key in stale) if stale else 0.0
+        )
+
+        return orjson.dumps({
+            "shelves": {key: orjson.Fragment(rows[key].body) for key in SHELVES},
+            "built_at": built_at,
+            "stale": bool(stale),
+        })
+
+    @staticmethod
+    async def stats(db: AsyncSession) -> dict:
+        """
+        진열대별 상태 (관리자)
+
+        Returns:
+            dict: 진열대별 도서 수, version, 경과 시간, 반영 대기 시간 (0: 최신)
+        """
+        now = datetime.utcnow()
+        result = await db.execute(select(HomeShelf).order_by(HomeShelf.key))
+        return {
+            shelf.key: {
+                "book_count": shelf.book_count,
+                "version": shelf.version,
+                "age_seconds": (now - shelf.built_at).total_seconds(),
+                "stale_seconds": (now - shelf.stale_since).total_seconds() if shelf.stale_since else 0.0,
+            }
+            for shelf in result.scalars()
+        }
+
+
+# ========== 백그라운드 갱신 ==========
+
+_pending_refresh: Set[str] = set()
+_refresh_task: Optional[asyncio.Task] = None
+
+
+async def _run_pending_refresh() -> None:
+    while _pending_refresh:
+        keys = sorted(_pending_refresh)
+        _pending_refresh.clear()
+        try:
+            async with AsyncSessionLocal() as db:
+                await HomeFeedService.refresh(db, keys, stale_only=True)
+        except Exception:
+            # stale 표시가 남아 있으므로 다음 응답이나 갱신 작업에서 다시 시도된다
+            logger.exception("홈 피드 갱신 실패: %s", keys)
+
+
+def refresh_nowait(keys: Iterable[str]) -> None:
+    """
+    진열대 갱신 예약 (워커당 한 번에 하나의 갱신 작업이 대기 키를 모아서 처리)
+
+    이벤트 루프 밖(스크립트 등)에서는 아무것도 하지 않는다.
+    """
+    global _refresh_task
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    _pending_refresh.update(keys)
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = loop.create_task(_run_pending_refresh())
+
+
+# ========== 변경 감지 (세션 이벤트) ==========
+
+def _previous(state, field: str):
+    history = state.attrs[field].history
+    return history.deleted[0] if history.deleted else state.attrs[field].value
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_home_shelves_stale(session: Session, flush_context) -> None:
+    """바뀐 도서가 들어 있거나 들어갈 진열대를 같은 트랜잭션에서 stale로 표시"""
+    keys: Set[str] = set()
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, Book):
+            keys |= book_shelves(obj.is_popular, obj.is_curator_pick, obj.theme)
+
+    for obj in session.dirty:
+        if not isinstance(obj, Book) or not session.is_modified(obj):
+            continue
+        state = inspect(obj)
+        keys |= book_shelves(obj.is_popular, obj.is_curator_pick, obj.theme)
+        keys |= book_shelves(
+            _previous(state, "is_popular"), _previous(state, "is_curator_pick"), _previous(state, "theme")
+        )
+
+    if keys:
+        session.connection().execute(mark_stale_stmt(keys))
+        session.info.setdefault(_PENDING_SHELVES_KEY, set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_home_shelves(session: Session) -> None:
+    keys = session.info.pop(_PENDING_SHELVES_KEY, None)
+    if keys:
+        refresh_nowait(keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_home_shelves(session: Session) -> None:
+    session.info.pop(_PENDING_SHELVES_KEY, None)
+
@@ -0,0 +1,285 @@
+"""
+도서 대량 적재
+CSV/JSONL 스트림을 배치 단위로 검증하고 PostgreSQL COPY + ISBN 기준 upsert로 적재
+"""
+
+import csv
+import io
+import json
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import Engine
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.book import Book
+from app.models.book_facet import replace_book_keywords
+from app.schemas.book import BookCreate, BookIngestReject, BookIngestReport
+from app.services.facet_service import rebuild_facet_counts
+from app.services.home_feed_service import mark_stale_stmt
+from app.utils.ids import new_id
+from app.utils.text import split_keywords, to_search_document
+
+# BookCreate 필드 = 적재 대상 컬럼
+BOOK_FIELDS = list(BookCreate.model_fields)
+
+# 검색 벡터 구성용 토큰 문서 컬럼 (가중치 순서: title A, author B, keywords C, description D)
+SEARCH_DOC_FIELDS = ("title", "author", "keywords", "description")
+
+# 리포트에 남기는 거부 행 최대 개수
+MAX_REPORTED_REJECTS = 100
+
+STAGING_DDL = """
+CREATE TEMP TABLE IF NOT EXISTS books_staging (
+    id UUID,
+    title VARCHAR(500),
+    author VARCHAR(200),
+    publisher VARCHAR(200),
+    isbn VARCHAR(20),
+    cover_image VARCHAR(500),
+    description TEXT,
+    price INTEGER,
+    theme VARCHAR(50),
+    category VARCHAR(100),
+    keywords TEXT,
+    published_date DATE,
+    page_count INTEGER,
+    title_doc TEXT,
+    author_doc TEXT,
+    keywords_doc TEXT,
+    description_doc TEXT
+) ON COMMIT DELETE ROWS
+"""
+
+STAGING_COLUMNS = ["id", *BOOK_FIELDS, *(f"{field}_doc" for field in SEARCH_DOC_FIELDS)]
+
+# 제목/설명이 바뀐 도서는 임베딩을 비워 백필 대상이 되도록 한다
+MERGE_SQL = f"""
+INSERT INTO books (
+    {", ".join(["id", *BOOK_FIELDS])},
+    rating, review_count, is_popular, is_curator_pick,
+    created_at, updated_at, search_vector
+)
+SELECT
+    {", ".join(["id", *BOOK_FIELDS])},
+    0.0, 0, false, false,
+    now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc',
+    setweight(to_tsvector('simple', coalesce(title_doc, '')), 'A')
+    || setweight(to_tsvector('simple', coalesce(author_doc, '')), 'B')
+    || setweight(to_tsvector('simple', coalesce(keywords_doc, '')), 'C')
+    || setweight(to_tsvector('simple', coalesce(description_doc, '')), 'D')
+FROM books_staging
+ON CONFLICT (isbn) DO UPDATE SET
+    {", ".join(f"{field} = EXCLUDED.{field}" for field in BOOK_FIELDS if field != "isbn")},
+    updated_at = EXCLUDED.updated_at,
+    search_vector = EXCLUDED.search_vector,
+    embedding = CASE
+        WHEN books.title IS DISTINCT FROM EXCLUDED.title
+          OR books.description IS DISTINCT FROM EXCLUDED.description
+        THEN NULL ELSE books.embedding
+    END
+RETURNING (xmax = 0) AS inserted, id, keywords
+"""
+
+# 적재한 도서의 키워드 태그 행 교체 (같은 트랜잭션)
+DELETE_KEYWORDS_SQL = "DELETE FROM book_keywords WHERE book_id = ANY(%s::uuid[])"
+
+
+def iter_records(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """
+    입력 스트림을 한 행씩 읽기 (파일 전체를 메모리에 올리지 않음)
+
+    Args:
+        stream: 텍스트 스트림
+        fmt: 'csv' 또는 'jsonl'
+
+    Yields:
+        tuple: (행 번호, 레코드 또는 None, 파싱 오류 또는 None)
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            # 빈 셀은 값 없음으로 취급
+            yield reader.line_num, {k: (v if v != "" else None) for k, v in record.items() if k}, None
+        return
+
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, None, f"JSON 파싱 오류: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, None, "JSON 객체가 아닙니다"
+            continue
+        yield line_no, record, None
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
+
+
+class BookIngestor:
+    """
+    도서 적재기
+
+    배치 크기만큼 검증된 행을 모아 한 번에 적재하므로
+    메모리 사용량은 입력 크기와 무관하게 배치 크기에 비례한다.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int = 5000,
+        on_progress: Optional[Callable[[BookIngestReport], None]] = None,
+    ):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.on_progress = on_progress
+
+    def run(self, records: Iterable[Tuple[int, Optional[dict], Optional[str]]]) -> BookIngestReport:
+        """
+        적재 실행
+
+        Args:
+            records: iter_records()의 결과
+
+        Returns:
+            BookIngestReport: 처리 결과 (읽은 행, 삽입/갱신 수, 거부 행, 처리 속도)
+        """
+        report = BookIngestReport()
+        started = time.perf_counter()
+        batch: Dict[object, dict] = {}
+
+        for line_no, record, parse_error in records:
+            report.rows_read += 1
+
+            if parse_error is None:
+                try:
+                    book = BookCreate.model_validate(record)
+                except ValidationError as e:
+                    parse_error = _format_validation_error(e)
+
+            if parse_error is not None:
+                report.rows_rejected += 1
+                if len(report.rejects) < MAX_REPORTED_REJECTS:
+                    report.rejects.append(BookIngestReject(line=line_no, error=parse_error))
+                continue
+
+            # 같은 배치 안에서 ISBN이 겹치면 마지막 행만 반영 (ON CONFLICT는 한 문장에서 같은 행을 두 번 갱신할 수 없음)
+            key = book.isbn if book.isbn else ("line", line_no)
+            batch[key] = book.model_dump()
+
+            if len(batch) >= self.batch_size:
+                self._flush(list(batch.values()), report, started)
+                batch.clear()
+
+        if batch:
+            self._flush(list(batch.values()), report, started)
+
+        # 증분 갱신을 거치지 않았으므로 패싯 수는 적재가 끝난 뒤 한 번 재계산하고 홈 피드는 stale로 표시
+        if report.batches:
+            with self.engine.begin() as conn:
+                rebuild_facet_counts(conn)
+                conn.execute(mark_stale_stmt())
+
+        report.elapsed_seconds = time.perf_counter() - started
+        report.rows_per_second = report.rows_read / report.elapsed_seconds if report.elapsed_seconds else 0.0
+        return report
+
+    def _flush(self, rows: List[dict], report: BookIngestReport, started: float) -> None:
+        """배치 적재 후 진행 상황 보고"""
+        if self.engine.dialect.name == "postgresql":
+            inserted, updated = self._load_copy(rows)
+        else:
+            inserted, updated = self._load_upsert(rows)
+
+        report.rows_inserted += inserted
+        report.rows_updated += updated
+        report.batches += 1
+        report.elapsed_seconds = time.perf_counter() - started
+        report.rows_per_second = report.rows_read / report.elapsed_seconds if report.elapsed_seconds else 0.0
+
+        if self.on_progress is not None:
+            self.on_progress(report)
+
+    def _load_copy(self, rows: List[dict]) -> Tuple[int, int]:
+        """
+        PostgreSQL 적재: 임시 스테이징 테이블에 COPY 후 ON CONFLICT (isbn) 병합
+
+        Returns:
+            tuple: (삽입 수, 갱신 수)
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            docs = [to_search_document([row.get(field)]) for field in SEARCH_DOC_FIELDS]
+            writer.writerow([new_id(), *(row[field] for field in BOOK_FIELDS), *docs])
+        buffer.seek(0)
+
+        raw = self.engine.raw_connection()
+        try:
+            with raw.cursor() as cursor:
+                cursor.execute(STAGING_DDL)
+                cursor.copy_expert(
+                    f"COPY books_staging ({', '.join(STAGING_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                    buffer,
+                )
+                cursor.execute(MERGE_SQL)
+                merged = cursor.fetchall()
+
+                cursor.execute(DELETE_KEYWORDS_SQL, ([book_id for _, book_id, _ in merged],))
+                keyword_buffer = io.StringIO()
+                keyword_writer = csv.writer(keyword_buffer)
+                for _, book_id, keywords in merged:
+                    for keyword in split_keywords(keywords):
+                        keyword_writer.writerow([keyword, book_id])
+                keyword_buffer.seek(0)
+                cursor.copy_expert("COPY book_keywords (keyword, book_id) FROM STDIN WITH (FORMAT csv)", keyword_buffer)
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+
+        inserted = sum(1 for flag, _, _ in merged if flag)
+        return inserted, len(merged) - inserted
+
+    def _load_upsert(self, rows: List[dict]) -> Tuple[int, int]:
+        """
+        PostgreSQL 외 DB(SQLite 테스트 등) 적재: 배치 단위 INSERT ... ON CONFLICT
+
+        삽입/갱신을 구분할 수 없어 모두 삽입 수로 집계한다.
+        """
+        table = Book.__table__
+        dialect_insert = sqlite.insert if self.engine.dialect.name == "sqlite" else postgresql.insert
+
+        values = []
+        for row in rows:
+            values.append({
+                "id": new_id(),
+                **row,
+                "search_vector": to_search_document(row.get(field) for field in SEARCH_DOC_FIELDS),
+            })
+
+        stmt = dialect_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.isbn],
+            set_={
+                **{field: stmt.excluded[field] for field in [*BOOK_FIELDS, "search_vector"] if field != "isbn"},
+                "updated_at": datetime.utcnow(),
+            },
+        )
+        with self.engine.begin() as conn:
+            merged = conn.execute(stmt.returning(table.c.id, table.c.keywords), values).all()
+            replace_book_keywords(conn, [(book_id, split_keywords(keywords)) for book_id, keywords in merged])
+
+        return len(rows), 0
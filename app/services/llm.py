@@ -0,0 +1,404 @@
+"""
+LLM 제공자 풀
+AI 추천 설명 등 텍스트 생성을 토큰 단위로 스트리밍 (교체 가능한 제공자 + 장애 전환)
+
+- 제공자별로 연결을 재사용하는 비동기 HTTP 클라이언트(httpx)와 동시 요청 수 세마포어를 둔다
+- 자리가 나지 않거나(LLM_QUEUE_TIMEOUT) 첫 토큰 전에 실패·시간 초과하면 다음 제공자로 넘어간다
+- 실패한 제공자는 LLM_FAILOVER_COOLDOWN 동안 후순위로 미룬다
+- 첫 토큰을 보낸 뒤의 실패는 전환하지 않고 오류로 끝낸다 (이미 보낸 토큰을 되돌릴 수 없음)
+"""
+
+import asyncio
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+import orjson
+
+from app.core.config import settings
+from app.core.metrics import LLM_IN_FLIGHT, LLM_REQUESTS, LLM_TIME_TO_FIRST_TOKEN
+
+logger = logging.getLogger(__name__)
+
+
+class LLMError(Exception):
+    """제공자 호출 실패 (HTTP 오류, 잘못된 응답 등)"""
+
+
+class LLMUnavailable(Exception):
+    """사용할 수 있는 제공자가 없음 (모두 실패 또는 포화)"""
+
+
+class LLMProvider(ABC):
+    """LLM 제공자 기본 클래스"""
+
+    name: str
+
+    @abstractmethod
+    async def stream(self, system: str, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """
+        텍스트 생성 스트리밍
+
+        Args:
+            system: 시스템 지시문
+            prompt: 사용자 메시지
+            max_tokens: 최대 생성 토큰 수
+
+        Yields:
+            str: 생성된 텍스트 조각
+
+        Raises:
+            LLMError: 호출 실패
+        """
+
+    async def aclose(self) -> None:
+        """연결 정리"""
+
+
+class HTTPProvider(LLMProvider):
+    """SSE로 응답하는 HTTP API 제공자 (클라이언트는 지연 생성, 연결 재사용)"""
+
+    base_url: str
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @abstractmethod
+    def _headers(self) -> Dict[str, str]:
+        """인증 등 요청 공통 헤더"""
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers(),
+                timeout=httpx.Timeout(settings.LLM_READ_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def _events(self, path: str, body: dict) -> AsyncIterator[Tuple[str, str]]:
+        """POST 후 SSE 이벤트 (event, data) 순회"""
+        try:
+            async with self._get_client().stream("POST", path, json=body) as response:
+                if response.status_code != 200:
+                    detail = (await response.aread())[:500]
+                    raise LLMError(f"{self.name} HTTP {response.status_code}: {detail!r}")
+
+                event, data = "message", []
+                async for line in response.aiter_lines():
+                    if not line:
+                        if data:
+                            yield event, "\n".join(data)
+                        event, data = "message", []
+                    elif line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        data.append(line[5:].lstrip())
+        except httpx.HTTPError as e:
+            raise LLMError(f"{self.name} 요청 실패: {e!r}") from e
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class OpenAIProvider(HTTPProvider):
+    """OpenAI Chat Completions API"""
+
+    name = "openai"
+    base_url = "https://api.openai.com/v1"
+
+    def __init__(self, api_key: str, model: str, max_connections: int):
+        super().__init__(max_connections)
+        self.api_key = api_key
+        self.model = model
+
+    def _headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    async def stream(self, system: str, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        body = {
+            "model": self.model,
+            "messages": [{"role": "system", "content": system}, {"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+        async for _, data in self._events("/chat/completions", body):
+            if data == "[DONE]":
+                return
+            try:
+                choices = orjson.loads(data).get("choices") or []
+                text = choices[0].get("delta", {}).get("content") if choices else None
+            except (orjson.JSONDecodeError, AttributeError, TypeError) as e:
+                # 첫 토큰 전이면 풀이 다음 제공자로 전환하도록 LLMError로 변환
+                raise LLMError(f"openai 잘못된 응답: {data[:200]!r}") from e
+            if text:
+                yield text
+
+
+class AnthropicProvider(HTTPProvider):
+    """Anthropic Messages API"""
+
+    name = "anthropic"
+    base_url = "https://api.anthropic.com/v1"
+
+    def __init__(self, api_key: str, model: str, max_connections: int):
+        super().__init__(max_connections)
+        self.api_key = api_key
+        self.model = model
+
+    def _headers(self) -> Dict[str, str]:
+        return {"x-api-key": self.api_key, "anthropic-version": "2023-06-01"}
+
+    async def stream(self, system: str, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        body = {
+            "model": self.model,
+            "system": system,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+        async for event, data in self._events("/messages", body):
+            if event == "error":
+                raise LLMError(f"anthropic 스트림 오류: {data[:500]}")
+            if event == "message_stop":
+                return
+            if event == "content_block_delta":
+                try:
+                    delta = orjson.loads(data).get("delta", {})
+                    text = delta.get("text") if delta.get("type") == "text_delta" else None
+                except (orjson.JSONDecodeError, AttributeError) as e:
+                    raise LLMError(f"anthropic 잘못된 응답: {data[:200]!r}") from e
+                if text:
+                    yield text
+
+
+class StubProvider(LLMProvider):
+    """
+    로컬 스텁 제공자 (테스트·개발용)
+
+    외부 API 없이 첫 토큰 지연과 토큰 간격을 흉내 내며,
+    프롬프트의 '- ' 목록 항목으로 결정적인 설명문을 만든다.
+    """
+
+    def __init__(
+        self,
+        name: str = "stub",
+        first_token_delay: float = 0.3,
+        token_delay: float = 0.02,
+        error_rate: float = 0.0,
+    ):
+        self.name = name
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.error_rate = error_rate
+
+    @staticmethod
+    def compose(prompt: str) -> str:
+        items = [line[2:].strip() for line in prompt.splitlines() if line.startswith("- ")]
+        sentences = ["요청하신 내용과 가까운 도서를 골랐습니다."]
+        sentences.extend(f"{item}을(를) 추천합니다." for item in items)
+        return " ".join(sentences)
+
+    async def stream(self, system: str, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        await asyncio.sleep(self.first_token_delay)
+        if self.error_rate and random.random() < self.error_rate:
+            raise LLMError(f"{self.name} 시뮬레이션 오류")
+
+        words = self.compose(prompt).split(" ")[:max_tokens]
+        for index, word in enumerate(words):
+            if index:
+                await asyncio.sleep(self.token_delay)
+            yield word if index == len(words) - 1 else f"{word} "
+
+
+class _ProviderState:
+    """제공자별 세마포어와 상태"""
+
+    def __init__(self, provider: LLMProvider, max_concurrency: int):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+
+        # 지표
+        self.requests = 0
+        self.failures = 0
+        self.total_ttft_seconds = 0.0
+        self.first_tokens = 0
+
+
+class LLMPool:
+    """
+    LLM 제공자 풀
+
+    제공자를 우선순위 순으로 시도하며, 쿨다운 중인 제공자는 다른 제공자가 모두 실패했을 때만 쓴다.
+    """
+
+    def __init__(
+        self,
+        providers: List[LLMProvider],
+        max_concurrency: int,
+        queue_timeout: float,
+        first_token_timeout: float,
+        cooldown: float,
+    ):
+        self.queue_timeout = queue_timeout
+        self.first_token_timeout = first_token_timeout
+        self.cooldown = cooldown
+        self._states = [_ProviderState(provider, max_concurrency) for provider in providers]
+
+    @property
+    def provider_names(self) -> List[str]:
+        return [state.provider.name for state in self._states]
+
+    def _ordered(self) -> List[_ProviderState]:
+        now = time.monotonic()
+        ready = [state for state in self._states if state.cooldown_until <= now]
+        cooling = [state for state in self._states if state.cooldown_until > now]
+        return ready + cooling
+
+    async def stream(
+        self,
+        system: str,
+        prompt: str,
+        max_tokens: int = settings.LLM_MAX_TOKENS,
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        텍스트 생성 스트리밍 (제공자 장애 전환)
+
+        Args:
+            system: 시스템 지시문
+            prompt: 사용자 메시지
+            max_tokens: 최대 생성 토큰 수
+
+        Yields:
+            tuple: (응답한 제공자 이름, 텍스트 조각)
+
+        Raises:
+            LLMUnavailable: 모든 제공자가 첫 토큰 전에 실패했거나 포화 상태일 때
+            LLMError: 첫 토큰 이후 스트림이 끊겼을 때
+        """
+        started = time.perf_counter()
+        errors = []
+        for state in self._ordered():
+            name = state.provider.name
+            try:
+                await asyncio.wait_for(state.semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                LLM_REQUESTS.labels(name, "saturated").inc()
+                errors.append(f"{name}: saturated")
+                continue
+
+            state.requests += 1
+            state.in_flight += 1
+            LLM_IN_FLIGHT.labels(name).inc()
+            tokens = state.provider.stream(system, prompt, max_tokens)
+            first_sent = False
+            try:
+                try:
+                    async with asyncio.timeout(self.first_token_timeout):
+                        first = await anext(tokens, None)
+                except (LLMError, TimeoutError) as e:
+                    outcome = "timeout" if isinstance(e, TimeoutError) else "error"
+                    LLM_REQUESTS.labels(name, outcome).inc()
+                    state.failures += 1
+                    state.cooldown_until = time.monotonic() + self.cooldown
+                    logger.warning("LLM 제공자 전환 (%s): %r", name, e)
+                    errors.append(f"{name}: {outcome}")
+                    continue
+
+                ttft = time.perf_counter() - started
+                LLM_TIME_TO_FIRST_TOKEN.labels(name).observe(ttft)
+                state.first_tokens += 1
+                state.total_ttft_seconds += ttft
+
+                if first is not None:
+                    first_sent = True
+                    yield name, first
+                async for text in tokens:
+                    yield name, text
+                LLM_REQUESTS.labels(name, "success").inc()
+                return
+            except LLMError:
+                if first_sent:
+                    LLM_REQUESTS.labels(name, "error").inc()
+                    state.failures += 1
+                raise
+            finally:
+                await tokens.aclose()
+                state.in_flight -= 1
+                LLM_IN_FLIGHT.labels(name).dec()
+                state.semaphore.release()
+
+        raise LLMUnavailable(", ".join(errors) or "설정된 LLM 제공자가 없습니다")
+
+    def stats(self) -> dict:
+        """
+        제공자별 지표 (관리자)
+
+        Returns:
+            dict: 제공자별 동시 요청 수, 요청·실패 수, 평균 첫 토큰 시간, 쿨다운 남은 시간
+        """
+        now = time.monotonic()
+        return {
+            state.provider.name: {
+                "max_concurrency": state.max_concurrency,
+                "in_flight": state.in_flight,
+                "requests": state.requests,
+                "failures": state.failures,
+                "avg_ttft_seconds": state.total_ttft_seconds / state.first_tokens if state.first_tokens else None,
+                "cooldown_seconds": max(0.0, state.cooldown_until - now),
+            }
+            for state in self._states
+        }
+
+    async def aclose(self) -> None:
+        """제공자 연결 정리"""
+        for state in self._states:
+            await state.provider.aclose()
+
+
+def build_providers() -> List[LLMProvider]:
+    """
+    LLM_PROVIDERS 설정에 따른 제공자 목록 (API 키가 없는 제공자는 제외)
+
+    Returns:
+        list: 우선순위 순 제공자
+    """
+    providers: List[LLMProvider] = []
+    for name in settings.llm_providers_list:
+        if name == "openai" and settings.OPENAI_API_KEY:
+            providers.append(OpenAIProvider(
+                settings.OPENAI_API_KEY, settings.OPENAI_CHAT_MODEL, settings.LLM_MAX_CONCURRENCY
+            ))
+        elif name == "anthropic" and settings.ANTHROPIC_API_KEY:
+            providers.append(AnthropicProvider(
+                settings.ANTHROPIC_API_KEY, settings.ANTHROPIC_MODEL, settings.LLM_MAX_CONCURRENCY
+            ))
+        elif name == "stub":
+            providers.append(StubProvider(
+                first_token_delay=settings.LLM_STUB_FIRST_TOKEN_MS / 1000,
+                token_delay=settings.LLM_STUB_TOKEN_MS / 1000,
+            ))
+    return providers
+
+
+# 전역 LLM 풀
+llm_pool = LLMPool(
+    build_providers(),
+    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+    queue_timeout=settings.LLM_QUEUE_TIMEOUT,
+    first_token_timeout=settings.LLM_FIRST_TOKEN_TIMEOUT,
+    cooldown=settings.LLM_FAILOVER_COOLDOWN,
+)
@@ -0,0 +1,228 @@
+from typing import AsyncIterator, Hashable, List, Optional, Tuple
+
+import orjson
+from fastapi import HTTPException, status
+from sqlalchemy import literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.replicas import replica_router
+from app.core.serialization import orm_fields, to_json
+from app.models.book import THEMES, Book
+from app.schemas.book import BookBase, RecommendedBook, RecommendedBookList
+from app.services.embedding import get_embedder
+from app.services.llm import LLMError, LLMUnavailable, llm_pool
+from app.services.semantic_cache import recommendation_cache
+
+# 추천 설명 생성 지시문
+EXPLANATION_SYSTEM_PROMPT = (
+    "당신은 온라인 서점 ChaekMate의 도서 큐레이터입니다. "
+    "사용자의 요청과 검색된 추천 도서 목록을 보고, 각 도서가 요청에 어울리는 이유를 "
+    "한국어로 짧고 친근하게 설명하세요. 목록에 없는 도서는 언급하지 마세요. "
+    "비슷한 요청에도 같은 설명을 보여주므로 요청 문장을 그대로 인용하지 마세요."
+)
+
+
+def recommendation_reason(query: str) -> str:
+    """추천 도서별 이유 문구"""
+    return f"'{query}' 요청과 내용이 가까운 도서입니다"
+
+
+def explanation_prompt(query: str, result: RecommendedBookList) -> str:
+    """추천 설명 요청 메시지 (도서는 '- 제목 (저자)' 목록)"""
+    lines = [f"요청: {query}", "", "추천 도서:"]
+    lines.extend(f"- {book.title} ({book.author})" for book in result.books)
+    lines.extend(["", "각 도서를 한두 문장으로 소개해 주세요."])
+    return "\n".join(lines)
+
+
+class RecommendationService:
+    """임베딩 기반 도서 추천 서비스 클래스"""
+
+    @staticmethod
+    async def find_similar_books(
+        db: AsyncSession,
+        vector: List[float],
+        theme: Optional[str] = None,
+        k: int = 10,
+    ) -> List[Tuple[Book, float]]:
+        """
+        임베딩 최근접 도서 검색 (HNSW ANN)
+
+        테마 조건은 테마별 부분 HNSW 인덱스와 정확히 일치하므로
+        필터가 있어도 카탈로그 전체를 스캔하지 않는다.
+
+        Args:
+            db: 데이터베이스 세션
+            vector: 질의 임베딩
+            theme: 테마 필터
+            k: 결과 수
+
+        Returns:
+            list: (도서, 코사인 유사도) 목록, 유사도 내림차순
+
+        Raises:
+            HTTPException: pgvector를 사용할 수 없는 DB일 때
+        """
+        if db.bind.dialect.name != "postgresql":
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="벡터 검색은 PostgreSQL(pgvector)에서만 지원됩니다"
+            )
+
+        # 트랜잭션 범위의 HNSW 탐색 폭 (k보다 작으면 결과가 k개 미만이 될 수 있음)
+        ef_search = max(settings.EMBEDDING_HNSW_EF_SEARCH, k)
+        await db.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+
+        distance = Book.embedding.cosine_distance(vector).label("distance")
+        stmt = select(Book, distance).where(Book.embedding.isnot(None))
+        if theme is not None:
+            if theme not in THEMES:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="알 수 없는 테마입니다"
+                )
+            # 바인드 파라미터로 넘기면 일반(generic) 실행 계획에서 부분 인덱스를 쓰지 못하므로 리터럴로 렌더링
+            stmt = stmt.where(Book.theme == literal(theme, literal_execute=True))
+        stmt = stmt.order_by(distance).limit(k)
+
+        result = await db.execute(stmt)
+        return [(book, 1.0 - float(dist)) for book, dist in result.all()]
+
+    @staticmethod
+    async def recommend(
+        db: AsyncSession,
+        query: str,
+        theme: Optional[str] = None,
+        k: int = 10,
+        vector: Optional[List[float]] = None,
+    ) -> RecommendedBookList:
+        """
+        자연어 요청 기반 도서 추천
+
+        Args:
+            db: 데이터베이스 세션
+            query: 추천 요청 (예: '퇴근 후 힐링되는 소설')
+            theme: 테마 필터
+            k: 추천 수
+            vector: 이미 계산한 요청 임베딩 (없으면 새로 계산)
+
+        Returns:
+            RecommendedBookList: 추천 도서 목록
+        """
+        if vector is None:
+            vector = (await get_embedder().embed([query]))[0]
+        similar = await RecommendationService.find_similar_books(db, vector, theme, k)
+
+        return RecommendedBookList(
+            books=[
+                RecommendedBook(
+                    **orm_fields(BookBase, book),
+                    reason=recommendation_reason(query),
+                    match_score=round(score, 4),
+                )
+                for book, score in similar
+            ],
+            explanation=None,
+        )
+
+    @staticmethod
+    async def recommend_stream(
+        query: str,
+        theme: Optional[str] = None,
+        k: int = 5,
+    ) -> Tuple[AsyncIterator[Tuple[str, bytes]], bool]:
+        """
+        AI 추천 이벤트 스트림 준비
+
+        요청 임베딩이 이전 요청과 충분히 가까우면(시맨틱 캐시) 저장된 추천과 설명을 그대로 보내고,
+        아니면 추천 목록을 조회한 뒤 LLM 설명을 스트리밍하며 완료된 결과를 캐시에 저장한다.
+        캐시 적중 시에는 DB 세션을 열지 않으며, 실패 시에도 DB 조회는 여기서 끝나므로
+        반환된 스트림은 DB 연결을 잡지 않는다.
+
+        Args:
+            query: 추천 요청
+            theme: 테마 필터
+            k: 추천 수
+
+        Returns:
+            tuple: (stream_explanation() 형식의 이벤트 스트림, 캐시 적중 여부)
+        """
+        vector = (await get_embedder().embed([query]))[0]
+        namespace = (theme, k)
+        if settings.RECOMMEND_CACHE_ENABLED:
+            cached = recommendation_cache.get(vector, namespace)
+            if cached is not None:
+                return RecommendationService.replay_cached(query, cached[0]), True
+
+        async with await replica_router.open_session() as db:
+            result = await RecommendationService.recommend(db, query, theme, k, vector=vector)
+        cache_key = (vector, namespace) if settings.RECOMMEND_CACHE_ENABLED else None
+        return RecommendationService.stream_explanation(query, result, cache_key), False
+
+    @staticmethod
+    async def replay_cached(query: str, cached: RecommendedBookList) -> AsyncIterator[Tuple[str, bytes]]:
+        """
+        캐시된 추천을 stream_explanation()과 같은 이벤트로 전송 (토큰 이벤트 없음)
+
+        캐시에는 요청 문장이 남아 있지 않으므로 도서별 이유는 현재 요청으로 다시 만든다.
+        """
+        reason = recommendation_reason(query)
+        result = RecommendedBookList(
+            books=[book.model_copy(update={"reason": reason}) for book in cached.books],
+            explanation=cached.explanation,
+        )
+        yield "books", to_json(RecommendedBookList, result)
+        yield "done", orjson.dumps({"provider": None, "explanation": result.explanation, "cached": True})
+
+    @staticmethod
+    async def stream_explanation(
+        query: str,
+        result: RecommendedBookList,
+        cache_key: Optional[Tuple[List[float], Hashable]] = None,
+    ) -> AsyncIterator[Tuple[str, bytes]]:
+        """
+        추천 목록과 LLM 설명을 이벤트 스트림으로 생성
+
+        DB 조회가 끝난 추천 목록을 받아 LLM만 호출하므로, 스트리밍하는 동안 DB 연결을 잡지 않는다.
+
+        Args:
+            query: 추천 요청
+            result: recommend()의 결과 (완료되면 explanation이 채워짐)
+            cache_key: (요청 임베딩, namespace) - 설명까지 완료되면 시맨틱 캐시에 저장
+
+        Yields:
+            tuple: (이벤트 이름, JSON 본문)
+                - books: 추천 도서 목록 (설명 제외)
+                - token: {"text": 설명 조각}
+                - done: {"provider": 제공자, "explanation": 전체 설명, "cached": 캐시 응답 여부}
+                - error: {"detail": 오류 메시지} (추천 목록은 그대로 유효)
+        """
+        yield "books", to_json(RecommendedBookList, result)
+        if not result.books:
+            yield "done", orjson.dumps({"provider": None, "explanation": None, "cached": False})
+            return
+
+        parts: List[str] = []
+        provider = None
+        try:
+            async for provider, chunk in llm_pool.stream(EXPLANATION_SYSTEM_PROMPT, explanation_prompt(query, result)):
+                parts.append(chunk)
+                yield "token", orjson.dumps({"text": chunk})
+        except LLMUnavailable:
+            yield "error", orjson.dumps({"detail": "추천 설명을 생성할 수 없습니다. 잠시 후 다시 시도해 주세요"})
+            return
+        except LLMError:
+            yield "error", orjson.dumps({"detail": "추천 설명 생성이 중단되었습니다"})
+            return
+
+        result.explanation = "".join(parts)
+        # 다른 사용자에게 재사용되므로 요청 문장이 들어간 값은 저장하지 않는다 (도서별 이유는 비워서 저장)
+        if cache_key is not None and query.strip() not in result.explanation:
+            vector, namespace = cache_key
+            cached = RecommendedBookList(
+                books=[book.model_copy(update={"reason": ""}) for book in result.books],
+                explanation=result.explanation,
+            )
+            recommendation_cache.put(vector, cached, namespace)
+        yield "done", orjson.dumps({"provider": provider, "explanation": result.explanation, "cached": False})
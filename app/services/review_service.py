@@ -0,0 +1,400 @@
+import base64
+import json
+import random
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, delete, func, insert, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.response_cache import response_cache
+from app.models.book import Book
+from app.models.review import BookRatingShard, Review
+from app.models.user import User
+from app.schemas.review import RatingReconcileReport, RatingSummary, ReviewCreate, ReviewUpdate
+from app.services.book_service import BOOKS_TAG
+from app.services.home_feed_service import mark_stale_stmt
+
+# (합계, 개수)
+Totals = Tuple[int, int]
+
+
+def average(totals: Totals) -> float:
+    """(합계, 개수) → 평균 평점 (소수 둘째 자리)"""
+    rating_sum, rating_count = totals
+    return round(rating_sum / rating_count, 2) if rating_count else 0.0
+
+
+class ReviewService:
+    """리뷰 및 평점 집계 서비스"""
+
+    # ========== 평점 집계 (샤드 증분) ==========
+
+    @staticmethod
+    async def _apply_delta(db: AsyncSession, book_id: str, delta_sum: int, delta_count: int) -> None:
+        """
+        평점 증분을 임의의 샤드 한 행에 반영 (호출한 트랜잭션 안에서 실행)
+
+        같은 도서의 동시 리뷰는 서로 다른 샤드 행을 갱신하므로 행 잠금 대기가 샤드 수만큼 분산된다.
+        도서 행은 FOR KEY SHARE로 잠근다. 리뷰 트랜잭션끼리는 충돌하지 않고,
+        샤드를 교체하는 reconcile_ratings(FOR UPDATE)와만 서로 기다린다.
+        """
+        dialect_insert = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+        shards = BookRatingShard.__table__
+
+        await db.execute(select(Book.id).where(Book.id == book_id).with_for_update(read=True, key_share=True))
+
+        stmt = dialect_insert(shards).values(
+            book_id=book_id,
+            shard=random.randrange(settings.REVIEW_RATING_SHARDS),
+            rating_sum=delta_sum,
+            rating_count=delta_count,
+            updated_at=datetime.utcnow(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[shards.c.book_id, shards.c.shard],
+            set_={
+                "rating_sum": shards.c.rating_sum + stmt.excluded.rating_sum,
+                "rating_count": shards.c.rating_count + stmt.excluded.rating_count,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    async def _shard_totals(db: AsyncSession, book_ids: Iterable[str]) -> Dict[str, Totals]:
+        shards = BookRatingShard.__table__
+        result = await db.execute(
+            select(shards.c.book_id, func.sum(shards.c.rating_sum), func.sum(shards.c.rating_count))
+            .where(shards.c.book_id.in_(list(book_ids)))
+            .group_by(shards.c.book_id)
+        )
+        return {book_id: (int(rating_sum), int(rating_count)) for book_id, rating_sum, rating_count in result}
+
+    @staticmethod
+    async def _review_totals(db: AsyncSession, book_ids: Iterable[str]) -> Dict[str, Totals]:
+        result = await db.execute(
+            select(Review.book_id, func.sum(Review.rating), func.count())
+            .where(Review.book_id.in_(list(book_ids)))
+            .group_by(Review.book_id)
+        )
+        return {book_id: (int(rating_sum), int(rating_count)) for book_id, rating_sum, rating_count in result}
+
+    @staticmethod
+    async def rating_summary(db: AsyncSession, book_id: str) -> RatingSummary:
+        """
+        도서 평점 집계 (샤드 합산, 최신 값)
+
+        Args:
+            db: 데이터베이스 세션
+            book_id: 도서 ID
+
+        Returns:
+            RatingSummary: 평균 평점과 리뷰 수
+        """
+        totals = (await ReviewService._shard_totals(db, [book_id])).get(book_id, (0, 0))
+        return RatingSummary(rating=average(totals), review_count=totals[1])
+
+    @staticmethod
+    async def _sync_book_columns(db: AsyncSession, totals: Dict[str, Totals]) -> int:
+        """books.rating / review_count를 집계값으로 갱신 (값이 다른 도서만)"""
+        if not totals:
+            return 0
+
+        current = await db.execute(
+            select(Book.id, Book.rating, Book.review_count).where(Book.id.in_(list(totals)))
+        )
+        changes = [
+            {"b_id": book_id, "b_rating": average(totals[book_id]), "b_review_count": totals[book_id][1]}
+            for book_id, rating, review_count in current
+            if rating != average(totals[book_id]) or review_count != totals[book_id][1]
+        ]
+        if changes:
+            books = Book.__table__
+            await db.execute(
+                update(books)
+                .where(books.c.id == bindparam("b_id"))
+                # 평점 반영은 도서 내용 변경이 아니므로 updated_at을 유지
+                .values(
+                    rating=bindparam("b_rating"),
+                    review_count=bindparam("b_review_count"),
+                    updated_at=books.c.updated_at,
+                ),
+                changes,
+            )
+        return len(changes)
+
+    @staticmethod
+    async def rollup_ratings(db: AsyncSession, since: datetime) -> int:
+        """
+        최근 샤드가 바뀐 도서의 books.rating / review_count 갱신
+
+        목록 정렬·필터는 books 컬럼(인덱스)을 쓰므로 주기적으로 샤드 합계를 반영한다.
+
+        Args:
+            db: 데이터베이스 세션
+            since: 이 시각 이후 변경된 샤드만 대상 (UTC)
+
+        Returns:
+            int: 갱신한 도서 수
+        """
+        shards = BookRatingShard.__table__
+        changed = (await db.execute(
+            select(shards.c.book_id).where(shards.c.updated_at >= since).distinct()
+        )).scalars().all()
+
+        updated = 0
+        for start in range(0, len(changed), 1000):
+            batch = changed[start:start + 1000]
+            updated += await ReviewService._sync_book_columns(
+                db, await ReviewService._shard_totals(db, batch)
+            )
+        if updated:
+            # 평점순 진열대 (ORM 밖 변경이므로 직접 표시)
+            await db.execute(mark_stale_stmt())
+        await db.commit()
+
+        if updated:
+            await response_cache.invalidate_tags([BOOKS_TAG])
+        return updated
+
+    @staticmethod
+    async def reconcile_ratings(db: AsyncSession, batch_size: int = 1000) -> RatingReconcileReport:
+        """
+        평점 집계 전체 점검·복구
+
+        도서 id 키셋 배치마다 reviews 기준 정확한 (합계, 개수)와 샤드 합계를 비교한다.
+        어긋난 도서는 도서 행을 잠근 뒤 다시 계산해 샤드 0 한 행으로 교체하고,
+        books 컬럼도 정확한 값으로 맞춘다. 배치마다 커밋한다.
+
+        도서 행 FOR UPDATE는 리뷰 트랜잭션의 FOR KEY SHARE(_apply_delta)와 충돌한다.
+        잠금을 얻은 시점에는 증분을 반영한 트랜잭션이 모두 커밋되어 다시 계산한 합계에 포함되고,
+        이후의 리뷰 트랜잭션은 교체가 커밋될 때까지 기다렸다가 새 샤드에 증분을 더하므로 누락되지 않는다.
+        (샤드 행 잠금으로는 새 샤드 번호를 INSERT하는 트랜잭션을 막을 수 없다)
+
+        Args:
+            db: 데이터베이스 세션
+            batch_size: 배치당 도서 수
+
+        Returns:
+            RatingReconcileReport: 점검·복구·동기화한 도서 수
+        """
+        started = time.perf_counter()
+        report = RatingReconcileReport()
+        shards = BookRatingShard.__table__
+        last_id: Optional[str] = None
+
+        while True:
+            stmt = select(Book.id).order_by(Book.id).limit(batch_size)
+            if last_id is not None:
+                stmt = stmt.where(Book.id > last_id)
+            book_ids = (await db.execute(stmt)).scalars().all()
+            if not book_ids:
+                break
+            last_id = book_ids[-1]
+
+            exact = await ReviewService._review_totals(db, book_ids)
+            sharded = await ReviewService._shard_totals(db, book_ids)
+            drifted = [
+                book_id for book_id in book_ids
+                if exact.get(book_id, (0, 0)) != sharded.get(book_id, (0, 0))
+            ]
+
+            if drifted:
+                # FOR NO KEY UPDATE는 FOR KEY SHARE와 충돌하지 않으므로 FOR UPDATE (id 순서로 잠가 교착 방지)
+                await db.execute(
+                    select(Book.id).where(Book.id.in_(drifted)).order_by(Book.id).with_for_update()
+                )
+                exact.update(await ReviewService._review_totals(db, drifted))
+                await db.execute(delete(shards).where(shards.c.book_id.in_(drifted)))
+                rows = [
+                    {
+                        "book_id": book_id,
+                        "shard": 0,
+                        "rating_sum": exact[book_id][0],
+                        "rating_count": exact[book_id][1],
+                        "updated_at": datetime.utcnow(),
+                    }
+                    for book_id in drifted
+                    if book_id in exact
+                ]
+                if rows:
+                    await db.execute(insert(shards), rows)
+                report.books_repaired += len(drifted)
+
+            # 리뷰도 샤드도 없던 도서는 적재 시 받은 평점을 그대로 둔다
+            report.books_synced += await ReviewService._sync_book_columns(
+                db, {
+                    book_id: exact.get(book_id, (0, 0))
+                    for book_id in book_ids
+                    if book_id in exact or book_id in sharded
+                }
+            )
+            report.books_checked += len(book_ids)
+            await db.commit()
+
+        if report.books_synced:
+            await db.execute(mark_stale_stmt())
+            await db.commit()
+
+        if report.books_repaired or report.books_synced:
+            await response_cache.invalidate_tags([BOOKS_TAG])
+
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    # ========== 리뷰 ==========
+
+    @staticmethod
+    def encode_cursor(review: Review) -> str:
+        """다음 페이지 커서 생성 (created_at, id)"""
+        raw = json.dumps([review.created_at.isoformat(), str(review.id)])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+        """
+        커서 해석
+
+        Raises:
+            HTTPException: 커서가 잘못되었을 때
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            created_at, review_id = json.loads(base64.urlsafe_b64decode(padded))
+            return datetime.fromisoformat(created_at), str(uuid.UUID(review_id))
+        except (ValueError, TypeError, AttributeError, json.JSONDecodeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="유효하지 않은 커서입니다"
+            )
+
+    @staticmethod
+    async def list_reviews(
+        db: AsyncSession,
+        book_id: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Review], Optional[str]]:
+        """
+        도서 리뷰 목록 (최신순 키셋 페이지네이션)
+
+        Args:
+            db: 데이터베이스 세션
+            book_id: 도서 ID
+            limit: 페이지 크기
+            cursor: 이전 응답의 next_cursor
+
+        Returns:
+            tuple: (리뷰 목록, 다음 페이지 커서 또는 None)
+        """
+        stmt = select(Review).where(Review.book_id == book_id)
+        if cursor:
+            created_at, review_id = ReviewService.decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(Review.created_at, Review.id)
+                < tuple_(created_at, review_id, types=[Review.created_at.type, Review.id.type])
+            )
+        stmt = stmt.order_by(Review.created_at.desc(), Review.id.desc()).limit(limit + 1)
+        reviews = list((await db.execute(stmt)).scalars().all())
+
+        next_cursor = None
+        if len(reviews) > limit:
+            reviews = reviews[:limit]
+            next_cursor = ReviewService.encode_cursor(reviews[-1])
+        return reviews, next_cursor
+
+    @staticmethod
+    async def create_review(db: AsyncSession, book_id: str, user: User, data: ReviewCreate) -> Review:
+        """
+        리뷰 작성 (리뷰 저장과 평점 증분을 같은 트랜잭션에서 커밋)
+
+        Args:
+            db: 데이터베이스 세션
+            book_id: 도서 ID
+            user: 작성자
+            data: 리뷰 내용
+
+        Returns:
+            Review: 생성된 리뷰
+
+        Raises:
+            HTTPException: 도서가 없거나(404) 이미 리뷰를 작성했을 때(409)
+        """
+        if await db.scalar(select(Book.id).where(Book.id == book_id)) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="도서를 찾을 수 없습니다"
+            )
+
+        review = Review(book_id=book_id, user_id=user.id, rating=data.rating, content=data.content)
+        db.add(review)
+        try:
+            await db.flush()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이미 이 도서에 리뷰를 작성했습니다"
+            )
+
+        await ReviewService._apply_delta(db, book_id, data.rating, 1)
+        await db.commit()
+        return review
+
+    @staticmethod
+    async def _get_own_review(db: AsyncSession, review_id: str, user: User) -> Review:
+        """수정·삭제 대상 리뷰를 잠그고 조회 (이전 평점을 정확히 알기 위해 FOR UPDATE)"""
+        review = (await db.execute(
+            select(Review).where(Review.id == review_id).with_for_update()
+        )).scalar_one_or_none()
+        if review is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="리뷰를 찾을 수 없습니다"
+            )
+        if review.user_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="본인의 리뷰만 수정할 수 있습니다"
+            )
+        return review
+
+    @staticmethod
+    async def update_review(db: AsyncSession, review_id: str, user: User, data: ReviewUpdate) -> Review:
+        """
+        리뷰 수정 (평점이 바뀌면 차이만큼 증분 반영)
+
+        Raises:
+            HTTPException: 리뷰가 없거나(404) 본인 리뷰가 아닐 때(403)
+        """
+        review = await ReviewService._get_own_review(db, review_id, user)
+        old_rating = review.rating
+
+        for field, value in data.model_dump(exclude_unset=True, exclude_none=True).items():
+            setattr(review, field, value)
+
+        if review.rating != old_rating:
+            await ReviewService._apply_delta(db, review.book_id, review.rating - old_rating, 0)
+        await db.commit()
+        return review
+
+    @staticmethod
+    async def delete_review(db: AsyncSession, review_id: str, user: User) -> None:
+        """
+        리뷰 삭제 (평점 합계·개수에서 차감)
+
+        Raises:
+            HTTPException: 리뷰가 없거나(404) 본인 리뷰가 아닐 때(403)
+        """
+        review = await ReviewService._get_own_review(db, review_id, user)
+        await db.delete(review)
+        await ReviewService._apply_delta(db, review.book_id, -review.rating, -1)
+        await db.commit()
+
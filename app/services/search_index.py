@@ -0,0 +1,109 @@
+"""
+인메모리 역색인
+PostgreSQL 전문 검색을 사용할 수 없는 환경(SQLite 테스트 등)용 검색 엔진
+"""
+
+import heapq
+import math
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.utils.text import tokenize
+
+# 필드 가중치 (PostgreSQL ts_rank 기본 가중치와 동일: A=1.0, B=0.4, C=0.2, D=0.1)
+DEFAULT_WEIGHTS = {
+    "title": 1.0,
+    "author": 0.4,
+    "keywords": 0.2,
+    "description": 0.1,
+}
+
+
+class InvertedIndex:
+    """
+    n-gram 역색인
+
+    토큰 → {문서 ID: 가중 빈도} 포스팅을 유지하고,
+    모든 검색 토큰을 포함하는 문서(AND)만 TF-IDF 점수로 정렬한다.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        self.weights = weights or DEFAULT_WEIGHTS
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._doc_tokens: Dict[str, Iterable[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_tokens)
+
+    def add(self, doc_id: str, fields: Dict[str, Optional[str]]) -> None:
+        """
+        문서 색인 (같은 ID가 있으면 교체)
+
+        Args:
+            doc_id: 문서 ID
+            fields: 필드명 → 원문
+        """
+        self.remove(doc_id)
+
+        weighted: Dict[str, float] = defaultdict(float)
+        for field, weight in self.weights.items():
+            for token in tokenize(fields.get(field)):
+                weighted[token] += weight
+
+        for token, weight in weighted.items():
+            self._postings[token][doc_id] = weight
+        self._doc_tokens[doc_id] = tuple(weighted)
+
+    def remove(self, doc_id: str) -> None:
+        """문서 색인 제거"""
+        for token in self._doc_tokens.pop(doc_id, ()):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[token]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        predicate: Optional[Callable[[str], bool]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        검색
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+            predicate: 문서 ID 필터 (예: 테마 조건)
+
+        Returns:
+            list: (문서 ID, 점수) 목록, 점수 내림차순
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        postings = [self._postings.get(token) for token in tokens]
+        if any(not p for p in postings):
+            return []
+
+        # 가장 희귀한 토큰부터 교집합을 좁힌다
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for p in postings[1:]:
+            candidates.intersection_update(p)
+            if not candidates:
+                return []
+
+        total = len(self._doc_tokens)
+        idf = [math.log(1 + total / len(p)) for p in postings]
+
+        def score(doc_id: str) -> float:
+            return sum(p[doc_id] * w for p, w in zip(postings, idf))
+
+        if predicate is not None:
+            candidates = {doc_id for doc_id in candidates if predicate(doc_id)}
+
+        return heapq.nlargest(limit, ((doc_id, score(doc_id)) for doc_id in candidates), key=lambda item: item[1])
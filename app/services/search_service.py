@@ -0,0 +1,165 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.book import Book
+from app.services.search_index import InvertedIndex
+from app.utils.text import highlight, tokenize
+
+# 세션별 '도서 변경 있음' 표시 키
+_BOOKS_CHANGED_KEY = "search_books_changed"
+
+
+class SearchService:
+    """도서 검색 서비스 클래스"""
+
+    # PostgreSQL이 아닌 환경용 인메모리 색인 (도서 변경 커밋 시 재구축)
+    _fallback_index: Optional[InvertedIndex] = None
+    _fallback_themes: Dict[str, Optional[str]] = {}
+    _fallback_stale: bool = True
+    _fallback_lock = asyncio.Lock()
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        query: str,
+        theme: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Tuple[Book, float, Dict[str, str]]]:
+        """
+        도서 검색
+
+        Args:
+            db: 데이터베이스 세션
+            query: 검색어
+            theme: 테마 필터
+            limit: 최대 결과 수
+
+        Returns:
+            list: (도서, 관련도 점수, 필드별 하이라이트) 목록
+        """
+        if not tokenize(query):
+            return []
+
+        if db.bind.dialect.name == "postgresql":
+            ranked = await SearchService._search_postgres(db, query, theme, limit)
+        else:
+            ranked = await SearchService._search_fallback(db, query, theme, limit)
+
+        return [
+            (book, score, SearchService.build_highlights(book, query))
+            for book, score in ranked
+        ]
+
+    @staticmethod
+    async def _search_postgres(
+        db: AsyncSession,
+        query: str,
+        theme: Optional[str],
+        limit: int,
+    ) -> List[Tuple[Book, float]]:
+        """GIN 인덱스(search_vector @@ tsquery) + ts_rank_cd 정렬"""
+        ts_query = func.plainto_tsquery("simple", " ".join(dict.fromkeys(tokenize(query))))
+        rank = func.ts_rank_cd(Book.search_vector, ts_query).label("score")
+
+        stmt = select(Book, rank).where(Book.search_vector.op("@@")(ts_query))
+        if theme is not None:
+            stmt = stmt.where(Book.theme == theme)
+        stmt = stmt.order_by(rank.desc(), Book.id).limit(limit)
+
+        result = await db.execute(stmt)
+        return [(book, float(score)) for book, score in result.all()]
+
+    @staticmethod
+    async def _search_fallback(
+        db: AsyncSession,
+        query: str,
+        theme: Optional[str],
+        limit: int,
+    ) -> List[Tuple[Book, float]]:
+        """인메모리 역색인 검색"""
+        index = await SearchService._get_fallback_index(db)
+
+        predicate = None
+        if theme is not None:
+            themes = SearchService._fallback_themes
+            predicate = lambda book_id: themes.get(book_id) == theme  # noqa: E731
+
+        ranked = index.search(query, limit=limit, predicate=predicate)
+        if not ranked:
+            return []
+
+        result = await db.execute(select(Book).where(Book.id.in_([book_id for book_id, _ in ranked])))
+        books = {book.id: book for book in result.scalars().all()}
+        return [(books[book_id], score) for book_id, score in ranked if book_id in books]
+
+    @staticmethod
+    def mark_stale() -> None:
+        """
+        인메모리 색인 무효화 (다음 검색 시 재구축)
+
+        ORM 커밋은 세션 이벤트로 처리되므로, ORM을 거치지 않고 도서를 바꾼 경우(대량 적재 등)에 호출한다.
+        """
+        SearchService._fallback_stale = True
+
+    @staticmethod
+    async def _get_fallback_index(db: AsyncSession) -> InvertedIndex:
+        """인메모리 색인 조회 (변경이 있었으면 재구축)"""
+        if SearchService._fallback_index is not None and not SearchService._fallback_stale:
+            return SearchService._fallback_index
+
+        async with SearchService._fallback_lock:
+            if SearchService._fallback_index is None or SearchService._fallback_stale:
+                SearchService._fallback_stale = False
+                index = InvertedIndex()
+                themes: Dict[str, Optional[str]] = {}
+                result = await db.execute(
+                    select(Book.id, Book.title, Book.author, Book.keywords, Book.description, Book.theme)
+                )
+                for row in result:
+                    index.add(row.id, row._asdict())
+                    themes[row.id] = row.theme
+                SearchService._fallback_index = index
+                SearchService._fallback_themes = themes
+
+        return SearchService._fallback_index
+
+    @staticmethod
+    def build_highlights(book: Book, query: str) -> Dict[str, str]:
+        """
+        필드별 하이라이트 생성
+
+        검색어 단어가 그대로 나오지 않으면 n-gram 단위로 표시한다.
+        """
+        words = query.split()
+        grams = list(dict.fromkeys(tokenize(query)))
+
+        highlights: Dict[str, str] = {}
+        for field, max_length in (("title", None), ("author", None), ("description", 120)):
+            value = getattr(book, field)
+            marked = highlight(value, words, max_length) or highlight(value, grams, max_length)
+            if marked is not None:
+                highlights[field] = marked
+        return highlights
+
+
+# ========== 인메모리 색인 무효화 (세션 이벤트) ==========
+
+@event.listens_for(Session, "after_flush")
+def _collect_book_changes(session: Session, flush_context) -> None:
+    if any(isinstance(obj, Book) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info[_BOOKS_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_fallback_index_stale(session: Session) -> None:
+    if session.info.pop(_BOOKS_CHANGED_KEY, False):
+        SearchService.mark_stale()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_book_changes(session: Session) -> None:
+    session.info.pop(_BOOKS_CHANGED_KEY, None)
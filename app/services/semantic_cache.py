@@ -0,0 +1,207 @@
+"""
+시맨틱 캐시
+요청 문장의 임베딩이 이전 요청과 충분히 가까우면 저장해 둔 추천 응답을 재사용
+
+- 워커별 인메모리 캐시이며, 근사 최근접 탐색은 랜덤 초평면 LSH(SimHash)로 한다
+  (테이블 NUM_TABLES개 × 서명 NUM_BITS비트, 서명에서 한 비트만 다른 버킷까지 탐색)
+- LSH로 모은 후보만 정확한 코사인 유사도로 확인하므로 임계값 판정은 근사가 아니다
+- 항목 수 제한(LRU)과 만료 시간(TTL)으로 정리하며, namespace(테마·추천 수 등)가 같은 항목끼리만 비교한다
+"""
+
+import operator
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from app.core.config import settings
+from app.core.metrics import RECOMMEND_CACHE_ENTRIES, RECOMMEND_CACHE_LOOKUPS, RECOMMEND_CACHE_SIMILARITY
+
+# LSH 테이블 수와 테이블당 서명 비트 수
+# 코사인 0.9인 두 벡터가 한 번 이상 같은 버킷(±1비트)에 들어갈 확률은 약 99.9%
+NUM_TABLES = 8
+NUM_BITS = 10
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(map(operator.mul, a, b))
+
+
+class _Entry:
+    __slots__ = ("vector", "namespace", "value", "expires_at", "signatures")
+
+    def __init__(self, vector, namespace, value, expires_at, signatures):
+        self.vector = vector
+        self.namespace = namespace
+        self.value = value
+        self.expires_at = expires_at
+        self.signatures = signatures
+
+
+class SemanticCache:
+    """
+    임베딩 유사도 기반 캐시
+
+    벡터는 L2 정규화되어 있다고 가정한다 (내적 = 코사인 유사도).
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        threshold: float,
+        max_entries: int,
+        ttl_seconds: float,
+        num_tables: int = NUM_TABLES,
+        num_bits: int = NUM_BITS,
+        seed: int = 0,
+    ):
+        self.dim = dim
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.num_bits = num_bits
+
+        rng = random.Random(seed)
+        self._planes = [
+            [[rng.gauss(0.0, 1.0) for _ in range(dim)] for _ in range(num_bits)]
+            for _ in range(num_tables)
+        ]
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._buckets: Dict[Tuple[Hashable, int, int], Set[int]] = {}
+        self._next_id = 0
+
+        # 지표
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _signatures(self, vector: Sequence[float]) -> List[int]:
+        if len(vector) != self.dim:
+            raise ValueError(f"임베딩 차원 불일치: {len(vector)} != {self.dim}")
+        signatures = []
+        for planes in self._planes:
+            signature = 0
+            for bit, plane in enumerate(planes):
+                if _dot(plane, vector) >= 0:
+                    signature |= 1 << bit
+            signatures.append(signature)
+        return signatures
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        for table, signature in enumerate(entry.signatures):
+            key = (entry.namespace, table, signature)
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[key]
+        RECOMMEND_CACHE_ENTRIES.dec()
+
+    def _candidates(self, namespace: Hashable, signatures: List[int]) -> Set[int]:
+        candidates: Set[int] = set()
+        for table, signature in enumerate(signatures):
+            probes = [signature] + [signature ^ (1 << bit) for bit in range(self.num_bits)]
+            for probe in probes:
+                candidates |= self._buckets.get((namespace, table, probe), set())
+        return candidates
+
+    def get(self, vector: Sequence[float], namespace: Hashable = None) -> Optional[Tuple[Any, float]]:
+        """
+        가장 가까운 이전 요청의 값 조회
+
+        Args:
+            vector: 요청 임베딩 (L2 정규화)
+            namespace: 같은 값끼리만 비교 (예: (테마, 추천 수))
+
+        Returns:
+            tuple: (저장된 값, 코사인 유사도) 또는 None (임계값 이상인 항목이 없을 때)
+        """
+        now = time.monotonic()
+        best_id, best_similarity = None, -1.0
+        for entry_id in self._candidates(namespace, self._signatures(vector)):
+            entry = self._entries[entry_id]
+            if entry.expires_at <= now:
+                self._remove(entry_id)
+                self.expirations += 1
+                continue
+            similarity = _dot(entry.vector, vector)
+            if similarity > best_similarity:
+                best_id, best_similarity = entry_id, similarity
+
+        if best_id is not None:
+            RECOMMEND_CACHE_SIMILARITY.observe(max(best_similarity, 0.0))
+        if best_id is None or best_similarity < self.threshold:
+            self.misses += 1
+            RECOMMEND_CACHE_LOOKUPS.labels("miss").inc()
+            return None
+
+        self._entries.move_to_end(best_id)
+        self.hits += 1
+        RECOMMEND_CACHE_LOOKUPS.labels("hit").inc()
+        return self._entries[best_id].value, best_similarity
+
+    def put(self, vector: Sequence[float], value: Any, namespace: Hashable = None) -> None:
+        """
+        값 저장 (가장 오래 사용되지 않은 항목부터 제거)
+
+        Args:
+            vector: 요청 임베딩 (L2 정규화, 영벡터는 저장하지 않음)
+            value: 저장할 값 (호출한 쪽에서 바꾸지 않는 객체)
+            namespace: get()과 같은 namespace
+        """
+        if self.max_entries <= 0 or self.ttl_seconds <= 0 or not any(vector):
+            return
+
+        signatures = self._signatures(vector)
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = _Entry(
+            list(vector), namespace, value, time.monotonic() + self.ttl_seconds, signatures
+        )
+        for table, signature in enumerate(signatures):
+            self._buckets.setdefault((namespace, table, signature), set()).add(entry_id)
+        RECOMMEND_CACHE_ENTRIES.inc()
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        RECOMMEND_CACHE_ENTRIES.dec(len(self._entries))
+        self._entries.clear()
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """
+        캐시 지표 조회
+
+        Returns:
+            dict: 크기, 적중/실패 횟수, 적중률, 제거·만료 횟수, 임계값
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "threshold": self.threshold,
+            "buckets": len(self._buckets),
+        }
+
+
+# 전역 추천 응답 캐시 (namespace: (테마, 추천 수))
+recommendation_cache = SemanticCache(
+    dim=settings.EMBEDDING_DIM,
+    threshold=settings.RECOMMEND_CACHE_SIMILARITY,
+    max_entries=settings.RECOMMEND_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RECOMMEND_CACHE_TTL,
+)
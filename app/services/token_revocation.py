@@ -0,0 +1,306 @@
+"""
+Refresh Token 폐기 저장소
+블룸 필터로 '폐기되지 않음'을 메모리에서 바로 판별하고, 블룸 적중 시에만 DB/Redis로 확인
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.bloom import ExpiringBloomFilter
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.redis import get_redis
+from app.models.token import RevokedToken
+
+# 변경분 동기화 시 커서 앞쪽을 다시 읽는 번호 범위
+# seq는 INSERT 시점에 배정되므로 작은 번호를 받은 트랜잭션이 큰 번호보다 늦게 커밋될 수 있다.
+# 동시에 진행 중인 폐기 트랜잭션 수(커넥션 풀 크기)보다 넉넉하게 잡는다.
+SYNC_OVERLAP_SEQ = 256
+
+
+class DatabaseRevocationBackend:
+    """revoked_tokens 테이블 기반 저장소"""
+
+    async def add(self, jti: str, kind: str, user_id: Optional[str], expires_at: float) -> bool:
+        async with AsyncSessionLocal() as db:
+            db.add(RevokedToken(
+                jti=jti,
+                kind=kind,
+                user_id=user_id,
+                expires_at=datetime.utcfromtimestamp(expires_at),
+            ))
+            try:
+                await db.commit()
+            except IntegrityError:
+                # 이미 폐기된 항목 (동시 갱신 또는 재사용)
+                await db.rollback()
+                return False
+        return True
+
+    async def exists(self, jti: str) -> bool:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(RevokedToken.jti).where(
+                    RevokedToken.jti == jti,
+                    RevokedToken.expires_at > datetime.utcnow(),
+                )
+            )
+            return result.first() is not None
+
+    async def changes_since(self, cursor: int) -> Tuple[List[Tuple[str, float]], int]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(RevokedToken.seq, RevokedToken.jti, RevokedToken.expires_at)
+                .where(
+                    RevokedToken.seq > max(cursor - SYNC_OVERLAP_SEQ, 0),
+                    RevokedToken.expires_at > datetime.utcnow(),
+                )
+                .order_by(RevokedToken.seq)
+            )
+            rows = result.all()
+        changes = [
+            (jti, (expires_at - datetime(1970, 1, 1)).total_seconds())
+            for _, jti, expires_at in rows
+        ]
+        return changes, max(cursor, rows[-1].seq) if rows else cursor
+
+    async def purge(self) -> int:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                delete(RevokedToken).where(RevokedToken.expires_at <= datetime.utcnow())
+            )
+            await db.commit()
+            return result.rowcount
+
+
+class RedisRevocationBackend:
+    """
+    Redis 기반 저장소
+
+    - revoked:{jti}: 만료 시각에 맞춰 자동 삭제되는 확인용 키
+    - revoked:log: 폐기 번호(revoked:seq INCR) 기준 정렬 집합 (워커 간 블룸 필터 동기화용)
+    - revoked:expiry: 같은 항목의 만료 시각 기준 정렬 집합 (로그 정리용)
+    """
+
+    PREFIX = "revoked:"
+    LOG_KEY = "revoked:log"
+    SEQ_KEY = "revoked:seq"
+    EXPIRY_KEY = "revoked:expiry"
+
+    # KEYS: 확인용 키, 로그, 번호, 만료 집합 / ARGV: 종류, 키 만료 시각, 로그 항목, 만료 시각
+    # 번호 배정과 로그 추가가 원자적이므로 번호 순서 = 로그에 보이는 순서 (앱 서버 시계와 무관)
+    ADD_SCRIPT = """
+    if not redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EXAT', ARGV[2]) then
+        return 0
+    end
+    local seq = redis.call('INCR', KEYS[3])
+    redis.call('ZADD', KEYS[2], seq, ARGV[3])
+    redis.call('ZADD', KEYS[4], ARGV[4], ARGV[3])
+    return seq
+    """
+
+    # KEYS: 로그, 만료 집합 / ARGV: 현재 시각
+    PURGE_SCRIPT = """
+    local members = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+    for _, member in ipairs(members) do
+        redis.call('ZREM', KEYS[1], member)
+    end
+    redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+    return #members
+    """
+
+    def __init__(self):
+        self._add_script = None
+        self._purge_script = None
+
+    async def add(self, jti: str, kind: str, user_id: Optional[str], expires_at: float) -> bool:
+        if self._add_script is None:
+            self._add_script = get_redis().register_script(self.ADD_SCRIPT)
+        seq = await self._add_script(
+            keys=[self.PREFIX + jti, self.LOG_KEY, self.SEQ_KEY, self.EXPIRY_KEY],
+            args=[kind, int(expires_at) + 1, f"{jti}:{int(expires_at)}", int(expires_at)],
+        )
+        return int(seq) > 0
+
+    async def exists(self, jti: str) -> bool:
+        return bool(await get_redis().exists(self.PREFIX + jti))
+
+    async def changes_since(self, cursor: int) -> Tuple[List[Tuple[str, float]], int]:
+        members = await get_redis().zrangebyscore(self.LOG_KEY, f"({cursor}", "+inf", withscores=True)
+        changes = []
+        for member, seq in members:
+            jti, _, expires_at = member.decode().rpartition(":")
+            changes.append((jti, float(expires_at)))
+            cursor = max(cursor, int(seq))
+        return changes, cursor
+
+    async def purge(self) -> int:
+        # 로그 항목은 대상 토큰이 만료되면 필요 없음
+        if self._purge_script is None:
+            self._purge_script = get_redis().register_script(self.PURGE_SCRIPT)
+        return int(await self._purge_script(keys=[self.LOG_KEY, self.EXPIRY_KEY], args=[int(time.time())]))
+
+
+class TokenRevocationStore:
+    """
+    토큰 폐기 저장소
+
+    대부분의 갱신 요청은 폐기되지 않은 토큰이므로, 워커 메모리의 블룸 필터에서
+    '없음'이 나오면 DB/Redis 조회 없이 통과시킨다. 블룸 적중(실제 폐기 또는 오탐)일 때만 확인한다.
+    다른 워커의 폐기 내역은 sync_seconds 간격으로 변경분만 가져와 블룸 필터에 반영한다.
+    변경분은 저장소가 배정한 폐기 번호(seq) 커서로 가져오므로 워커 간 시계 차이의 영향을 받지 않는다.
+    """
+
+    def __init__(
+        self,
+        backend,
+        capacity: int,
+        error_rate: float,
+        sync_seconds: float,
+        purge_seconds: float,
+    ):
+        self.backend = backend
+        self.sync_seconds = sync_seconds
+        self.purge_seconds = purge_seconds
+
+        # 만료 시각 하루 단위로 필터를 나눠, 지난 구간은 통째로 버림
+        self._bloom = ExpiringBloomFilter(bucket_seconds=86400, capacity=capacity, error_rate=error_rate)
+        self._synced_at: Optional[float] = None
+        self._cursor = 0
+        self._purged_at = time.time()
+        self._sync_lock = asyncio.Lock()
+
+        # 지표
+        self.checks = 0
+        self.bloom_hits = 0
+        self.confirmed = 0
+        self.syncs = 0
+        self.purged = 0
+
+    async def _sync(self) -> None:
+        """다른 워커의 폐기 내역 반영 + 주기적 만료 항목 정리"""
+        now = time.time()
+        if self._synced_at is not None and now - self._synced_at < self.sync_seconds:
+            return
+
+        # 최초 적재 전에는 모두 기다리고, 이후에는 진행 중인 동기화를 기다리지 않음
+        if self._synced_at is not None and self._sync_lock.locked():
+            return
+
+        async with self._sync_lock:
+            if self._synced_at is not None and now - self._synced_at < self.sync_seconds:
+                return
+
+            changes, self._cursor = await self.backend.changes_since(self._cursor)
+            for jti, expires_at in changes:
+                self._bloom.add(jti, expires_at)
+            self._synced_at = now
+            self.syncs += 1
+
+            if now - self._purged_at >= self.purge_seconds:
+                self._purged_at = now
+                self.purged += await self.backend.purge()
+                self._bloom.purge(now)
+
+    async def is_revoked(self, jti: str, confirm: bool = False) -> bool:
+        """
+        폐기 여부 확인
+
+        블룸 필터는 다른 워커의 폐기를 sync_seconds 안에 반영하므로 그 사이에는 '없음'이 나올 수 있다.
+        다른 워커에서 폐기되어도 바로 막아야 하는 항목(패밀리)은 confirm=True로 저장소에서 확인한다.
+
+        Args:
+            jti: 토큰 ID 또는 패밀리 ID
+            confirm: 블룸 필터 결과와 상관없이 저장소에서 확인
+
+        Returns:
+            bool: 폐기 여부
+        """
+        if confirm:
+            return await self.backend.exists(jti)
+
+        await self._sync()
+        self.checks += 1
+
+        if jti not in self._bloom:
+            return False
+
+        self.bloom_hits += 1
+        if await self.backend.exists(jti):
+            self.confirmed += 1
+            return True
+        return False
+
+    async def revoke(
+        self,
+        jti: str,
+        expires_at: float,
+        kind: str = "token",
+        user_id: Optional[str] = None,
+    ) -> bool:
+        """
+        토큰(또는 패밀리) 폐기
+
+        Args:
+            jti: 토큰 ID 또는 패밀리 ID
+            expires_at: 폐기 기록을 유지할 시각 (epoch 초, 대상 토큰의 만료 시각)
+            kind: 'token' 또는 'family'
+            user_id: 사용자 ID
+
+        Returns:
+            bool: 이번 호출로 폐기되었으면 True, 이미 폐기되어 있었으면 False
+        """
+        if expires_at <= time.time():
+            return True
+
+        revoked = await self.backend.add(jti, kind, user_id, expires_at)
+        self._bloom.add(jti, expires_at)
+        return revoked
+
+    def reset(self) -> None:
+        """블룸 필터 초기화 (다음 조회 시 전체 재적재)"""
+        self._bloom.clear()
+        self._synced_at = None
+        self._cursor = 0
+
+    def stats(self) -> dict:
+        """
+        폐기 저장소 지표 조회
+
+        Returns:
+            dict: 조회 수, 블룸 적중/확인 수, 오탐률, 필터 크기
+        """
+        return {
+            "backend": type(self.backend).__name__,
+            "checks": self.checks,
+            "bloom_hits": self.bloom_hits,
+            "confirmed": self.confirmed,
+            "false_positive_rate": (
+                (self.bloom_hits - self.confirmed) / self.checks if self.checks else 0.0
+            ),
+            "syncs": self.syncs,
+            "sync_cursor": self._cursor,
+            "purged": self.purged,
+            "bloom": self._bloom.stats(),
+        }
+
+
+def _create_backend():
+    if settings.TOKEN_REVOCATION_BACKEND == "redis":
+        return RedisRevocationBackend()
+    return DatabaseRevocationBackend()
+
+
+# 전역 토큰 폐기 저장소
+revocation_store = TokenRevocationStore(
+    _create_backend(),
+    capacity=settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+    sync_seconds=settings.TOKEN_REVOCATION_SYNC_SECONDS,
+    purge_seconds=settings.TOKEN_REVOCATION_PURGE_SECONDS,
+)
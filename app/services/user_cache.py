@@ -0,0 +1,185 @@
+"""
+인증 사용자 캐시
+/auth/me 조회 시 DB 왕복을 줄이기 위한 사용자 정보 캐시
+"""
+
+import logging
+from typing import Iterable, List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis, get_sync_redis
+from app.models.user import User
+from app.schemas.auth import UserResponse
+
+# 캐시에 담기는 필드 (변경 시 무효화 대상)
+CACHED_FIELDS = ("email", "name", "is_active", "is_verified")
+
+# 세션별 무효화 대기 목록 키
+_PENDING_KEY = "user_cache_invalidations"
+
+logger = logging.getLogger(__name__)
+
+
+class UserCache:
+    """
+    사용자 정보 캐시
+
+    - memory: 워커별 인메모리 LRU + TTL 캐시
+    - redis: REDIS_URL을 사용해 모든 워커가 공유
+    ORM 인스턴스가 아닌 UserResponse 스냅샷을 저장한다.
+    """
+
+    def __init__(self, backend: str, max_size: int, ttl_seconds: int):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._local = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+        # Redis 백엔드 지표
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self.invalidation_failures = 0
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"user:{user_id}"
+
+    async def get(self, user_id: str) -> Optional[UserResponse]:
+        """
+        캐시된 사용자 조회
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            UserResponse 또는 None
+        """
+        if self.backend != "redis":
+            return self._local.get(user_id)
+
+        raw = await get_redis().get(self._key(user_id))
+        if raw is None:
+            self.redis_misses += 1
+            return None
+        self.redis_hits += 1
+        return UserResponse.model_validate_json(raw)
+
+    async def set(self, user: User) -> UserResponse:
+        """
+        사용자 정보 캐시 저장
+
+        Args:
+            user: 사용자
+
+        Returns:
+            UserResponse: 저장된 스냅샷
+        """
+        profile = UserResponse.model_validate(user)
+        if self.backend != "redis":
+            self._local.set(profile.id, profile)
+        else:
+            await get_redis().set(
+                self._key(profile.id),
+                profile.model_dump_json(),
+                ex=self.ttl_seconds,
+            )
+        return profile
+
+    async def invalidate(self, user_ids: Iterable[str]) -> None:
+        """
+        사용자 캐시 무효화
+
+        Args:
+            user_ids: 무효화할 사용자 ID 목록
+        """
+        keys: List[str] = []
+        for user_id in user_ids:
+            self._local.delete(user_id)
+            keys.append(self._key(user_id))
+
+        if self.backend == "redis" and keys:
+            await get_redis().delete(*keys)
+
+    def invalidate_sync(self, user_ids: Iterable[str]) -> None:
+        """
+        동기 컨텍스트(세션 이벤트)에서 캐시 즉시 무효화
+
+        커밋 직후 응답을 보내기 전에 지운다. Redis는 동기 클라이언트로 한 번 왕복하며,
+        실패하면 기록만 남긴다 (항목은 TTL이 지나면 사라짐).
+        """
+        keys: List[str] = []
+        for user_id in user_ids:
+            self._local.delete(user_id)
+            keys.append(self._key(user_id))
+
+        if self.backend != "redis" or not keys:
+            return
+
+        try:
+            get_sync_redis().delete(*keys)
+        except Exception:
+            self.invalidation_failures += 1
+            logger.exception("사용자 캐시 무효화 실패 (%d명)", len(keys))
+
+    def stats(self) -> dict:
+        """
+        캐시 지표 조회
+
+        Returns:
+            dict: 백엔드, 적중/실패 횟수, 적중률, 무효화 실패 횟수
+        """
+        if self.backend != "redis":
+            return {"backend": self.backend, **self._local.stats()}
+
+        lookups = self.redis_hits + self.redis_misses
+        return {
+            "backend": self.backend,
+            "hits": self.redis_hits,
+            "misses": self.redis_misses,
+            "hit_rate": self.redis_hits / lookups if lookups else 0.0,
+            "invalidation_failures": self.invalidation_failures,
+        }
+
+
+# 전역 사용자 캐시
+user_cache = UserCache(
+    backend=settings.USER_CACHE_BACKEND,
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+# ========== 변경 감지 (세션 이벤트) ==========
+
+@event.listens_for(Session, "after_flush")
+def _collect_user_changes(session: Session, flush_context) -> None:
+    """flush된 User 중 캐시 필드가 바뀐 사용자를 기록"""
+    pending = session.info.setdefault(_PENDING_KEY, set())
+
+    for obj in session.dirty:
+        if not isinstance(obj, User):
+            continue
+        state = inspect(obj)
+        if any(state.attrs[field].history.has_changes() for field in CACHED_FIELDS):
+            pending.add(obj.id)
+
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            pending.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    """커밋된 변경만 캐시에서 제거"""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        user_cache.invalidate_sync(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_users(session: Session) -> None:
+    """롤백된 변경은 무효화 대상에서 제외"""
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,92 @@
+"""
+이미지 처리 (썸네일 생성)
+프로세스 풀 워커에서 실행되므로 app 설정·DB 모듈을 import하지 않는다
+"""
+
+import os
+from typing import Dict, Iterable, Optional
+
+# 지원 형식: 확장자 → Content-Type
+IMAGE_TYPES = {
+    "jpg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+}
+
+# 형식 판별에 필요한 앞부분 바이트 수
+SNIFF_BYTES = 12
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """
+    파일 앞부분 바이트로 이미지 형식 판별
+
+    Returns:
+        str: 'jpg', 'png', 'webp' 또는 None (지원하지 않는 형식)
+    """
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def make_thumbnails(source: str, widths: Iterable[int], target_pattern: str) -> Dict[int, str]:
+    """
+    원본 이미지 검증 후 너비별 JPEG 썸네일 생성
+
+    이미 있는 썸네일은 다시 만들지 않는다. 원본보다 넓은 너비는 원본 크기로 만든다.
+    임시 파일에 쓴 뒤 이름을 바꾸므로 동시에 같은 원본을 처리해도 깨진 파일이 보이지 않는다.
+
+    Args:
+        source: 원본 파일 경로
+        widths: 썸네일 너비 (px)
+        target_pattern: 썸네일 경로 형식 ('{width}' 자리에 너비)
+
+    Returns:
+        dict: 너비 → 썸네일 경로
+
+    Raises:
+        ValueError: 이미지로 읽을 수 없을 때 (손상, 압축 폭탄 등)
+    """
+    from PIL import Image, ImageOps
+
+    try:
+        with Image.open(source) as image:
+            image.verify()
+    except Exception as e:
+        raise ValueError(f"invalid image: {e}") from e
+
+    targets = {width: target_pattern.format(width=width) for width in widths}
+    missing = [width for width, path in targets.items() if not os.path.exists(path)]
+    if not missing:
+        return targets
+
+    # verify()는 헤더·구조만 확인하므로 잘린 JPEG 등은 픽셀을 읽을 때 실패한다
+    tmp_path = None
+    try:
+        # verify() 이후에는 같은 객체로 픽셀을 읽을 수 없으므로 다시 연다
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ("RGB", "L"):
+                background = Image.new("RGB", image.size, (255, 255, 255))
+                converted = image.convert("RGBA")
+                background.paste(converted, mask=converted.getchannel("A"))
+                image = background
+
+            for width in sorted(missing, reverse=True):
+                thumbnail = image.copy()
+                thumbnail.thumbnail((width, image.height), Image.LANCZOS)
+                path = targets[width]
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                thumbnail.save(tmp_path, "JPEG", quality=85, optimize=True, progressive=True)
+                os.replace(tmp_path, path)
+                tmp_path = None
+    except Exception as e:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise ValueError(f"invalid image: {e}") from e
+
+    return targets
@@ -0,0 +1,125 @@
+"""
+검색용 텍스트 처리
+한국어 n-gram 토큰화 및 하이라이트
+"""
+
+import html
+import re
+from typing import Iterable, List, Optional
+
+# 한글/한자/가나 연속 구간 또는 영문·숫자 단어
+_TOKEN_RUN = re.compile(r"[가-힣ㄱ-ㆎ一-鿿぀-ヿ]+|[0-9a-z]+")
+_CJK_RUN = re.compile(r"[가-힣ㄱ-ㆎ一-鿿぀-ヿ]+")
+
+
+def ngrams(run: str, n: int = 2) -> List[str]:
+    """
+    문자 n-gram 생성
+
+    Args:
+        run: 공백 없는 문자열 (예: '퇴근후힐링')
+        n: n-gram 길이
+
+    Returns:
+        list: n-gram 목록 (run이 n보다 짧으면 run 자체)
+    """
+    if len(run) <= n:
+        return [run]
+    return [run[i:i + n] for i in range(len(run) - n + 1)]
+
+
+def tokenize(text: Optional[str], n: int = 2) -> List[str]:
+    """
+    검색 토큰화
+
+    한국어는 형태소 분석 없이도 조사·어미 변화에 강하도록 문자 bigram으로,
+    영문·숫자는 소문자 단어 단위로 토큰화한다.
+
+    Args:
+        text: 원문
+        n: 한국어 n-gram 길이
+
+    Returns:
+        list: 토큰 목록 (중복 포함, 등장 순서 유지)
+    """
+    if not text:
+        return []
+
+    tokens: List[str] = []
+    for run in _TOKEN_RUN.findall(text.lower()):
+        if _CJK_RUN.fullmatch(run):
+            tokens.extend(ngrams(run, n))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def to_search_document(parts: Iterable[Optional[str]]) -> str:
+    """
+    여러 필드를 공백으로 구분된 토큰 문자열로 변환
+
+    PostgreSQL to_tsvector('simple', ...)에 그대로 넘길 수 있는 형태
+    """
+    return " ".join(token for part in parts for token in tokenize(part))
+
+
+def split_keywords(text: Optional[str], max_length: int = 100) -> List[str]:
+    """
+    쉼표 구분 키워드 문자열을 태그 목록으로 변환
+
+    앞뒤 공백을 지우고 연속 공백을 하나로 줄인 뒤 소문자로 맞춘다.
+
+    Args:
+        text: 키워드 문자열 (예: '자기계발, 습관,  시간 관리')
+        max_length: 키워드 최대 길이 (넘으면 자름)
+
+    Returns:
+        list: 중복 없는 키워드 목록 (등장 순서 유지)
+    """
+    if not text:
+        return []
+
+    keywords: List[str] = []
+    for part in text.split(","):
+        keyword = " ".join(part.split()).lower()[:max_length]
+        if keyword and keyword not in keywords:
+            keywords.append(keyword)
+    return keywords
+
+
+def highlight(text: Optional[str], terms: List[str], max_length: Optional[int] = None) -> Optional[str]:
+    """
+    검색어 하이라이트
+
+    Args:
+        text: 원문
+        terms: 검색어 단어 목록
+        max_length: 지정 시 첫 일치 위치 주변만 잘라서 반환 (설명 등 긴 필드용)
+
+    Returns:
+        str: <mark>로 감싼 HTML 이스케이프 문자열 또는 None (일치 없음)
+    """
+    if not text or not terms:
+        return None
+
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    match = pattern.search(text)
+    if match is None:
+        return None
+
+    prefix = suffix = ""
+    if max_length is not None and len(text) > max_length:
+        start = max(0, match.start() - max_length // 3)
+        end = min(len(text), start + max_length)
+        prefix = "…" if start > 0 else ""
+        suffix = "…" if end < len(text) else ""
+        text = text[start:end]
+
+    result: List[str] = []
+    last = 0
+    for match in pattern.finditer(text):
+        result.append(html.escape(text[last:match.start()]))
+        result.append(f"<mark>{html.escape(match.group())}</mark>")
+        last = match.end()
+    result.append(html.escape(text[last:]))
+    return prefix + "".join(result) + suffix
@@ -0,0 +1,64 @@
+"""
+DB 접근 벤치마크
+동기 세션(이벤트 루프에서 직접 호출) vs 비동기 세션 처리량 비교
+
+로컬 PostgreSQL(DATABASE_URL)에 대해 실행:
+    python -m benchmarks.bench_db_async --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import func, select
+
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.models.user import User
+
+
+async def sync_inline_lookup(email: str) -> None:
+    """기존 방식: async 라우트 안에서 psycopg2 동기 호출"""
+    db = SessionLocal()
+    try:
+        db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+        db.execute(select(func.pg_sleep(0.002)))  # 네트워크 왕복 시뮬레이션
+    finally:
+        db.close()
+
+
+async def async_lookup(email: str) -> None:
+    """비동기 세션: 대기 중 다른 요청이 같은 워커에서 진행됨"""
+    async with AsyncSessionLocal() as db:
+        (await db.execute(select(User).where(User.email == email))).scalar_one_or_none()
+        await db.execute(select(func.pg_sleep(0.002)))
+
+
+async def run(lookup, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            await lookup(f"bench-{i}@chaekmate.dev")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return total / (time.perf_counter() - started)
+
+
+async def main_async(total: int, concurrency: int) -> None:
+    for name, lookup in (("sync-inline", sync_inline_lookup), ("async", async_lookup)):
+        rps = await run(lookup, total, concurrency)
+        print(f"[{name:>11}] {rps:,.0f} req/s (requests={total}, concurrency={concurrency})")
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 접근 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
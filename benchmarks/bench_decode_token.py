@@ -0,0 +1,47 @@
+"""
+토큰 디코딩 마이크로 벤치마크
+검증 캐시 적중 vs 매번 python-jose 검증 처리량 비교
+
+실행:
+    python -m benchmarks.bench_decode_token --iterations 50000
+"""
+
+import argparse
+import time
+
+from jose import jwt
+
+from app.core.config import settings
+from app.core.security import create_access_token, decode_token, token_cache
+
+
+def uncached_decode(token: str) -> dict:
+    """캐시 없이 서명·클레임 검증"""
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+
+def measure(func, token: str, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func(token)
+    return iterations / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="토큰 디코딩 벤치마크")
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+
+    token = create_access_token({"sub": "benchmark-user", "email": "bench@chaekmate.dev"})
+
+    uncached = measure(uncached_decode, token, args.iterations)
+    token_cache.clear()
+    cached = measure(decode_token, token, args.iterations)
+
+    print(f"[uncached] {uncached:,.0f} decodes/s")
+    print(f"[  cached] {cached:,.0f} decodes/s ({cached / uncached:.1f}x)")
+    print(f"cache stats: {token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+비밀번호 해싱 벤치마크
+로그인 부하 중 /health 응답 지연 비교 (인라인 bcrypt vs 전용 풀)
+
+실행:
+    python -m benchmarks.bench_password_hashing --logins 64 --probes 200
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core.hashing import password_hasher
+from app.core.security import get_password_hash, verify_password
+from main import app
+
+
+def percentile(values: list, p: float) -> float:
+    """백분위 계산 (ms)"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * p))
+    return ordered[index] * 1000
+
+
+async def login_load(mode: str, hashed: str, count: int) -> None:
+    """로그인 bcrypt 검증 부하 생성"""
+
+    async def inline_verify():
+        # 기존 방식: 이벤트 루프에서 직접 bcrypt 실행
+        verify_password("benchmark-password", hashed)
+
+    async def pooled_verify():
+        await password_hasher.verify("benchmark-password", hashed)
+
+    verify = inline_verify if mode == "inline" else pooled_verify
+    await asyncio.gather(*(verify() for _ in range(count)))
+
+
+async def probe_health(client: httpx.AsyncClient, count: int, interval: float = 0.005) -> list:
+    """
+    /health 지연 측정
+
+    요청을 일정 간격으로 예약하고 예약 시각부터 응답까지를 측정하므로
+    이벤트 루프가 멈춘 시간도 지연에 포함된다.
+    """
+    latencies = []
+    origin = time.perf_counter()
+    for i in range(count):
+        scheduled = origin + i * interval
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        response = await client.get("/health")
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - scheduled)
+    return latencies
+
+
+async def run(mode: str, logins: int, probes: int) -> dict:
+    hashed = get_password_hash("benchmark-password")
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        baseline = await probe_health(client, probes)
+
+        started = time.perf_counter()
+        load_task = asyncio.create_task(login_load(mode, hashed, logins))
+        loaded = await probe_health(client, probes)
+        await load_task
+        elapsed = time.perf_counter() - started
+
+    return {
+        "mode": mode,
+        "idle_p99_ms": percentile(baseline, 0.99),
+        "loaded_p50_ms": percentile(loaded, 0.50),
+        "loaded_p99_ms": percentile(loaded, 0.99),
+        "logins_per_sec": logins / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비밀번호 해싱 벤치마크")
+    parser.add_argument("--logins", type=int, default=64, help="동시 로그인 시도 수")
+    parser.add_argument("--probes", type=int, default=200, help="/health 요청 수")
+    args = parser.parse_args()
+
+    for mode in ("inline", "pooled"):
+        result = asyncio.run(run(mode, args.logins, args.probes))
+        print(
+            f"[{result['mode']:>6}] /health idle p99={result['idle_p99_ms']:.2f}ms "
+            f"loaded p50={result['loaded_p50_ms']:.2f}ms p99={result['loaded_p99_ms']:.2f}ms "
+            f"logins/s={result['logins_per_sec']:.1f}"
+        )
+
+    print(f"hasher stats: {password_hasher.stats()}")
+    password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+도서 검색 벤치마크
+합성 카탈로그에 대한 검색 지연 측정 (p50/p95/p99)
+
+인메모리 역색인:
+    python -m benchmarks.bench_search --books 1000000 --queries 500
+PostgreSQL (DATABASE_URL, 미리 시드된 books 테이블 사용):
+    python -m benchmarks.bench_search --postgres --queries 500
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.services.search_index import InvertedIndex
+from benchmarks.datagen import book_rows, search_queries
+
+
+def percentile(values: list, p: float) -> float:
+    """백분위 계산 (ms)"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * p))
+    return ordered[index] * 1000
+
+
+def report(name: str, latencies: list) -> None:
+    print(
+        f"[{name}] queries={len(latencies)} "
+        f"p50={percentile(latencies, 0.50):.2f}ms "
+        f"p95={percentile(latencies, 0.95):.2f}ms "
+        f"p99={percentile(latencies, 0.99):.2f}ms"
+    )
+
+
+def bench_in_memory(books: int, queries: int) -> None:
+    started = time.perf_counter()
+    index = InvertedIndex()
+    for i, row in enumerate(book_rows(books)):
+        index.add(str(i), row)
+    print(f"indexed {len(index):,} books in {time.perf_counter() - started:.1f}s")
+
+    latencies = []
+    for query in search_queries(queries):
+        started = time.perf_counter()
+        index.search(query, limit=20)
+        latencies.append(time.perf_counter() - started)
+    report("in-memory", latencies)
+
+
+async def bench_postgres(queries: int) -> None:
+    from app.core.database import AsyncSessionLocal, async_engine
+    from app.services.search_service import SearchService
+
+    latencies = []
+    async with AsyncSessionLocal() as db:
+        for query in search_queries(queries):
+            started = time.perf_counter()
+            await SearchService.search(db, query, limit=20)
+            latencies.append(time.perf_counter() - started)
+    await async_engine.dispose()
+    report("postgres", latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="도서 검색 벤치마크")
+    parser.add_argument("--books", type=int, default=100000, help="인메모리 색인 도서 수")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--postgres", action="store_true", help="DATABASE_URL의 PostgreSQL로 측정")
+    args = parser.parse_args()
+
+    if args.postgres:
+        asyncio.run(bench_postgres(args.queries))
+    else:
+        bench_in_memory(args.books, args.queries)
+
+
+if __name__ == "__main__":
+    main()
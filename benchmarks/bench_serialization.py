@@ -0,0 +1,95 @@
+"""
+응답 직렬화 벤치마크
+도서 목록(BookListResponse) 한 페이지를 ORM 객체에서 JSON 본문까지 만드는 시간 비교
+
+- fastapi+json:   스키마 생성 → response_model 재검증 → jsonable_encoder → 표준 json (기존 방식)
+- fastapi+orjson: 위와 같고 마지막 단계만 ORJSONResponse
+- type_adapter:   캐시된 TypeAdapter로 한 번 검증 + dump_json (app.core.serialization)
+
+DB 없이 메모리의 Book 객체로 실행:
+    python -m benchmarks.bench_serialization --items 1000 --runs 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+import orjson
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.serialization import orm_to_json
+from app.models.book import Book
+from app.schemas.book import BookListResponse, BookResponse
+from app.utils.ids import new_id
+from benchmarks.datagen import book_rows
+
+# FastAPI가 response_model로 만드는 응답 필드와 같은 설정
+RESPONSE_FIELD = create_model_field(name="Response_list_books", type_=BookListResponse, mode="serialization")
+
+
+def make_books(count: int) -> List[Book]:
+    """세션에 붙지 않은 Book 객체 생성"""
+    return [Book(id=new_id(), **row) for row in book_rows(count)]
+
+
+async def fastapi_path(books: List[Book], response_class: type) -> bytes:
+    content = BookListResponse(
+        books=[BookResponse.model_validate(book) for book in books],
+        total=len(books),
+        limit=len(books),
+    )
+    encoded = await serialize_response(field=RESPONSE_FIELD, response_content=content)
+    return response_class(encoded).body
+
+
+async def type_adapter_path(books: List[Book]) -> bytes:
+    return orm_to_json(BookListResponse, {"books": books, "total": len(books), "limit": len(books)})
+
+
+async def measure(func: Callable[[], Awaitable[bytes]], runs: int) -> List[float]:
+    await func()  # 워밍업 (TypeAdapter·스키마 캐시 준비)
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+async def run(args) -> None:
+    books = make_books(args.items)
+    variants = {
+        "fastapi+json": lambda: fastapi_path(books, JSONResponse),
+        "fastapi+orjson": lambda: fastapi_path(books, ORJSONResponse),
+        "type_adapter": lambda: type_adapter_path(books),
+    }
+
+    # 세 방식이 같은 내용을 만드는지 확인
+    bodies = {name: orjson.loads(await func()) for name, func in variants.items()}
+    assert all(body == bodies["fastapi+json"] for body in bodies.values()), "직렬화 결과가 다름"
+
+    baseline = None
+    for name, func in variants.items():
+        timings = [t * 1000 for t in await measure(func, args.runs)]
+        median = statistics.median(timings)
+        baseline = baseline or median
+        print(
+            f"[{name:>15}] median {median:8.2f} ms  p95 {sorted(timings)[int(len(timings) * 0.95)]:8.2f} ms  "
+            f"({args.items / median * 1000:10,.0f} items/s, x{baseline / median:.1f})"
+        )
+    print(f"items={args.items} runs={args.runs} body={len(await variants['type_adapter']()):,} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 벤치마크")
+    parser.add_argument("--items", type=int, default=1000, help="목록 길이")
+    parser.add_argument("--runs", type=int, default=200)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+서버 시작 시간 벤치마크
+새 프로세스에서 import → startup 이벤트 → 첫 요청까지 걸리는 시간 측정
+
+마이그레이션이 적용된 DB(DATABASE_URL)에 대해 실행:
+    alembic upgrade head
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --runs 1 --importtime   # 느린 import 상위 목록
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# 자식 프로세스에서 실행: 단계별 소요 시간을 JSON 한 줄로 출력
+CHILD_SCRIPT = """
+import asyncio, json, sys, time
+
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+import httpx
+
+# 이 모듈들은 실제로 사용할 때만 import되어야 함
+LAZY_MODULES = ("openai", "anthropic", "alembic")
+lazy_loaded_at_import = [name for name in LAZY_MODULES if name in sys.modules]
+
+
+async def run():
+    t0 = time.perf_counter()
+    await main.app.router.startup()
+    t1 = time.perf_counter()
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/health")
+        t2 = time.perf_counter()
+        response = await client.get("/api/v1/books", params={"limit": 20})
+        t3 = time.perf_counter()
+
+    await main.app.router.shutdown()
+    return t1 - t0, t2 - t1, t3 - t2, response.status_code
+
+
+startup, first_health, first_books, status = asyncio.run(run())
+print(json.dumps({
+    "import_seconds": imported - started,
+    "startup_seconds": startup,
+    "first_health_seconds": first_health,
+    "first_books_seconds": first_books,
+    "books_status": status,
+    "lazy_loaded_at_import": lazy_loaded_at_import,
+}))
+"""
+
+METRICS = ("import_seconds", "startup_seconds", "first_health_seconds", "first_books_seconds")
+
+
+def run_child(importtime: bool) -> tuple:
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", CHILD_SCRIPT]
+
+    result = subprocess.run(command, capture_output=True, text=True, env=os.environ.copy())
+    if result.returncode != 0:
+        raise SystemExit(result.stderr)
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return report, result.stderr
+
+
+def slowest_imports(stderr: str, top: int) -> list:
+    """-X importtime 출력에서 자체(self) 시간이 큰 모듈 목록"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), module.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--importtime", action="store_true", help="느린 import 상위 모듈 출력")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    reports = []
+    for i in range(args.runs):
+        report, stderr = run_child(args.importtime and i == 0)
+        reports.append(report)
+        if args.importtime and i == 0:
+            print(f"slowest imports (self time, top {args.top}):")
+            for self_us, cumulative_us, module in slowest_imports(stderr, args.top):
+                print(f"  {self_us / 1000:8.1f} ms  (cumulative {cumulative_us / 1000:8.1f} ms)  {module}")
+
+    for metric in METRICS:
+        values = [report[metric] * 1000 for report in reports]
+        print(
+            f"[{metric:>20}] median {statistics.median(values):8.1f} ms  "
+            f"min {min(values):8.1f} ms  max {max(values):8.1f} ms"
+        )
+
+    total = [sum(report[metric] for metric in METRICS) * 1000 for report in reports]
+    print(f"[{'total':>20}] median {statistics.median(total):8.1f} ms (runs={args.runs})")
+    print(f"first /books status: {reports[-1]['books_status']}")
+    print(f"lazy modules loaded at import: {reports[-1]['lazy_loaded_at_import'] or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
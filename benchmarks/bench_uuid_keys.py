@@ -0,0 +1,128 @@
+"""
+기본 키 형식 벤치마크 (PostgreSQL)
+문자열 UUIDv4 / 네이티브 UUIDv4 / 네이티브 UUIDv7 기본 키 테이블에 같은 수의 행을 적재하고
+적재 속도와 테이블·인덱스 크기를 비교
+
+각 테이블은 books와 같은 형태의 인덱스(PK + (created_at, id) 복합 인덱스)를 가진 상태에서 COPY로 적재한다.
+키 생성 시간은 측정에서 제외한다.
+
+DATABASE_URL의 PostgreSQL에서 실행 (bench_keys_* 테이블을 만들고 끝나면 삭제):
+    python -m benchmarks.bench_uuid_keys --rows 5000000
+"""
+
+import argparse
+import io
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.utils.ids import uuid7
+
+# (이름, 컬럼 타입, 키 생성 함수)
+VARIANTS = (
+    ("text_v4", "varchar", lambda: str(uuid.uuid4())),
+    ("uuid_v4", "uuid", lambda: str(uuid.uuid4())),
+    ("uuid_v7", "uuid", lambda: str(uuid7())),
+)
+
+BASE_TIME = datetime(2024, 1, 1)
+
+
+def make_batch(new_key: Callable[[], str], start: int, size: int) -> io.StringIO:
+    """COPY용 버퍼 (id, created_at, payload)"""
+    buffer = io.StringIO()
+    for i in range(start, start + size):
+        created_at = BASE_TIME + timedelta(milliseconds=i)
+        buffer.write(f"{new_key()}\t{created_at.isoformat()}\tbook {i}\n")
+    buffer.seek(0)
+    return buffer
+
+
+def relation_sizes(conn, table: str) -> dict:
+    row = conn.execute(text(f"""
+        SELECT pg_relation_size('{table}'),
+               pg_relation_size('{table}_pkey'),
+               pg_relation_size('ix_{table}_created_at_id')
+    """)).one()
+    return {"table_bytes": row[0], "pkey_bytes": row[1], "created_at_id_bytes": row[2]}
+
+
+def run_variant(engine, name: str, column_type: str, new_key: Callable[[], str], rows: int, batch_size: int) -> dict:
+    table = f"bench_keys_{name}"
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        conn.execute(text(f"""
+            CREATE TABLE {table} (
+                id {column_type} PRIMARY KEY,
+                created_at timestamp NOT NULL,
+                payload varchar NOT NULL
+            )
+        """))
+        conn.execute(text(f"CREATE INDEX ix_{table}_created_at_id ON {table} (created_at, id)"))
+
+    batch_seconds: List[float] = []
+    raw = engine.raw_connection()
+    try:
+        for start in range(0, rows, batch_size):
+            buffer = make_batch(new_key, start, min(batch_size, rows - start))
+            started = time.perf_counter()
+            with raw.cursor() as cursor:
+                cursor.copy_expert(f"COPY {table} (id, created_at, payload) FROM STDIN", buffer)
+            raw.commit()
+            batch_seconds.append(time.perf_counter() - started)
+            print(f"  {name}: {min(start + batch_size, rows):,}/{rows:,}", file=sys.stderr)
+    finally:
+        raw.close()
+
+    with engine.connect() as conn:
+        sizes = relation_sizes(conn, table)
+
+    # 인덱스가 커진 뒤의 속도 (마지막 10% 배치)
+    tail = batch_seconds[-max(1, len(batch_seconds) // 10):]
+    tail_rows = min(rows, len(tail) * batch_size)
+    return {
+        "name": name,
+        "rows_per_second": rows / sum(batch_seconds),
+        "tail_rows_per_second": tail_rows / sum(tail),
+        **sizes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기본 키 형식 벤치마크")
+    parser.add_argument("--rows", type=int, default=5000000)
+    parser.add_argument("--batch-size", type=int, default=100000)
+    parser.add_argument("--keep", action="store_true", help="측정 후 테이블을 남김")
+    args = parser.parse_args()
+
+    if not settings.DATABASE_URL.startswith("postgresql"):
+        raise SystemExit("PostgreSQL DATABASE_URL이 필요합니다")
+
+    engine = create_engine(settings.DATABASE_URL)
+    results = []
+    try:
+        for name, column_type, new_key in VARIANTS:
+            results.append(run_variant(engine, name, column_type, new_key, args.rows, args.batch_size))
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                for name, _, _ in VARIANTS:
+                    conn.execute(text(f"DROP TABLE IF EXISTS bench_keys_{name}"))
+
+    mb = 1024 * 1024
+    print(f"{'variant':>8} {'rows/s':>10} {'tail rows/s':>12} {'table MB':>9} {'pkey MB':>8} {'(created_at,id) MB':>19}")
+    for row in results:
+        print(
+            f"{row['name']:>8} {row['rows_per_second']:>10,.0f} {row['tail_rows_per_second']:>12,.0f} "
+            f"{row['table_bytes'] / mb:>9.1f} {row['pkey_bytes'] / mb:>8.1f} {row['created_at_id_bytes'] / mb:>19.1f}"
+        )
+    print(f"rows={args.rows:,}")
+
+
+if __name__ == "__main__":
+    main()
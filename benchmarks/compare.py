@@ -0,0 +1,102 @@
+"""
+벤치마크 리포트 비교
+기준(baseline) 리포트 대비 처리량 감소·지연 증가가 임계값을 넘는 시나리오를 회귀로 표시
+
+실행:
+    python -m benchmarks.compare benchmarks/baseline.json report.json --threshold 0.10
+"""
+
+import argparse
+import json
+import sys
+from typing import List
+
+# (지표, 값이 클수록 좋은지)
+METRICS = (
+    ("rps", True),
+    ("p50_ms", False),
+    ("p95_ms", False),
+    ("p99_ms", False),
+)
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float = 0.10) -> List[dict]:
+    """
+    리포트 비교
+
+    Args:
+        baseline: 기준 리포트
+        current: 현재 리포트
+        threshold: 회귀 판정 기준 (상대 변화율, 0.10 = 10%)
+
+    Returns:
+        list: 시나리오·지표별 (기준값, 현재값, 변화율, 회귀 여부)
+    """
+    rows = []
+    for name, result in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+
+        for metric, higher_is_better in METRICS:
+            if metric not in base or metric not in result or not base[metric]:
+                continue
+
+            change = (result[metric] - base[metric]) / base[metric]
+            worse = -change if higher_is_better else change
+            rows.append({
+                "scenario": name,
+                "metric": metric,
+                "baseline": base[metric],
+                "current": result[metric],
+                "change": change,
+                "regression": worse > threshold,
+            })
+
+        # 기준에 없던 오류가 생긴 경우도 회귀로 본다
+        if result.get("errors", 0) > base.get("errors", 0):
+            rows.append({
+                "scenario": name,
+                "metric": "errors",
+                "baseline": base.get("errors", 0),
+                "current": result["errors"],
+                "change": None,
+                "regression": True,
+            })
+
+    return rows
+
+
+def print_comparison(rows: List[dict]) -> None:
+    """비교 결과 출력"""
+    for row in rows:
+        change = "" if row["change"] is None else f"{row['change']:+7.1%}"
+        flag = "❌ 회귀" if row["regression"] else "✅"
+        print(
+            f"{flag} {row['scenario']:>15} {row['metric']:>7}: "
+            f"{row['baseline']:10,.2f} → {row['current']:10,.2f} {change}"
+        )
+
+    regressions = sum(1 for row in rows if row["regression"])
+    print(f"회귀 {regressions}건 / 비교 {len(rows)}건")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 리포트 비교")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    rows = compare_reports(baseline, current, args.threshold)
+    print_comparison(rows)
+    sys.exit(1 if any(row["regression"] for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
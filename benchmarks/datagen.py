@@ -0,0 +1,141 @@
+"""
+합성 데이터 생성기
+벤치마크용 한국어 사용자·도서 데이터 (시드 고정으로 재현 가능)
+"""
+
+import random
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator
+
+THEMES = ("work", "healing", "growth")
+
+CATEGORIES = ("소설", "에세이", "자기계발", "인문", "경제경영", "시", "과학", "역사")
+
+TITLE_HEADS = (
+    "퇴근 후", "오늘도", "조용한", "다정한", "느리게", "한 걸음", "마음의", "작은",
+    "서른의", "새벽의", "내일의", "보통의", "어떤", "우리의", "혼자서", "다시",
+)
+TITLE_BODIES = (
+    "힐링", "위로", "일의 기쁨", "성장", "습관", "여행", "산책", "기록", "대화",
+    "용기", "계절", "식탁", "도시", "서점", "편지", "바다", "숲", "하루",
+)
+TITLE_TAILS = (
+    "이야기", "수업", "연습", "안내서", "에세이", "소설", "노트", "철학", "방법", "시간",
+)
+
+FAMILY_NAMES = ("김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오")
+GIVEN_NAMES = ("지현", "민수", "서연", "하준", "유진", "도윤", "수아", "지호", "은비", "태오", "보라", "현우")
+
+PUBLISHERS = ("책메이트", "푸른숲", "열린책방", "바람출판", "새벽서재", "한빛문고")
+
+KEYWORDS = (
+    "힐링", "위로", "직장", "퇴근", "성장", "습관", "자존감", "관계", "여행", "독서",
+    "글쓰기", "커리어", "마음챙김", "일상", "감성", "동기부여", "리더십", "휴식",
+)
+
+DESCRIPTION_SENTENCES = (
+    "하루의 피로를 풀어주는 따뜻한 이야기.",
+    "일과 삶 사이에서 균형을 찾는 방법을 이야기한다.",
+    "작은 습관이 만드는 큰 변화를 담았다.",
+    "지친 마음을 다독이는 문장들이 가득하다.",
+    "새로운 시작을 준비하는 모든 사람에게.",
+    "평범한 일상 속에서 발견한 특별한 순간들.",
+    "성장하고 싶은 직장인을 위한 안내서.",
+    "조용히 읽기 좋은 밤의 책.",
+)
+
+
+def book_rows(count: int, seed: int = 42) -> Iterator[Dict]:
+    """
+    합성 도서 데이터 생성
+
+    Args:
+        count: 생성할 도서 수
+        seed: 난수 시드
+
+    Yields:
+        dict: Book 컬럼명 → 값 (id 제외)
+    """
+    rng = random.Random(seed)
+    base_time = datetime(2024, 1, 1)
+
+    for i in range(count):
+        title = f"{rng.choice(TITLE_HEADS)} {rng.choice(TITLE_BODIES)} {rng.choice(TITLE_TAILS)}"
+        if rng.random() < 0.3:
+            title += f" {rng.randint(1, 5)}"
+
+        theme = rng.choice(THEMES)
+        yield {
+            "title": title,
+            "author": rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES),
+            "publisher": rng.choice(PUBLISHERS),
+            "isbn": f"979{i:010d}",
+            "description": " ".join(rng.sample(DESCRIPTION_SENTENCES, 2)),
+            "price": rng.randrange(8000, 32000, 500),
+            "rating": round(rng.uniform(2.5, 5.0), 1),
+            "review_count": rng.randint(0, 2000),
+            "theme": theme,
+            "category": rng.choice(CATEGORIES),
+            "keywords": ",".join(rng.sample(KEYWORDS, 3)),
+            "is_popular": rng.random() < 0.05,
+            "is_curator_pick": rng.random() < 0.02,
+            "published_date": date(2000, 1, 1) + timedelta(days=rng.randint(0, 9000)),
+            "page_count": rng.randint(120, 600),
+            "created_at": base_time + timedelta(seconds=i),
+        }
+
+
+# 시드 사용자 공통 비밀번호 (bcrypt 해시는 한 번만 계산해 모든 사용자에 재사용)
+BENCH_PASSWORD = "bench-password-1234"
+
+
+def bench_email(i: int) -> str:
+    """i번째 시드 사용자 이메일"""
+    return f"bench{i:07d}@chaekmate.dev"
+
+
+def user_rows(count: int, hashed_password: str, seed: int = 42) -> Iterator[Dict]:
+    """
+    합성 사용자 데이터 생성
+
+    Args:
+        count: 생성할 사용자 수
+        hashed_password: BENCH_PASSWORD의 해시
+        seed: 난수 시드
+
+    Yields:
+        dict: User 컬럼명 → 값 (id 제외)
+    """
+    rng = random.Random(seed)
+    base_time = datetime(2024, 1, 1)
+
+    for i in range(count):
+        yield {
+            "email": bench_email(i),
+            "hashed_password": hashed_password,
+            "name": rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES),
+            "is_active": True,
+            "is_verified": rng.random() < 0.7,
+            "agree_terms": True,
+            "agree_privacy": True,
+            "agree_marketing": rng.random() < 0.3,
+            "created_at": base_time + timedelta(seconds=i * 7),
+        }
+
+
+def search_queries(count: int, seed: int = 7) -> Iterator[str]:
+    """
+    합성 검색어 생성
+
+    Args:
+        count: 생성할 검색어 수
+        seed: 난수 시드
+
+    Yields:
+        str: 검색어 (제목 단어, 키워드, 저자명 조합)
+    """
+    rng = random.Random(seed)
+    pools = (TITLE_BODIES, KEYWORDS, TITLE_TAILS)
+    for _ in range(count):
+        words = [rng.choice(rng.choice(pools)) for _ in range(rng.randint(1, 2))]
+        yield " ".join(words)
@@ -0,0 +1,281 @@
+"""
+부하 테스트 드라이버
+인증·도서 라우트를 동시 요청으로 호출하고 처리량과 지연 백분위(p50/p95/p99)를 JSON 리포트로 저장
+
+시드된 DB(benchmarks.seed)에 대해 실행:
+    # 앱을 같은 프로세스에서 실행 (httpx ASGI 전송, 네트워크 제외)
+    python -m benchmarks.load --requests 2000 --concurrency 50 --output report.json
+    # 실행 중인 서버 대상
+    python -m benchmarks.load --base-url http://localhost:8000 --output report.json
+    # 기준 리포트와 비교 (회귀가 있으면 종료 코드 1)
+    python -m benchmarks.load --output report.json --baseline benchmarks/baseline.json
+
+서버를 따로 띄울 때는 로그인 제한(LOGIN_THROTTLE_*)을 충분히 크게 설정해야 한다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# 같은 프로세스에서 앱을 띄울 때 부하 발생기(단일 IP)가 로그인 제한에 걸리지 않도록 함
+os.environ.setdefault("LOGIN_THROTTLE_IP_CAPACITY", "1000000000")
+os.environ.setdefault("LOGIN_THROTTLE_EMAIL_CAPACITY", "1000000000")
+
+import httpx
+
+from benchmarks.compare import compare_reports, print_comparison
+from benchmarks.datagen import BENCH_PASSWORD, bench_email, search_queries
+
+API = "/api/v1"
+
+# 기본 시나리오 순서 (회원가입은 사용자를 늘리므로 마지막)
+DEFAULT_SCENARIOS = (
+    "auth.login", "auth.me", "auth.refresh",
+    "books.list", "books.search", "books.recommend",
+    "auth.register",
+)
+
+
+def percentile(values: List[float], p: float) -> float:
+    """백분위 계산 (ms)"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * p))
+    return ordered[index] * 1000
+
+
+def summarize(latencies: List[float], errors: int, statuses: Dict[int, int], elapsed: float) -> dict:
+    """시나리오 결과 요약"""
+    if not latencies:
+        return {"requests": errors, "errors": errors, "statuses": statuses}
+    return {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "statuses": statuses,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+    }
+
+
+class LoadRunner:
+    """
+    시나리오별 부하 실행기
+
+    가상 사용자는 시드 사용자(bench0000000@…) 중에서 고르며,
+    /auth/me·/auth/refresh용 토큰은 측정 전에 로그인해서 준비한다.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, users: int, seed: int = 1):
+        self.client = client
+        self.users = users
+        self.rng = random.Random(seed)
+        self.queries = list(search_queries(1000, seed))
+
+        self.access_tokens: List[str] = []
+        # Refresh Token은 한 번 쓰면 폐기되므로 매번 새 토큰으로 교체
+        self.refresh_tokens: asyncio.Queue = asyncio.Queue()
+        self._register_seq = 0
+
+    async def prepare_tokens(self, count: int) -> None:
+        """측정 전 로그인으로 토큰 풀 준비"""
+        for i in range(count):
+            response = await self.client.post(
+                f"{API}/auth/login",
+                json={"email": bench_email(i % self.users), "password": BENCH_PASSWORD},
+            )
+            response.raise_for_status()
+            body = response.json()
+            self.access_tokens.append(body["access_token"])
+            self.refresh_tokens.put_nowait(body["refresh_token"])
+
+    # ===== 시나리오 =====
+
+    async def auth_register(self) -> httpx.Response:
+        self._register_seq += 1
+        return await self.client.post(f"{API}/auth/register", json={
+            "email": f"load-{os.getpid()}-{time.time_ns()}-{self._register_seq}@chaekmate.dev",
+            "password": BENCH_PASSWORD,
+            "agree_terms": True,
+            "agree_privacy": True,
+        })
+
+    async def auth_login(self) -> httpx.Response:
+        return await self.client.post(f"{API}/auth/login", json={
+            "email": bench_email(self.rng.randrange(self.users)),
+            "password": BENCH_PASSWORD,
+        })
+
+    async def auth_me(self) -> httpx.Response:
+        token = self.rng.choice(self.access_tokens)
+        return await self.client.get(f"{API}/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+    async def auth_refresh(self) -> httpx.Response:
+        # 같은 토큰으로 동시에 갱신하면 재사용으로 판정되므로 토큰을 꺼내 쓰고 새 토큰을 돌려놓음
+        token = await self.refresh_tokens.get()
+        response = await self.client.post(f"{API}/auth/refresh", json={"refresh_token": token})
+        self.refresh_tokens.put_nowait(response.json()["refresh_token"] if response.is_success else token)
+        return response
+
+    async def books_list(self) -> httpx.Response:
+        params = {"limit": 20, "sort": self.rng.choice(["latest", "rating"])}
+        if self.rng.random() < 0.7:
+            params["theme"] = self.rng.choice(["work", "healing", "growth"])
+        return await self.client.get(f"{API}/books", params=params)
+
+    async def books_search(self) -> httpx.Response:
+        return await self.client.get(f"{API}/books/search", params={"q": self.rng.choice(self.queries)})
+
+    async def books_recommend(self) -> httpx.Response:
+        return await self.client.get(f"{API}/books/recommend", params={"q": self.rng.choice(self.queries), "k": 10})
+
+    def scenario(self, name: str) -> Callable[[], Awaitable[httpx.Response]]:
+        return getattr(self, name.replace(".", "_"))
+
+    async def run(self, name: str, total: int, concurrency: int) -> dict:
+        """
+        시나리오 실행
+
+        Args:
+            name: 시나리오 이름 (예: 'auth.login')
+            total: 요청 수
+            concurrency: 동시 요청 수
+
+        Returns:
+            dict: 요청/오류 수, 상태 코드 분포, 처리량, 지연 백분위
+        """
+        call = self.scenario(name)
+        latencies: List[float] = []
+        statuses: Dict[int, int] = {}
+        errors = 0
+        remaining = total
+
+        async def worker():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    response = await call()
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                elapsed = time.perf_counter() - started
+
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if response.is_success:
+                    latencies.append(elapsed)
+                else:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return summarize(latencies, errors, statuses, time.perf_counter() - started)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main_async(args) -> dict:
+    app = None
+    if args.base_url:
+        transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=args.concurrency))
+        base_url = args.base_url
+    else:
+        import main
+
+        app = main.app
+        await app.router.startup()
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://bench"
+
+    scenarios = args.scenarios.split(",") if args.scenarios else list(DEFAULT_SCENARIOS)
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "target": args.base_url or "in-process",
+            "python": platform.python_version(),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "users": args.users,
+        },
+        "scenarios": {},
+    }
+
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=30) as client:
+            runner = LoadRunner(client, args.users)
+            if {"auth.me", "auth.refresh"} & set(scenarios):
+                await runner.prepare_tokens(max(args.concurrency * 2, 50))
+
+            for name in scenarios:
+                # 워밍업 (커넥션 풀·캐시 준비) 후 측정
+                await runner.run(name, min(args.warmup, args.requests), args.concurrency)
+                result = await runner.run(name, args.requests, args.concurrency)
+                report["scenarios"][name] = result
+
+                if "p50_ms" in result:
+                    print(
+                        f"[{name:>15}] {result['rps']:8,.0f} req/s  "
+                        f"p50={result['p50_ms']:7.2f}ms p95={result['p95_ms']:7.2f}ms "
+                        f"p99={result['p99_ms']:7.2f}ms  errors={result['errors']}",
+                        file=sys.stderr,
+                    )
+                else:
+                    print(f"[{name:>15}] 모든 요청 실패 {result['statuses']}", file=sys.stderr)
+    finally:
+        if app is not None:
+            await app.router.shutdown()
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트")
+    parser.add_argument("--base-url", default=None, help="대상 서버 (생략 시 같은 프로세스에서 앱 실행)")
+    parser.add_argument("--scenarios", default=None, help=f"쉼표 구분 (기본: {','.join(DEFAULT_SCENARIOS)})")
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--users", type=int, default=100000, help="시드된 사용자 수")
+    parser.add_argument("--output", default=None, help="JSON 리포트 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 리포트")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀 판정 기준 (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare_reports(baseline, report, args.threshold)
+        print_comparison(rows)
+        if any(row["regression"] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+커넥션 풀 설정 비교 (워커 수 × 풀 크기)
+설정마다 uvicorn을 워커 N개로 띄워 부하를 주고 처리량·지연, 풀 대기 시간, 실제 DB 연결 수를 비교
+
+워커마다 엔진별 풀이 따로 생기므로 DB 연결 상한은
+    워커 수 × (DB_POOL_SIZE + DB_MAX_OVERFLOW) × 엔진 수
+이고, 이 값이 PostgreSQL max_connections(에서 관리용 여유분을 뺀 값)를 넘지 않아야 한다.
+PgBouncer 모드는 DATABASE_URL이 PgBouncer를 가리키게 하고 --mode pgbouncer로 실행한다.
+
+시드된 PostgreSQL(DATABASE_URL)에 대해 실행:
+    python -m benchmarks.pool_sweep --workers 1,2,4 --pool-sizes 5,10,20 --max-overflow 5
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+from prometheus_client.parser import text_string_to_metric_families
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from benchmarks import load
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# 관리용 접속(psql, 마이그레이션, 모니터링)을 위해 남겨 둘 연결 수
+RESERVED_CONNECTIONS = 5
+
+# API 라우트는 비동기 엔진만 사용 (동기 엔진은 관리자 적재 등에서만 연결을 연다)
+ENGINES_PER_WORKER = 1
+
+
+class ConnectionSampler:
+    """pg_stat_activity에서 현재 DB의 연결 수를 주기적으로 읽어 최댓값 기록"""
+
+    def __init__(self, database_url: str, interval: float = 0.2):
+        self.engine = create_engine(database_url, poolclass=NullPool)
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _count(self, conn) -> int:
+        return conn.execute(text(
+            "SELECT count(*) FROM pg_stat_activity "
+            "WHERE datname = current_database() AND pid <> pg_backend_pid()"
+        )).scalar()
+
+    def _run(self) -> None:
+        with self.engine.connect() as conn:
+            while not self._stop.is_set():
+                self.peak = max(self.peak, self._count(conn))
+                self._stop.wait(self.interval)
+
+    def max_connections(self) -> int:
+        with self.engine.connect() as conn:
+            return int(conn.execute(text("SHOW max_connections")).scalar())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def start_server(workers: int, port: int, env: dict) -> subprocess.Popen:
+    command = [
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ]
+    server = subprocess.Popen(command, cwd=ROOT, env=env)
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"서버 시작 실패 (exit {server.returncode})")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).is_success:
+                return server
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    server.terminate()
+    raise SystemExit("서버 시작 시간 초과")
+
+
+def scrape_pool_metrics(port: int) -> dict:
+    """/metrics에서 워커 전체의 풀 대기 시간·타임아웃 합계"""
+    body = httpx.get(f"http://127.0.0.1:{port}/metrics", timeout=5).text
+    totals = {"wait_sum": 0.0, "wait_count": 0.0, "timeouts": 0.0}
+    for family in text_string_to_metric_families(body):
+        for sample in family.samples:
+            if sample.name == "db_pool_checkout_wait_seconds_sum":
+                totals["wait_sum"] += sample.value
+            elif sample.name == "db_pool_checkout_wait_seconds_count":
+                totals["wait_count"] += sample.value
+            elif sample.name == "db_pool_timeouts_total":
+                totals["timeouts"] += sample.value
+    return totals
+
+
+def run_config(args, workers: int, pool_size: int) -> dict:
+    """설정 하나 측정"""
+    with tempfile.TemporaryDirectory() as metrics_dir:
+        env = {
+            **os.environ,
+            "DB_POOL_MODE": args.mode,
+            "DB_POOL_SIZE": str(pool_size),
+            "DB_MAX_OVERFLOW": str(args.max_overflow),
+            "DB_POOL_TIMEOUT": str(args.pool_timeout),
+            "PROMETHEUS_MULTIPROC_DIR": metrics_dir,
+            "LOGIN_THROTTLE_IP_CAPACITY": "1000000000",
+            "LOGIN_THROTTLE_EMAIL_CAPACITY": "1000000000",
+            # 응답 캐시를 끄고 매 요청이 DB 연결을 쓰도록 함
+            "RESPONSE_CACHE_BOOK_LIST_TTL": "0",
+            "RESPONSE_CACHE_BOOK_SEARCH_TTL": "0",
+        }
+        server = start_server(workers, args.port, env)
+        try:
+            with ConnectionSampler(settings.DATABASE_URL) as sampler:
+                report = asyncio.run(load.main_async(argparse.Namespace(
+                    base_url=f"http://127.0.0.1:{args.port}",
+                    scenarios=args.scenarios,
+                    requests=args.requests,
+                    concurrency=args.concurrency,
+                    warmup=args.warmup,
+                    users=args.users,
+                )))
+            pool = scrape_pool_metrics(args.port)
+        finally:
+            server.terminate()
+            server.wait()
+
+    scenarios = report["scenarios"].values()
+    return {
+        "workers": workers,
+        "pool_size": pool_size,
+        "limit": workers * (pool_size + args.max_overflow) * ENGINES_PER_WORKER,
+        "peak_connections": sampler.peak,
+        "rps": sum(s.get("rps", 0.0) for s in scenarios),
+        "p95_ms": max(s.get("p95_ms", 0.0) for s in scenarios),
+        "errors": sum(s["errors"] for s in scenarios),
+        "avg_wait_ms": pool["wait_sum"] / pool["wait_count"] * 1000 if pool["wait_count"] else 0.0,
+        "timeouts": int(pool["timeouts"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="커넥션 풀 설정 비교")
+    parser.add_argument("--workers", default="1,2,4", help="쉼표 구분 워커 수")
+    parser.add_argument("--pool-sizes", default="5,10,20", help="쉼표 구분 DB_POOL_SIZE")
+    parser.add_argument("--max-overflow", type=int, default=5)
+    parser.add_argument("--pool-timeout", type=float, default=10)
+    parser.add_argument("--mode", default="queue", choices=["queue", "pgbouncer"])
+    parser.add_argument("--scenarios", default="books.list,books.search")
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if not settings.DATABASE_URL.startswith("postgresql"):
+        raise SystemExit("PostgreSQL DATABASE_URL이 필요합니다")
+
+    max_connections = ConnectionSampler(settings.DATABASE_URL).max_connections()
+    budget = max_connections - RESERVED_CONNECTIONS
+    print(f"max_connections={max_connections} (앱에 쓸 수 있는 연결 {budget}개)", file=sys.stderr)
+
+    rows = []
+    for workers, pool_size in itertools.product(
+        [int(w) for w in args.workers.split(",")],
+        [int(p) for p in args.pool_sizes.split(",")],
+    ):
+        if args.mode == "queue" and workers * (pool_size + args.max_overflow) * ENGINES_PER_WORKER > budget:
+            print(f"건너뜀: workers={workers} pool_size={pool_size} (연결 상한 초과)", file=sys.stderr)
+            continue
+        rows.append(run_config(args, workers, pool_size))
+
+    print(
+        f"{'workers':>7} {'pool':>5} {'limit':>6} {'peak':>5} {'req/s':>9} {'p95 ms':>8} "
+        f"{'wait ms':>8} {'timeouts':>8} {'errors':>6}"
+    )
+    for row in rows:
+        print(
+            f"{row['workers']:>7} {row['pool_size']:>5} {row['limit']:>6} {row['peak_connections']:>5} "
+            f"{row['rps']:>9,.0f} {row['p95_ms']:>8.1f} {row['avg_wait_ms']:>8.2f} "
+            f"{row['timeouts']:>8} {row['errors']:>6}"
+        )
+
+    # 오류·타임아웃 없이 처리량이 가장 높은 설정 중 연결을 가장 적게 쓰는 것
+    healthy = [row for row in rows if not row["errors"] and not row["timeouts"]]
+    if healthy:
+        best_rps = max(row["rps"] for row in healthy)
+        best = min(
+            (row for row in healthy if row["rps"] >= best_rps * 0.95),
+            key=lambda row: (row["limit"], -row["rps"]),
+        )
+        print(
+            f"권장: 워커 {best['workers']}개, DB_POOL_SIZE={best['pool_size']}, "
+            f"DB_MAX_OVERFLOW={args.max_overflow} (최고 처리량의 95% 이상 중 연결 상한 최소: {best['limit']})"
+        )
+
+
+if __name__ == "__main__":
+    main()
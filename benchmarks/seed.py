@@ -0,0 +1,190 @@
+"""
+벤치마크용 DB 시드
+마이그레이션이 적용된 DB(DATABASE_URL)에 합성 사용자·도서를 적재
+
+PostgreSQL은 COPY로, 그 외 DB(SQLite 등)는 배치 INSERT로 적재한다.
+
+실행:
+    alembic upgrade head
+    python -m benchmarks.seed --users 100000 --books 1000000 --reset
+    python -m benchmarks.seed --books 50000 --embeddings   # 추천 라우트용 임베딩까지
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import itertools
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from sqlalchemy import insert, text
+
+from app.core.database import engine
+from app.core.security import get_password_hash
+from app.models.book import SEARCH_FIELDS, Book
+from app.models.user import User
+from app.utils.ids import new_id
+from app.utils.text import to_search_document
+from benchmarks.datagen import BENCH_PASSWORD, book_rows, user_rows
+
+USER_COLUMNS = [
+    "id", "email", "hashed_password", "name", "is_active", "is_verified",
+    "agree_terms", "agree_privacy", "agree_marketing", "created_at",
+]
+
+BOOK_COLUMNS = [
+    "id", "title", "author", "publisher", "isbn", "description", "price", "rating",
+    "review_count", "theme", "category", "keywords", "is_popular", "is_curator_pick",
+    "published_date", "page_count", "created_at",
+]
+
+# 검색 벡터는 필드별 토큰 문서를 스테이징한 뒤 SQL에서 가중치를 붙여 만든다
+BOOK_DOC_COLUMNS = [f"{field}_doc" for field, _ in SEARCH_FIELDS]
+
+BOOK_STAGING_DDL = """
+CREATE TEMP TABLE IF NOT EXISTS seed_books (LIKE books INCLUDING DEFAULTS, {docs}) ON COMMIT DELETE ROWS
+""".format(docs=", ".join(f"{column} TEXT" for column in BOOK_DOC_COLUMNS))
+
+BOOK_MERGE_SQL = f"""
+INSERT INTO books ({", ".join(BOOK_COLUMNS)}, updated_at, search_vector)
+SELECT {", ".join(BOOK_COLUMNS)}, created_at,
+    {" || ".join(
+        f"setweight(to_tsvector('simple', coalesce({field}_doc, '')), '{weight}')"
+        for field, weight in SEARCH_FIELDS
+    )}
+FROM seed_books
+"""
+
+
+def batched(rows: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def to_csv(rows: List[list]) -> io.StringIO:
+    """COPY ... WITH (FORMAT csv)용 버퍼 (None → NULL, bool → t/f)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["t" if v is True else "f" if v is False else v for v in row])
+    buffer.seek(0)
+    return buffer
+
+
+def copy_users(raw, batch: List[Dict]) -> None:
+    buffer = to_csv([[new_id(), *(row[c] for c in USER_COLUMNS[1:])] for row in batch])
+    with raw.cursor() as cursor:
+        cursor.copy_expert(f"COPY users ({', '.join(USER_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def copy_books(raw, batch: List[Dict]) -> None:
+    buffer = to_csv([
+        [
+            new_id(),
+            *(row[c] for c in BOOK_COLUMNS[1:]),
+            *(to_search_document([row.get(field)]) for field, _ in SEARCH_FIELDS),
+        ]
+        for row in batch
+    ])
+    with raw.cursor() as cursor:
+        cursor.execute(BOOK_STAGING_DDL)
+        cursor.copy_expert(
+            f"COPY seed_books ({', '.join(BOOK_COLUMNS + BOOK_DOC_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        cursor.execute(BOOK_MERGE_SQL)
+
+
+def insert_users(conn, batch: List[Dict]) -> None:
+    conn.execute(insert(User.__table__), [{"id": new_id(), **row} for row in batch])
+
+
+def insert_books(conn, batch: List[Dict]) -> None:
+    conn.execute(insert(Book.__table__), [
+        {
+            "id": new_id(),
+            **row,
+            "updated_at": row["created_at"],
+            "search_vector": to_search_document(row.get(field) for field, _ in SEARCH_FIELDS),
+        }
+        for row in batch
+    ])
+
+
+def load(name: str, rows: Iterable[Dict], total: int, batch_size: int, copy: Callable, insert_batch: Callable) -> None:
+    """배치 단위 적재 + 진행 상황 출력"""
+    started = time.perf_counter()
+    loaded = 0
+
+    for batch in batched(rows, batch_size):
+        if engine.dialect.name == "postgresql":
+            raw = engine.raw_connection()
+            try:
+                copy(raw, batch)
+                raw.commit()
+            finally:
+                raw.close()
+        else:
+            with engine.begin() as conn:
+                insert_batch(conn, batch)
+
+        loaded += len(batch)
+        rate = loaded / (time.perf_counter() - started)
+        print(f"  {name}: {loaded:,}/{total:,} ({rate:,.0f}행/s)", file=sys.stderr)
+
+
+def reset() -> None:
+    """시드 대상 테이블 비우기"""
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("TRUNCATE users, books, revoked_tokens"))
+        else:
+            for table in ("users", "books", "revoked_tokens"):
+                conn.execute(text(f"DELETE FROM {table}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 DB 시드")
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--books", type=int, default=1000000)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="적재 전에 기존 데이터 삭제")
+    parser.add_argument("--embeddings", action="store_true", help="적재 후 도서 임베딩 백필")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.reset:
+        reset()
+
+    if args.users:
+        # 모든 시드 사용자는 같은 비밀번호(BENCH_PASSWORD)를 사용
+        hashed_password = get_password_hash(BENCH_PASSWORD)
+        load("users", user_rows(args.users, hashed_password, args.seed), args.users,
+             args.batch_size, copy_users, insert_users)
+
+    if args.books:
+        load("books", book_rows(args.books, args.seed), args.books,
+             args.batch_size, copy_books, insert_books)
+
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("ANALYZE users, books"))
+
+    if args.embeddings:
+        from app.jobs.backfill_embeddings import main_async
+
+        asyncio.run(main_async(batch_size=512, recompute=False, limit=None))
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ 시드 완료: 사용자 {args.users:,}명, 도서 {args.books:,}권 ({elapsed:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,21 @@ ChaekMate Backend API
 FastAPI 애플리케이션 메인 엔트리포인트
 """
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from app.api.deps import require_metrics_access
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import async_engine, check_schema_revision
+from app.core.hashing import password_hasher
+from app.core.metrics import MetricsMiddleware, mark_worker_dead, render_metrics
+from app.core.redis import close_redis
+from app.core.replicas import ReadYourWritesMiddleware, replica_router
+from app.services.cover_service import thumbnail_pool
+from app.services.llm import llm_pool
 
 # 라우터 import
-from app.api.v1 import auth
+from app.api.v1 import admin, auth, books, covers, home, reviews
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -18,6 +26,7 @@ app = FastAPI(
     version=settings.VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 설정
@@ -29,12 +38,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 지표 (라우트별 지연·상태 코드·DB 시간)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# 읽기 복제본 사용 시 쓰기 직후 읽기는 주 DB로 (쿠키 기반)
+if settings.replica_urls_list:
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.DB_READ_YOUR_WRITES_SECONDS)
+
 
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 실행"""
-    init_db()
-    print("✅ 데이터베이스 초기화 완료")
+    await check_schema_revision()
+    print("✅ 데이터베이스 스키마 확인 완료")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 실행"""
+    password_hasher.shutdown()
+    thumbnail_pool.shutdown()
+    await llm_pool.aclose()
+    await async_engine.dispose()
+    await replica_router.dispose()
+    await close_redis()
+    mark_worker_dead()
 
 
 @app.get("/")
@@ -53,8 +82,24 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_access)])
+async def metrics():
+    """
+    Prometheus 지표
+    
+    인증 헤더: Authorization: Bearer {METRICS_TOKEN} 또는 X-Admin-Key: {ADMIN_API_KEY}
+    """
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 # 라우터 등록
 app.include_router(auth.router, prefix=f"{settings.API_V1_PREFIX}/auth", tags=["인증"])
+app.include_router(books.router, prefix=f"{settings.API_V1_PREFIX}/books", tags=["도서"])
+app.include_router(covers.router, prefix=f"{settings.API_V1_PREFIX}/covers", tags=["표지"])
+app.include_router(home.router, prefix=f"{settings.API_V1_PREFIX}/home", tags=["홈"])
+app.include_router(reviews.router, prefix=settings.API_V1_PREFIX, tags=["리뷰"])
+app.include_router(admin.router, prefix=f"{settings.API_V1_PREFIX}/admin", tags=["관리자"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+"""
+테스트 공통 설정
+app 모듈을 import하기 전에 필수 설정값을 채운다 (.env가 없어도 실행되도록)
+"""
+
+import os
+import tempfile
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'chaekmate-test.db')}")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-for-pytest-only-0123456789")
+os.environ.setdefault("DEBUG", "False")
+
+
+def sqlite_url(path) -> str:
+    """임시 SQLite 파일 URL (동기 드라이버 형식, create_async_db_engine이 변환)"""
+    return f"sqlite:///{path}"
+
+
+async def create_schema(url: str):
+    """모델 메타데이터로 테이블을 만든 비동기 엔진 반환"""
+    from app.core.database import Base, create_async_db_engine
+    import app.models  # noqa: F401  (모든 모델을 메타데이터에 등록)
+
+    engine = create_async_db_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return engine
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path, monkeypatch):
+    """테이블이 준비된 임시 SQLite 비동기 세션 팩토리 (AsyncSessionLocal 대체용)"""
+    from app.services import home_feed_service
+
+    engine = await create_schema(sqlite_url(tmp_path / "test.db"))
+    factory = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    # 도서 커밋 후 예약되는 홈 피드 갱신도 같은 임시 DB를 쓰도록
+    monkeypatch.setattr(home_feed_service, "AsyncSessionLocal", factory)
+    yield factory
+    # 테스트 이벤트 루프가 닫히기 전에 갱신 작업을 끝낸다 (남으면 aiosqlite 스레드가 종료를 막음)
+    if home_feed_service._refresh_task is not None:
+        await home_feed_service._refresh_task
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def async_db(session_factory):
+    """테이블이 준비된 임시 SQLite 비동기 세션"""
+    async with session_factory() as session:
+        yield session
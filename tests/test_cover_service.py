@@ -0,0 +1,86 @@
+"""표지 업로드(CoverService.upload_cover) 테스트 (썸네일은 프로세스 풀 없이 같은 프로세스에서 생성)"""
+
+import io
+import os
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from PIL import Image
+
+from app.core.config import settings
+from app.models.book import Book
+from app.services import cover_service
+from app.services.cover_service import CoverService, cover_dir
+from app.utils.images import make_thumbnails
+
+
+def jpeg_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (400, 300), (10, 200, 30)).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+async def body(data: bytes, chunk_size: int = 1024, on_chunk=None):
+    for start in range(0, len(data), chunk_size):
+        if on_chunk is not None:
+            on_chunk()
+        yield data[start:start + chunk_size]
+
+
+@pytest_asyncio.fixture
+async def book(async_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path / "uploads"))
+
+    async def inline_thumbnails(source, widths, target_pattern):
+        return make_thumbnails(source, widths, target_pattern)
+
+    monkeypatch.setattr(cover_service.thumbnail_pool, "make_thumbnails", inline_thumbnails)
+
+    book = Book(title="표지 테스트", author="저자")
+    async_db.add(book)
+    await async_db.commit()
+    return book
+
+
+@pytest.mark.asyncio
+async def test_upload_releases_connection_while_receiving_body(session_factory, async_db, book):
+    in_transaction = []
+
+    # 요청마다 새 세션을 쓰는 라우트와 같은 조건 (도서가 세션에 아직 없음)
+    async with session_factory() as db:
+        response = await CoverService.upload_cover(
+            db, book.id, body(jpeg_bytes(), on_chunk=lambda: in_transaction.append(db.in_transaction()))
+        )
+
+    assert in_transaction and not any(in_transaction)
+    assert response.cover_image.endswith(f"{response.sha256}.jpg")
+    assert set(response.thumbnails) == set(settings.cover_thumbnail_widths_list)
+    await async_db.refresh(book)
+    assert book.cover_image == response.cover_image
+
+
+@pytest.mark.asyncio
+async def test_corrupt_image_is_rejected_and_original_removed(async_db, book):
+    data = jpeg_bytes()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await CoverService.upload_cover(async_db, book.id, body(data[: len(data) // 2]))
+
+    assert exc_info.value.status_code == 422
+    assert [name for _, _, names in os.walk(cover_dir()) for name in names] == []
+    await async_db.refresh(book)
+    assert book.cover_image is None
+
+
+@pytest.mark.asyncio
+async def test_missing_book_is_rejected_before_reading_body(async_db, book):
+    read = []
+
+    with pytest.raises(HTTPException) as exc_info:
+        await CoverService.upload_cover(
+            async_db, "00000000-0000-0000-0000-000000000000", body(jpeg_bytes(), on_chunk=lambda: read.append(1))
+        )
+
+    assert exc_info.value.status_code == 404
+    assert read == []
@@ -0,0 +1,56 @@
+"""로컬 임베딩(LocalHashEmbedder) 테스트"""
+
+import math
+
+import pytest
+
+from app.services.embedding import Embedder, LocalHashEmbedder, book_embedding_text
+
+
+def cosine(a, b):
+    return sum(x * y for x, y in zip(a, b))
+
+
+@pytest.mark.asyncio
+async def test_vectors_are_deterministic_normalized_and_sized():
+    embedder = LocalHashEmbedder(dim=64)
+
+    first, again = await embedder.embed(["퇴근 후 힐링되는 소설", "퇴근 후 힐링되는 소설"])
+
+    assert len(first) == 64
+    assert first == again
+    assert math.isclose(math.sqrt(sum(v * v for v in first)), 1.0)
+    # 새 인스턴스도 같은 벡터 (프로세스·워커 간 일관성)
+    assert LocalHashEmbedder(dim=64).embed_one("퇴근 후 힐링되는 소설") == first
+
+
+@pytest.mark.asyncio
+async def test_similar_texts_are_closer_than_unrelated_texts():
+    embedder = LocalHashEmbedder(dim=256)
+
+    query, paraphrase, unrelated = await embedder.embed([
+        "퇴근 후 힐링되는 소설 추천",
+        "퇴근하고 읽기 좋은 힐링 소설",
+        "파이썬 데이터 분석 입문",
+    ])
+
+    assert cosine(query, paraphrase) > 0.3
+    assert cosine(query, paraphrase) > cosine(query, unrelated)
+
+
+@pytest.mark.asyncio
+async def test_text_without_tokens_is_zero_vector():
+    embedder = LocalHashEmbedder(dim=16)
+
+    assert await embedder.embed(["", "!!!"]) == [[0.0] * 16, [0.0] * 16]
+
+
+def test_book_embedding_text_skips_missing_fields():
+    text = book_embedding_text("힐링 소설", "김작가", None, "힐링, 소설", "")
+
+    assert text == "힐링 소설\n김작가\n힐링, 소설"
+
+
+def test_embedder_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        Embedder()
@@ -0,0 +1,44 @@
+"""썸네일 생성(make_thumbnails) 테스트"""
+
+import io
+
+import pytest
+from PIL import Image
+
+from app.utils.images import make_thumbnails, sniff_image_type
+
+
+def image_bytes(fmt: str, mode: str = "RGB", size=(400, 300)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new(mode, size, (10, 200, 30, 128)[: len(mode)]).save(buffer, fmt)
+    return buffer.getvalue()
+
+
+def test_sniff_image_type():
+    assert sniff_image_type(image_bytes("JPEG")[:12]) == "jpg"
+    assert sniff_image_type(image_bytes("PNG")[:12]) == "png"
+    assert sniff_image_type(b"GIF89a......") is None
+
+
+def test_make_thumbnails_flattens_alpha_and_caps_width(tmp_path):
+    source = tmp_path / "cover.png"
+    source.write_bytes(image_bytes("PNG", mode="RGBA"))
+
+    targets = make_thumbnails(str(source), [100, 800], str(tmp_path / "cover_w{width}.jpg"))
+
+    with Image.open(targets[100]) as small, Image.open(targets[800]) as large:
+        assert (small.format, small.mode, small.size) == ("JPEG", "RGB", (100, 75))
+        # 원본보다 넓은 너비는 원본 크기
+        assert large.size == (400, 300)
+
+
+def test_truncated_jpeg_raises_value_error(tmp_path):
+    data = image_bytes("JPEG")
+    source = tmp_path / "cover.jpg"
+    # 헤더는 온전해 verify()는 통과하고 픽셀을 읽을 때 실패하는 파일
+    source.write_bytes(data[: len(data) // 2])
+
+    with pytest.raises(ValueError):
+        make_thumbnails(str(source), [100], str(tmp_path / "cover_w{width}.jpg"))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cover.jpg"]
@@ -0,0 +1,101 @@
+"""도서 대량 적재(BookIngestor) 테스트 (SQLite: 배치 INSERT ... ON CONFLICT 경로)"""
+
+import io
+
+import pytest
+from sqlalchemy import create_engine, select
+
+from app.core.database import Base
+from app.models.book import Book
+from app.models.book_facet import BookFacetCount, BookKeyword
+from app.services.ingest_service import BookIngestor, iter_records
+from tests.conftest import sqlite_url
+
+
+@pytest.fixture
+def engine(tmp_path):
+    import app.models  # noqa: F401  (모든 모델을 메타데이터에 등록)
+
+    engine = create_engine(sqlite_url(tmp_path / "ingest.db"))
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def ingest(engine, text: str, fmt: str = "jsonl", batch_size: int = 100):
+    return BookIngestor(engine, batch_size=batch_size).run(iter_records(io.StringIO(text), fmt))
+
+
+def keywords_by_isbn(engine) -> dict:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            select(Book.isbn, BookKeyword.keyword).join(BookKeyword, BookKeyword.book_id == Book.id)
+        ).all()
+    result: dict = {}
+    for isbn, keyword in rows:
+        result.setdefault(isbn, set()).add(keyword)
+    return result
+
+
+def test_rejected_rows_are_reported_with_line_numbers(engine):
+    report = ingest(engine, "\n".join([
+        '{"title": "정상 도서", "author": "저자", "isbn": "1"}',
+        "{not json",
+        '["배열"]',
+        '{"title": "", "author": "저자"}',
+        '{"title": "테마 오류", "author": "저자", "theme": "unknown"}',
+        "",
+        '{"title": "두 번째 정상 도서", "author": "저자"}',
+    ]))
+
+    assert (report.rows_read, report.rows_inserted, report.rows_rejected) == (6, 2, 4)
+    assert [reject.line for reject in report.rejects] == [2, 3, 4, 5]
+    assert report.rejects[0].error.startswith("JSON 파싱 오류")
+    assert report.rejects[1].error == "JSON 객체가 아닙니다"
+    assert report.rejects[2].error.startswith("title:")
+    assert report.rejects[3].error.startswith("theme:")
+
+
+def test_duplicate_isbn_in_batch_keeps_last_row(engine):
+    report = ingest(engine, "\n".join([
+        '{"title": "첫 판", "author": "저자", "isbn": "978-1", "keywords": "습관"}',
+        '{"title": "다른 책", "author": "저자", "isbn": "978-2"}',
+        '{"title": "개정판", "author": "저자", "isbn": "978-1", "keywords": "습관, 루틴"}',
+    ]))
+
+    assert report.rows_rejected == 0
+    with engine.connect() as conn:
+        titles = conn.execute(select(Book.isbn, Book.title).order_by(Book.isbn)).all()
+    assert titles == [("978-1", "개정판"), ("978-2", "다른 책")]
+    assert keywords_by_isbn(engine) == {"978-1": {"습관", "루틴"}}
+
+
+def test_reingest_updates_by_isbn_and_replaces_keywords(engine):
+    ingest(engine, "title,author,isbn,keywords,theme\n습관의 힘,저자,978-1,\"습관, 루틴\",growth\n", fmt="csv")
+
+    report = ingest(engine, "title,author,isbn,keywords,theme\n습관의 힘 (개정),저자,978-1,\"습관, 성장\",growth\n", fmt="csv")
+
+    assert report.rows_read == 1
+    with engine.connect() as conn:
+        books = conn.execute(select(Book.title, Book.search_vector)).all()
+        keyword_counts = dict(conn.execute(
+            select(BookFacetCount.value, BookFacetCount.count).where(
+                BookFacetCount.scope == "", BookFacetCount.facet == "keyword", BookFacetCount.count > 0
+            )
+        ).all())
+    assert len(books) == 1
+    assert books[0].title == "습관의 힘 (개정)"
+    assert "개정" in books[0].search_vector
+    assert keywords_by_isbn(engine) == {"978-1": {"습관", "성장"}}
+    # 적재 후 패싯 수를 다시 계산하므로 빠진 키워드는 집계에서도 사라진다
+    assert keyword_counts == {"습관": 1, "성장": 1}
+
+
+def test_batches_split_by_batch_size(engine):
+    rows = "\n".join(f'{{"title": "도서 {i}", "author": "저자", "isbn": "{i}"}}' for i in range(250))
+
+    report = ingest(engine, rows, batch_size=100)
+
+    assert (report.rows_read, report.rows_inserted, report.batches) == (250, 250, 3)
+    with engine.connect() as conn:
+        assert len(conn.execute(select(Book.id)).all()) == 250
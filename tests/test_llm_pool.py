@@ -0,0 +1,203 @@
+"""LLMPool 장애 전환 테스트 (StubProvider 사용, 외부 API 호출 없음)"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.llm import (
+    AnthropicProvider,
+    HTTPProvider,
+    LLMError,
+    LLMPool,
+    LLMProvider,
+    LLMUnavailable,
+    OpenAIProvider,
+    StubProvider,
+)
+
+PROMPT = "추천 도서:\n- 첫 번째 책 (저자)\n- 두 번째 책 (저자)"
+
+
+class FailAfterFirstToken(StubProvider):
+    """첫 토큰을 보낸 뒤 스트림이 끊기는 제공자"""
+
+    async def stream(self, system, prompt, max_tokens):
+        yield "첫 토큰 "
+        await asyncio.sleep(0)
+        raise LLMError(f"{self.name} 스트림 끊김")
+
+
+def make_pool(*providers, max_concurrency=4, queue_timeout=1.0, first_token_timeout=1.0, cooldown=30.0):
+    return LLMPool(
+        list(providers),
+        max_concurrency=max_concurrency,
+        queue_timeout=queue_timeout,
+        first_token_timeout=first_token_timeout,
+        cooldown=cooldown,
+    )
+
+
+def fast(name, **kwargs):
+    return StubProvider(name=name, first_token_delay=0.0, token_delay=0.0, **kwargs)
+
+
+def sse_provider(provider: HTTPProvider, body: str) -> HTTPProvider:
+    """고정 SSE 본문으로 응답하는 모의 전송 계층 연결"""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+    )
+    provider._client = httpx.AsyncClient(base_url=provider.base_url, transport=transport)
+    return provider
+
+
+async def collect(pool):
+    chunks = [chunk async for chunk in pool.stream("system", PROMPT)]
+    return {provider for provider, _ in chunks}, "".join(text for _, text in chunks)
+
+
+@pytest.mark.asyncio
+async def test_stream_uses_first_provider():
+    pool = make_pool(fast("primary"), fast("secondary"))
+
+    providers, text = await collect(pool)
+
+    assert providers == {"primary"}
+    assert text == StubProvider.compose(PROMPT)
+    assert pool.stats()["secondary"]["requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_error_before_first_token_fails_over_and_cools_down():
+    pool = make_pool(fast("primary", error_rate=1.0), fast("secondary"))
+
+    providers, text = await collect(pool)
+
+    assert providers == {"secondary"}
+    assert text == StubProvider.compose(PROMPT)
+    stats = pool.stats()
+    assert stats["primary"]["failures"] == 1
+    assert stats["primary"]["cooldown_seconds"] > 0
+    assert stats["primary"]["in_flight"] == 0
+
+    # 쿨다운 중인 제공자는 뒤로 밀려 다음 요청은 바로 secondary로
+    providers, _ = await collect(pool)
+    assert providers == {"secondary"}
+    assert pool.stats()["primary"]["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_first_token_timeout_fails_over():
+    slow = StubProvider(name="slow", first_token_delay=5.0, token_delay=0.0)
+    pool = make_pool(slow, fast("secondary"), first_token_timeout=0.05)
+
+    providers, _ = await asyncio.wait_for(collect(pool), timeout=2.0)
+
+    assert providers == {"secondary"}
+    assert pool.stats()["slow"]["failures"] == 1
+    assert pool.stats()["slow"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_skips_saturated_provider():
+    pool = make_pool(
+        StubProvider(name="primary", first_token_delay=0.0, token_delay=0.2),
+        fast("secondary"),
+        max_concurrency=1,
+        queue_timeout=0.05,
+    )
+
+    # primary의 유일한 슬롯을 잡고 있는 스트림
+    holder = pool.stream("system", PROMPT)
+    assert (await anext(holder))[0] == "primary"
+
+    providers, _ = await collect(pool)
+    assert providers == {"secondary"}
+    # 포화는 제공자 장애가 아니므로 쿨다운하지 않음
+    assert pool.stats()["primary"]["failures"] == 0
+    assert pool.stats()["primary"]["cooldown_seconds"] == 0
+
+    await holder.aclose()
+    assert pool.stats()["primary"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_no_failover_after_first_token():
+    secondary = fast("secondary")
+    pool = make_pool(FailAfterFirstToken(name="primary"), secondary)
+
+    received = []
+    with pytest.raises(LLMError):
+        async for provider, text in pool.stream("system", PROMPT):
+            received.append((provider, text))
+
+    # 이미 보낸 토큰과 섞이지 않도록 다른 제공자로 다시 시작하지 않는다
+    assert received == [("primary", "첫 토큰 ")]
+    stats = pool.stats()
+    assert stats["secondary"]["requests"] == 0
+    assert stats["primary"]["failures"] == 1
+    assert stats["primary"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_all_providers_failing_raises_unavailable():
+    pool = make_pool(fast("primary", error_rate=1.0), fast("secondary", error_rate=1.0))
+
+    with pytest.raises(LLMUnavailable) as exc_info:
+        await collect(pool)
+
+    assert "primary: error" in str(exc_info.value)
+    assert "secondary: error" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_no_providers_raises_unavailable():
+    with pytest.raises(LLMUnavailable):
+        await collect(make_pool())
+
+
+def test_provider_base_classes_are_abstract():
+    with pytest.raises(TypeError):
+        LLMProvider()
+    with pytest.raises(TypeError):
+        HTTPProvider(max_connections=1)
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_parses_deltas():
+    provider = sse_provider(
+        OpenAIProvider(api_key="k", model="m", max_connections=1),
+        'data: {"choices":[{"delta":{"content":"추천"}}]}\n\n'
+        'data: {"choices":[{"delta":{}}]}\n\n'
+        'data: {"choices":[{"delta":{"content":"합니다"}}]}\n\n'
+        "data: [DONE]\n\n",
+    )
+
+    assert [text async for text in provider.stream("system", PROMPT, 100)] == ["추천", "합니다"]
+    await provider.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk", ["{not json", "[1, 2]", '{"choices": ["x"]}'])
+async def test_malformed_openai_chunk_raises_llm_error_and_fails_over(chunk):
+    broken = sse_provider(OpenAIProvider(api_key="k", model="m", max_connections=1), f"data: {chunk}\n\n")
+    pool = make_pool(broken, fast("secondary"))
+
+    providers, text = await collect(pool)
+
+    assert providers == {"secondary"}
+    assert text == StubProvider.compose(PROMPT)
+    assert pool.stats()["openai"]["failures"] == 1
+    await broken.aclose()
+
+
+@pytest.mark.asyncio
+async def test_malformed_anthropic_chunk_raises_llm_error():
+    provider = sse_provider(
+        AnthropicProvider(api_key="k", model="m", max_connections=1),
+        "event: content_block_delta\ndata: {broken\n\n",
+    )
+
+    with pytest.raises(LLMError):
+        [text async for text in provider.stream("system", PROMPT, 100)]
+    await provider.aclose()
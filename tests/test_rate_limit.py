@@ -0,0 +1,87 @@
+"""로그인 시도 제한(토큰 버킷, throttle_login) 테스트 (인메모리 버킷)"""
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.api import deps
+from app.core.rate_limit import LoginThrottle, MemoryTokenBucket
+from app.schemas.auth import LoginRequest
+
+
+def login_request(ip: str) -> Request:
+    return Request({"type": "http", "method": "POST", "path": "/login", "headers": [], "client": (ip, 50000)})
+
+
+def login_data(email: str) -> LoginRequest:
+    return LoginRequest(email=email, password="wrong-password")
+
+
+@pytest.fixture
+def throttle(monkeypatch):
+    # 분당 1회 충전이라 테스트 중에는 사실상 채워지지 않는다
+    throttle = LoginThrottle(
+        ip_bucket=MemoryTokenBucket(capacity=5, refill_per_second=1 / 60, max_keys=100),
+        email_bucket=MemoryTokenBucket(capacity=3, refill_per_second=1 / 60, max_keys=100),
+    )
+    monkeypatch.setattr(deps, "login_throttle", throttle)
+    return throttle
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_returns_retry_after():
+    bucket = MemoryTokenBucket(capacity=3, refill_per_second=0.5, max_keys=10)
+
+    assert [await bucket.consume("k") for _ in range(3)] == [0.0, 0.0, 0.0]
+    retry_after = await bucket.consume("k")
+    assert 0 < retry_after <= 2
+
+    # 다른 키는 독립된 버킷, 초기화하면 다시 가득 찬다
+    assert await bucket.consume("other") == 0.0
+    await bucket.reset("k")
+    assert await bucket.consume("k") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_bucket_evicts_least_recently_used_keys():
+    bucket = MemoryTokenBucket(capacity=1, refill_per_second=1 / 60, max_keys=2)
+
+    for key in ("a", "b", "c"):
+        await bucket.consume(key)
+
+    assert list(bucket._buckets) == ["b", "c"]
+    # 밀려난 키는 가득 찬 버킷으로 다시 시작
+    assert await bucket.consume("a") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_email_burst_then_429_with_retry_after(throttle):
+    for ip in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+        await deps.throttle_login(login_request(ip), login_data("Reader@example.com"))
+
+    # IP를 바꿔도 같은 계정(대소문자 무시)은 막힌다
+    with pytest.raises(HTTPException) as exc_info:
+        await deps.throttle_login(login_request("10.0.0.4"), login_data("reader@example.com"))
+
+    assert exc_info.value.status_code == 429
+    assert 1 <= int(exc_info.value.headers["Retry-After"]) <= 60
+    assert (throttle.allowed, throttle.blocked_ip, throttle.blocked_email) == (3, 0, 1)
+
+    # 로그인에 성공하면 이메일 버킷이 초기화된다
+    await throttle.reset_email("reader@example.com")
+    await deps.throttle_login(login_request("10.0.0.5"), login_data("reader@example.com"))
+
+
+@pytest.mark.asyncio
+async def test_ip_burst_then_429_across_accounts(throttle):
+    for i in range(5):
+        await deps.throttle_login(login_request("10.0.0.1"), login_data(f"reader{i}@example.com"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await deps.throttle_login(login_request("10.0.0.1"), login_data("new@example.com"))
+
+    assert exc_info.value.status_code == 429
+    assert "Retry-After" in exc_info.value.headers
+    assert throttle.stats()["blocked_ip"] == 1
+    # 차단된 시도는 이메일 버킷을 소모하지 않는다
+    await deps.throttle_login(login_request("10.0.0.2"), login_data("new@example.com"))
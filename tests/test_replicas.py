@@ -0,0 +1,130 @@
+"""읽기 복제본 라우팅 테스트 (주 DB·복제본 역할을 하는 SQLite 파일 두 개 사용)"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.core.database import async_engine
+from app.core.replicas import ReadConsistency, ReplicaRouter, _read_consistency
+from app.models.book import Book
+from app.utils.ids import new_id
+from tests.conftest import create_schema, sqlite_url
+
+
+@pytest_asyncio.fixture
+async def replica_url(tmp_path):
+    """도서 한 권이 있는 복제본 SQLite 파일 (주 DB에는 없음)"""
+    url = sqlite_url(tmp_path / "replica.db")
+    engine = await create_schema(url)
+    async with engine.begin() as conn:
+        await conn.execute(Book.__table__.insert().values(id=new_id(), title="복제본 책", author="저자"))
+    await engine.dispose()
+    return url
+
+
+@pytest_asyncio.fixture
+async def make_router():
+    routers = []
+
+    def factory(urls):
+        router = ReplicaRouter(urls, health_check_seconds=60, max_lag_seconds=5)
+        routers.append(router)
+        return router
+
+    yield factory
+    for router in routers:
+        await router.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_healthy_replica(replica_url, make_router):
+    router = make_router([replica_url])
+
+    async with await router.open_session() as db:
+        assert db.bind is router.replicas[0].engine
+        assert (await db.execute(select(Book.title))).scalars().all() == ["복제본 책"]
+
+    stats = router.stats()
+    assert stats[0]["healthy"] is True
+    assert stats[0]["lag_seconds"] == 0.0
+    assert stats[0]["sessions"] == 1
+    assert stats[0]["checked_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_is_marked_down_and_falls_back_to_primary(tmp_path, replica_url, make_router):
+    missing = sqlite_url(tmp_path / "missing-dir" / "replica.db")
+    router = make_router([missing, replica_url])
+
+    await router.check_health()
+    stats = router.stats()
+    assert stats[0]["healthy"] is False
+    assert stats[0]["last_error"]
+    assert stats[1]["healthy"] is True
+
+    # 정상 복제본만 골라 라운드 로빈
+    for _ in range(3):
+        async with await router.open_session() as db:
+            assert db.bind is router.replicas[1].engine
+
+    # 정상 복제본이 없으면 주 DB로
+    router.replicas[1].mark_down("테스트")
+    async with await router.open_session() as db:
+        assert db.bind is async_engine
+
+
+@pytest.mark.asyncio
+async def test_connection_failure_on_open_marks_replica_down(tmp_path, replica_url, make_router):
+    missing = sqlite_url(tmp_path / "missing-dir" / "replica.db")
+    router = make_router([missing, replica_url])
+    await router.check_health()
+    # 상태 확인 뒤 장애가 난 상황: 정상으로 표시돼 있어도 연결 실패 시 다음 복제본으로
+    router.replicas[0].healthy = True
+
+    async with await router.open_session() as db:
+        assert db.bind is router.replicas[1].engine
+
+    assert router.stats()[0]["healthy"] is False
+
+
+@pytest.mark.asyncio
+async def test_recent_writer_reads_from_primary(replica_url, make_router):
+    router = make_router([replica_url])
+
+    token = _read_consistency.set(ReadConsistency(prefer_primary=True))
+    try:
+        async with await router.open_session() as db:
+            assert db.bind is async_engine
+    finally:
+        _read_consistency.reset(token)
+
+    assert router.stats()[0]["sessions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_no_replicas_uses_primary(make_router):
+    router = make_router([])
+
+    async with await router.open_session() as db:
+        assert db.bind is async_engine
+    assert router.stats() == []
+
+
+@pytest.mark.asyncio
+async def test_committed_write_is_recorded_for_read_your_writes(async_db):
+    consistency = ReadConsistency(prefer_primary=False)
+    token = _read_consistency.set(consistency)
+    try:
+        await async_db.execute(select(Book.id))
+        await async_db.commit()
+        assert consistency.wrote is False
+
+        async_db.add(Book(title="새 책", author="저자"))
+        await async_db.rollback()
+        assert consistency.wrote is False
+
+        async_db.add(Book(title="새 책", author="저자"))
+        await async_db.commit()
+        assert consistency.wrote is True
+    finally:
+        _read_consistency.reset(token)
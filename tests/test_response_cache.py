@@ -0,0 +1,223 @@
+"""응답 캐시(ResponseCache + MemoryCacheBackend) 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.core.response_cache import MemoryCacheBackend, ResponseCache, response_cache
+from app.models.book import Book
+from app.services.book_service import BOOKS_ALL_TAG, BOOKS_SEARCH_TAG, theme_tag
+
+
+def make_cache(**kwargs):
+    return ResponseCache(MemoryCacheBackend(max_size=100), **kwargs)
+
+
+class Counter:
+    """호출 횟수를 세는 compute 함수"""
+
+    def __init__(self, value: bytes = b"body", delay: float = 0.0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+def test_build_key_ignores_parameter_order_and_none():
+    first = ResponseCache.build_key("books.list", {"theme": "work", "limit": 20, "cursor": None})
+    second = ResponseCache.build_key("books.list", {"limit": 20, "theme": "work"})
+
+    assert first == second
+    assert first.startswith("books.list:")
+    assert first != ResponseCache.build_key("books.list", {"limit": 20, "theme": "growth"})
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_stores_and_hits():
+    cache = make_cache()
+    compute = Counter()
+
+    assert await cache.get_or_compute("k", 60, ["t"], compute) == (b"body", False)
+    assert await cache.get_or_compute("k", 60, ["t"], compute) == (b"body", True)
+    assert compute.calls == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_compute_once():
+    cache = make_cache()
+    compute = Counter(delay=0.05)
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", 60, ["t"], compute) for _ in range(10)))
+
+    assert compute.calls == 1
+    assert {body for body, _ in results} == {b"body"}
+    assert cache.stats()["coalesced"] == 9
+
+
+@pytest.mark.asyncio
+async def test_compute_error_is_shared_and_not_cached():
+    cache = make_cache()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(
+        *(cache.get_or_compute("k", 60, ["t"], fail) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    compute = Counter()
+    assert await cache.get_or_compute("k", 60, ["t"], compute) == (b"body", False)
+
+
+@pytest.mark.asyncio
+async def test_locked_key_falls_back_to_compute_without_storing():
+    cache = make_cache(lock_timeout=0.1, poll_interval=0.02)
+    # 다른 워커가 락을 잡고 응답하지 않는 상황
+    assert await cache.backend.acquire_lock("k", 60)
+    compute = Counter()
+
+    assert await cache.get_or_compute("k", 60, ["t"], compute) == (b"body", False)
+    assert await cache.backend.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_removes_only_tagged_entries():
+    cache = make_cache()
+    await cache.get_or_compute("work", 60, ["books:all", "books:theme:work"], Counter(b"w"))
+    await cache.get_or_compute("growth", 60, ["books:all", "books:theme:growth"], Counter(b"g"))
+
+    await cache.invalidate_tags(["books:theme:work"])
+    assert await cache.backend.get("work") is None
+    assert await cache.backend.get("growth") == b"g"
+
+    cache.invalidate_tags_sync(["books:all"])
+    assert await cache.backend.get("growth") is None
+    # 태그별로 지운 키 수의 합 (books:theme:work 1개 + books:all 2개)
+    assert cache.stats()["invalidations"] == 3
+
+
+def test_invalidate_tags_sync_outside_event_loop():
+    cache = make_cache()
+    asyncio.run(cache.get_or_compute("k", 60, ["t"], Counter()))
+
+    cache.invalidate_tags_sync(["t"])
+
+    assert asyncio.run(cache.backend.get("k")) is None
+
+
+def test_invalidation_failure_is_counted_not_raised():
+    class BrokenBackend(MemoryCacheBackend):
+        def invalidate_tags_sync(self, tags):
+            raise ConnectionError("redis down")
+
+    cache = ResponseCache(BrokenBackend(max_size=10))
+
+    cache.invalidate_tags_sync(["t"])
+
+    assert cache.stats()["invalidation_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry():
+    cache = make_cache()
+    await cache.get_or_compute("k", 1, ["t"], Counter())
+    assert await cache.backend.get("k") == b"body"
+
+    await asyncio.sleep(1.05)
+    assert await cache.backend.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_book_commit_invalidates_before_returning(async_db, monkeypatch):
+    monkeypatch.setattr(response_cache, "backend", MemoryCacheBackend(max_size=100))
+    tags = {
+        "all": [BOOKS_ALL_TAG],
+        "search": [BOOKS_SEARCH_TAG],
+        "work": [theme_tag("work")],
+        "growth": [theme_tag("growth")],
+    }
+    for key, key_tags in tags.items():
+        await response_cache.get_or_compute(key, 60, key_tags, Counter())
+
+    async_db.add(Book(title="새 책", author="저자", theme="work"))
+    await async_db.commit()
+
+    # after_commit에서 바로 지워져 커밋 직후의 조회도 이전 값을 받지 않는다
+    assert await response_cache.backend.get("all") is None
+    assert await response_cache.backend.get("search") is None
+    assert await response_cache.backend.get("work") is None
+    assert await response_cache.backend.get("growth") == b"body"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_waiters():
+    cache = make_cache()
+    slow = Counter(b"leader", delay=10)
+    leader = asyncio.create_task(cache.get_or_compute("k", 60, ["t"], slow))
+    await asyncio.sleep(0.01)
+
+    compute = Counter(b"waiter", delay=0.05)
+    waiters = [asyncio.create_task(cache.get_or_compute("k", 60, ["t"], compute)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+
+    # 계산하던 요청의 클라이언트가 연결을 끊음
+    leader.cancel()
+    results = await asyncio.gather(*waiters)
+
+    # 기다리던 요청 중 하나가 이어서 계산하고 나머지는 그 결과를 함께 사용
+    assert compute.calls == 1
+    assert sorted(hit for _, hit in results) == [False, True, True]
+    assert {body for body, _ in results} == {b"waiter"}
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await cache.backend.get("k") == b"waiter"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_leader():
+    cache = make_cache()
+    compute = Counter(delay=0.05)
+    leader = asyncio.create_task(cache.get_or_compute("k", 60, ["t"], compute))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(cache.get_or_compute("k", 60, ["t"], compute))
+    await asyncio.sleep(0.01)
+
+    waiter.cancel()
+
+    assert await leader == (b"body", False)
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_compute_skips_stale_fill():
+    cache = make_cache()
+
+    async def compute_then_commit():
+        # 계산이 이전 스냅샷을 읽는 동안 다른 요청의 커밋이 태그를 무효화
+        body = b"before-write"
+        cache.invalidate_tags_sync(["books:theme:work"])
+        return body
+
+    assert await cache.get_or_compute("k", 60, ["books:all", "books:theme:work"], compute_then_commit) == (
+        b"before-write",
+        False,
+    )
+    assert await cache.backend.get("k") is None
+    assert cache.stats()["stale_fills"] == 1
+
+    # 무효화 이후 시작한 계산은 정상적으로 저장
+    assert await cache.get_or_compute("k", 60, ["books:all", "books:theme:work"], Counter(b"after")) == (
+        b"after",
+        False,
+    )
+    assert await cache.backend.get("k") == b"after"
@@ -0,0 +1,129 @@
+"""리뷰 평점 샤드 집계(증분·rollup·reconcile) 테스트 (임시 SQLite)"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.models.book import Book
+from app.models.review import BookRatingShard
+from app.models.user import User
+from app.schemas.review import ReviewCreate, ReviewUpdate
+from app.services.review_service import ReviewService
+
+
+@pytest_asyncio.fixture
+async def book(async_db, monkeypatch):
+    monkeypatch.setattr(settings, "REVIEW_RATING_SHARDS", 4)
+    book = Book(title="평점 테스트", author="저자")
+    async_db.add(book)
+    await async_db.commit()
+    return book
+
+
+@pytest_asyncio.fixture
+async def users(async_db):
+    users = [User(email=f"reader{i}@example.com", hashed_password="x") for i in range(6)]
+    async_db.add_all(users)
+    await async_db.commit()
+    return users
+
+
+async def totals(db, book_id):
+    """(리뷰 기준 정확한 값, 샤드 합계)"""
+    exact = (await ReviewService._review_totals(db, [book_id])).get(book_id, (0, 0))
+    sharded = (await ReviewService._shard_totals(db, [book_id])).get(book_id, (0, 0))
+    return exact, sharded
+
+
+@pytest.mark.asyncio
+async def test_create_update_delete_apply_deltas(async_db, book, users):
+    reviews = [
+        await ReviewService.create_review(async_db, book.id, user, ReviewCreate(rating=rating))
+        for user, rating in zip(users, [5, 4, 3, 5, 1])
+    ]
+    assert await totals(async_db, book.id) == ((18, 5), (18, 5))
+    summary = await ReviewService.rating_summary(async_db, book.id)
+    assert (summary.rating, summary.review_count) == (3.6, 5)
+
+    # 평점 변경은 개수 그대로 차이만 반영, 내용만 바꾸면 증분 없음
+    await ReviewService.update_review(async_db, reviews[4].id, users[4], ReviewUpdate(rating=4))
+    await ReviewService.update_review(async_db, reviews[0].id, users[0], ReviewUpdate(content="다시 읽음"))
+    assert await totals(async_db, book.id) == ((21, 5), (21, 5))
+
+    await ReviewService.delete_review(async_db, reviews[1].id, users[1])
+    assert await totals(async_db, book.id) == ((17, 4), (17, 4))
+
+    # 증분이 여러 샤드 행에 나뉘어도 합계는 같다
+    shard_rows = (await async_db.execute(
+        select(BookRatingShard.shard).where(BookRatingShard.book_id == book.id)
+    )).scalars().all()
+    assert set(shard_rows) <= set(range(settings.REVIEW_RATING_SHARDS))
+
+
+@pytest.mark.asyncio
+async def test_duplicate_review_and_foreign_edit_are_rejected(async_db, book, users):
+    book_id = book.id
+    review = await ReviewService.create_review(async_db, book_id, users[0], ReviewCreate(rating=5))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await ReviewService.update_review(async_db, review.id, users[1], ReviewUpdate(rating=1))
+    assert exc_info.value.status_code == 403
+
+    # 409는 세션을 롤백하므로 마지막에 확인 (이후 ORM 객체는 만료됨)
+    with pytest.raises(HTTPException) as exc_info:
+        await ReviewService.create_review(async_db, book_id, users[0], ReviewCreate(rating=1))
+    assert exc_info.value.status_code == 409
+
+    assert await totals(async_db, book_id) == ((5, 1), (5, 1))
+
+
+@pytest.mark.asyncio
+async def test_rollup_syncs_book_columns(async_db, book, users):
+    since = datetime.utcnow() - timedelta(seconds=1)
+    for user, rating in zip(users[:3], [5, 4, 4]):
+        await ReviewService.create_review(async_db, book.id, user, ReviewCreate(rating=rating))
+
+    assert await ReviewService.rollup_ratings(async_db, since) == 1
+    await async_db.refresh(book)
+    assert (book.rating, book.review_count) == (4.33, 3)
+
+    # 값이 같으면 다시 갱신하지 않음
+    assert await ReviewService.rollup_ratings(async_db, since) == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_drifted_shards(async_db, book, users):
+    for user, rating in zip(users[:4], [5, 4, 3, 2]):
+        await ReviewService.create_review(async_db, book.id, user, ReviewCreate(rating=rating))
+    untouched = Book(title="리뷰 없는 책", author="저자", rating=4.5)
+    async_db.add(untouched)
+    # 증분 누락을 흉내 낸 집계 어긋남
+    await async_db.execute(
+        update(BookRatingShard)
+        .where(BookRatingShard.book_id == book.id)
+        .values(rating_sum=BookRatingShard.rating_sum + 7, rating_count=BookRatingShard.rating_count + 1)
+    )
+    await async_db.commit()
+
+    report = await ReviewService.reconcile_ratings(async_db, batch_size=1)
+
+    assert (report.books_checked, report.books_repaired, report.books_synced) == (2, 1, 1)
+    assert await totals(async_db, book.id) == ((14, 4), (14, 4))
+    shard_rows = (await async_db.execute(
+        select(BookRatingShard.shard).where(BookRatingShard.book_id == book.id)
+    )).scalars().all()
+    assert shard_rows == [0]
+    await async_db.refresh(book)
+    await async_db.refresh(untouched)
+    assert (book.rating, book.review_count) == (3.5, 4)
+    # 리뷰도 샤드도 없는 도서는 적재 시 평점 유지
+    assert untouched.rating == 4.5
+
+    # 복구 후 증분은 교체된 샤드에 이어서 더해진다
+    await ReviewService.create_review(async_db, book.id, users[4], ReviewCreate(rating=5))
+    assert await totals(async_db, book.id) == ((19, 5), (19, 5))
+    assert (await ReviewService.reconcile_ratings(async_db)).books_repaired == 0
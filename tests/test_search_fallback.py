@@ -0,0 +1,77 @@
+"""한국어 n-gram 토큰화와 인메모리 역색인(PostgreSQL이 아닌 환경의 검색) 테스트"""
+
+import pytest
+
+from app.models.book import Book
+from app.services.search_index import InvertedIndex
+from app.services.search_service import SearchService
+from app.utils.text import tokenize
+
+
+def test_tokenize_korean_bigrams_and_lowercase_words():
+    assert tokenize("퇴근후힐링") == ["퇴근", "근후", "후힐", "힐링"]
+    assert tokenize("책 Deep Work 2판") == ["책", "deep", "work", "2", "판"]
+    assert tokenize(None) == []
+
+
+def test_index_requires_all_tokens_and_ranks_title_first():
+    index = InvertedIndex()
+    index.add("title", {"title": "힐링 소설", "author": "김작가"})
+    index.add("description", {"title": "여행 에세이", "description": "마음이 힐링되는 소설 같은 여행"})
+    index.add("partial", {"title": "힐링 가이드"})
+
+    ranked = index.search("힐링 소설")
+
+    assert [doc_id for doc_id, _ in ranked] == ["title", "description"]
+    assert ranked[0][1] > ranked[1][1]
+
+
+def test_index_matches_inflected_words():
+    index = InvertedIndex()
+    index.add("book", {"title": "퇴근 후에 마음이 힐링되는 소설"})
+
+    # 본문에 조사·어미가 붙어 있어도 검색어의 bigram이 모두 있으면 찾는다
+    assert [doc_id for doc_id, _ in index.search("힐링")] == ["book"]
+    assert [doc_id for doc_id, _ in index.search("퇴근")] == ["book"]
+    assert [doc_id for doc_id, _ in index.search("힐링 소설")] == ["book"]
+    # 검색어의 모든 토큰이 있어야 함 (AND)
+    assert index.search("힐링 에세이") == []
+
+
+def test_index_replace_remove_and_predicate():
+    index = InvertedIndex()
+    index.add("a", {"title": "습관의 힘"})
+    index.add("b", {"title": "습관 만들기"})
+
+    index.add("a", {"title": "시간 관리"})
+    assert [doc_id for doc_id, _ in index.search("습관")] == ["b"]
+
+    assert index.search("습관", predicate=lambda doc_id: doc_id != "b") == []
+
+    index.remove("b")
+    assert index.search("습관") == []
+    assert len(index) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_service_uses_fallback_index_and_rebuilds_on_commit(async_db):
+    # 색인은 프로세스 전역이므로 다른 테스트의 DB로 만든 색인을 쓰지 않도록 초기화
+    SearchService.mark_stale()
+    async_db.add_all([
+        Book(title="퇴근 후 힐링 소설", author="김작가", theme="healing", keywords="힐링, 소설"),
+        Book(title="일 잘하는 습관", author="이작가", theme="work", keywords="습관, 업무"),
+    ])
+    await async_db.commit()
+
+    results = await SearchService.search(async_db, "힐링 소설")
+    assert [book.title for book, _, _ in results] == ["퇴근 후 힐링 소설"]
+    assert results[0][2]["title"] == "퇴근 후 <mark>힐링</mark> <mark>소설</mark>"
+
+    assert await SearchService.search(async_db, "힐링", theme="work") == []
+
+    # 커밋된 도서 변경은 다음 검색에서 색인에 반영된다
+    async_db.add(Book(title="힐링 에세이", author="박작가", theme="work"))
+    await async_db.commit()
+
+    results = await SearchService.search(async_db, "힐링", theme="work")
+    assert [book.title for book, _, _ in results] == ["힐링 에세이"]
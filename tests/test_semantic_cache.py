@@ -0,0 +1,108 @@
+"""시맨틱 캐시(SemanticCache) 테스트: 임계값 판정, namespace, 만료, LRU 제거"""
+
+import math
+
+import pytest
+
+from app.services import semantic_cache
+from app.services.semantic_cache import SemanticCache
+
+DIM = 16
+
+
+def unit(index: int) -> list:
+    vector = [0.0] * DIM
+    vector[index] = 1.0
+    return vector
+
+
+def rotated(similarity: float, base: int = 0, towards: int = 1) -> list:
+    """unit(base)와의 코사인 유사도가 similarity인 단위 벡터"""
+    vector = [0.0] * DIM
+    vector[base] = similarity
+    vector[towards] = math.sqrt(1 - similarity ** 2)
+    return vector
+
+
+def make_cache(**kwargs) -> SemanticCache:
+    options = {"dim": DIM, "threshold": 0.9, "max_entries": 10, "ttl_seconds": 60}
+    options.update(kwargs)
+    return SemanticCache(**options)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(semantic_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_hit_above_threshold_and_miss_just_below():
+    cache = make_cache()
+    cache.put(unit(0), "추천 A")
+
+    value, similarity = cache.get(rotated(0.92))
+    assert value == "추천 A"
+    assert similarity == pytest.approx(0.92)
+
+    # LSH 후보에는 들어오지만 정확한 유사도가 임계값 미만이면 실패
+    query = rotated(0.89)
+    assert 0 in cache._candidates(None, cache._signatures(query))
+    assert cache.get(query) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_namespaces_are_isolated():
+    cache = make_cache()
+    cache.put(unit(0), "성장 5권", namespace=("growth", 5))
+
+    assert cache.get(unit(0), namespace=("growth", 3)) is None
+    assert cache.get(unit(0)) is None
+    assert cache.get(unit(0), namespace=("growth", 5)) == ("성장 5권", pytest.approx(1.0))
+
+
+def test_expired_entry_is_removed_on_lookup(clock):
+    cache = make_cache(ttl_seconds=30)
+    cache.put(unit(0), "추천 A")
+
+    clock[0] += 29
+    assert cache.get(unit(0)) is not None
+
+    clock[0] += 2
+    assert cache.get(unit(0)) is None
+    assert cache.expirations == 1
+    assert len(cache) == 0
+    assert cache._buckets == {}
+
+
+def test_lru_eviction_cleans_up_buckets():
+    cache = make_cache(max_entries=2)
+    cache.put(unit(0), "A")
+    cache.put(unit(1), "B")
+    # A를 최근에 사용했으므로 C를 넣으면 B가 밀려난다
+    assert cache.get(unit(0))[0] == "A"
+    cache.put(unit(2), "C")
+
+    assert cache.evictions == 1
+    assert [entry.value for entry in cache._entries.values()] == ["A", "C"]
+    assert cache.get(unit(1)) is None
+
+    # 남은 버킷은 살아 있는 항목만 가리키고, 빈 버킷은 남지 않는다
+    live_ids = set(cache._entries)
+    assert cache._buckets
+    assert all(bucket and bucket <= live_ids for bucket in cache._buckets.values())
+    expected_keys = {
+        (entry.namespace, table, signature)
+        for entry in cache._entries.values()
+        for table, signature in enumerate(entry.signatures)
+    }
+    assert set(cache._buckets) == expected_keys
+
+
+def test_zero_vector_and_dimension_mismatch():
+    cache = make_cache()
+    cache.put([0.0] * DIM, "저장 안 됨")
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        cache.get([1.0] * (DIM - 1))
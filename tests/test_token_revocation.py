@@ -0,0 +1,120 @@
+"""Refresh Token 회전·재사용 감지·워커 간 패밀리 폐기 테스트 (DB 저장소, 임시 SQLite)"""
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+
+from app.core.security import decode_token
+from app.models.user import User
+from app.services import auth_service, token_revocation
+from app.services.auth_service import AuthService
+from app.services.token_revocation import DatabaseRevocationBackend, TokenRevocationStore
+
+
+def make_store(sync_seconds: float = 60.0) -> TokenRevocationStore:
+    """워커 하나의 폐기 저장소 (같은 DB를 공유)"""
+    return TokenRevocationStore(
+        DatabaseRevocationBackend(),
+        capacity=1000,
+        error_rate=0.01,
+        sync_seconds=sync_seconds,
+        purge_seconds=3600,
+    )
+
+
+@pytest_asyncio.fixture
+async def user(session_factory, monkeypatch):
+    monkeypatch.setattr(token_revocation, "AsyncSessionLocal", session_factory)
+    async with session_factory() as db:
+        user = User(email="reader@example.com", hashed_password="x", name="독자")
+        db.add(user)
+        await db.commit()
+    return user
+
+
+def use_worker(monkeypatch, store: TokenRevocationStore) -> None:
+    """이후 요청을 처리하는 워커 지정"""
+    monkeypatch.setattr(auth_service, "revocation_store", store)
+
+
+async def refresh(session_factory, refresh_token: str) -> dict:
+    async with session_factory() as db:
+        return await AuthService.refresh_access_token(db, refresh_token)
+
+
+@pytest.mark.asyncio
+async def test_store_revoke_is_single_use_and_synced_to_other_workers(user):
+    worker_a, worker_b = make_store(sync_seconds=0), make_store(sync_seconds=0)
+
+    assert await worker_a.revoke("jti-1", expires_at=4102444800) is True
+    assert await worker_b.revoke("jti-1", expires_at=4102444800) is False
+
+    assert await worker_b.is_revoked("jti-1") is True
+    assert await worker_b.is_revoked("jti-2") is False
+    assert worker_b.stats()["sync_cursor"] > 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_token_within_family(session_factory, user, monkeypatch):
+    use_worker(monkeypatch, make_store())
+    first = AuthService.create_tokens(user)["refresh_token"]
+
+    second = (await refresh(session_factory, first))["refresh_token"]
+    third = (await refresh(session_factory, second))["refresh_token"]
+
+    first_payload, second_payload, third_payload = map(decode_token, (first, second, third))
+    assert first_payload["fid"] == second_payload["fid"] == third_payload["fid"]
+    assert len({first_payload["jti"], second_payload["jti"], third_payload["jti"]}) == 3
+
+
+@pytest.mark.asyncio
+async def test_reused_token_revokes_whole_family(session_factory, user, monkeypatch):
+    use_worker(monkeypatch, make_store())
+    stolen = AuthService.create_tokens(user)["refresh_token"]
+    latest = (await refresh(session_factory, stolen))["refresh_token"]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await refresh(session_factory, stolen)
+    assert exc_info.value.status_code == 401
+
+    # 재사용이 감지되면 정상 사용자가 가진 최신 토큰도 함께 막힌다
+    with pytest.raises(HTTPException):
+        await refresh(session_factory, latest)
+
+
+@pytest.mark.asyncio
+async def test_logout_on_other_worker_blocks_refresh_before_sync(session_factory, user, monkeypatch):
+    worker_a, worker_b = make_store(), make_store()
+    refresh_token = AuthService.create_tokens(user)["refresh_token"]
+
+    use_worker(monkeypatch, worker_b)
+    latest = (await refresh(session_factory, refresh_token))["refresh_token"]
+
+    use_worker(monkeypatch, worker_a)
+    await AuthService.logout(latest)
+
+    # worker_b의 블룸 필터는 아직 로그아웃을 모르지만(동기화 주기 60초) 패밀리는 저장소에서 확인
+    use_worker(monkeypatch, worker_b)
+    assert decode_token(latest)["fid"] not in worker_b._bloom
+    with pytest.raises(HTTPException) as exc_info:
+        await refresh(session_factory, latest)
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_reuse_detected_on_other_worker_blocks_latest_token(session_factory, user, monkeypatch):
+    worker_a, worker_b = make_store(), make_store()
+    stolen = AuthService.create_tokens(user)["refresh_token"]
+
+    use_worker(monkeypatch, worker_b)
+    latest = (await refresh(session_factory, stolen))["refresh_token"]
+    # 이후 요청이 worker_b의 동기화 주기 안에 들어오도록 최초 적재를 먼저 끝내 둔다
+    await worker_b.is_revoked("warm-up")
+
+    use_worker(monkeypatch, worker_a)
+    with pytest.raises(HTTPException):
+        await refresh(session_factory, stolen)
+
+    use_worker(monkeypatch, worker_b)
+    with pytest.raises(HTTPException):
+        await refresh(session_factory, latest)